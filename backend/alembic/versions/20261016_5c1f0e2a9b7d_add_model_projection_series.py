@@ -0,0 +1,40 @@
+"""Add model_projection_series for packed scenario projections
+
+Revision ID: 5c1f0e2a9b7d
+Revises:
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "5c1f0e2a9b7d"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "model_projection_series",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("startDate", sa.DateTime(), nullable=False),
+        sa.Column("months", sa.Integer(), nullable=False),
+        sa.Column("metrics", sa.String(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("bandMetrics", sa.String(), nullable=True),
+        sa.Column("bandPercentiles", sa.String(), nullable=True),
+        sa.Column("bands", sa.LargeBinary(), nullable=True),
+        sa.Column("scenarioId", sa.String(), nullable=True),
+        sa.Column("createdAt", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updatedAt", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["scenarioId"], ["model_scenarios.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("scenarioId"),
+    )
+    op.create_index(op.f("ix_model_projection_series_id"), "model_projection_series", ["id"])
+
+
+def downgrade():
+    op.drop_index(op.f("ix_model_projection_series_id"), table_name="model_projection_series")
+    op.drop_table("model_projection_series")
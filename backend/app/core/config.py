@@ -22,6 +22,55 @@ class Settings(BaseSettings):
     ALLOWED_ORIGINS: List[str] = ["*"]
     ALLOWED_HOSTS: List[str] = ["*"]
 
+    # Modeling settings - 0 workers runs simulations in the default thread executor
+    MODELING_PROCESS_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)
+    SCENARIO_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    SCENARIO_CACHE_MIN_TTL_SECONDS: int = 60
+    SCENARIO_SESSION_MAX_BYTES: int = 512 * 1024 * 1024
+    SCENARIO_SESSION_TTL_SECONDS: int = 900
+    # Index and sector ETFs whose correlation matrix drives the multi-factor market shock
+    MARKET_FACTOR_UNIVERSE: List[str] = ["SPY", "QQQ", "IWM", "XLK", "XLF", "XLV", "XLE", "XLY"]
+    FACTOR_MODEL_CACHE_MAX_BYTES: int = 1024 * 1024
+    FACTOR_MODEL_CACHE_TTL_SECONDS: int = 3600
+    SIMULATION_JOB_MAX_RUNNING: int = 2
+    SIMULATION_JOB_MAX_PENDING: int = 20
+    SIMULATION_JOB_RETENTION_SECONDS: int = 3600
+
+    # Market data settings - provider calls block, so they run in a bounded thread pool
+    MARKET_DATA_FETCH_WORKERS: int = 8
+    MARKET_DATA_FETCH_TIMEOUT_SECONDS: float = 15.0
+    MARKET_DATA_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # Upstream request gateway: token bucket, concurrency cap, retries with jittered
+    # exponential backoff, and a circuit opened after consecutive failures
+    MARKET_DATA_RATE_LIMIT_PER_SECOND: float = 5.0
+    MARKET_DATA_RATE_BURST: int = 10
+    MARKET_DATA_MAX_CONCURRENT_REQUESTS: int = 4
+    MARKET_DATA_RETRIES: int = 3
+    MARKET_DATA_RETRY_BACKOFF_SECONDS: float = 0.5
+    MARKET_DATA_RETRY_MAX_BACKOFF_SECONDS: float = 8.0
+    MARKET_DATA_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    MARKET_DATA_CIRCUIT_RESET_SECONDS: float = 60.0
+    # Indicators are served stale up to this long while they reload
+    MARKET_DATA_MAX_STALE_SECONDS: int = 24 * 3600
+    # Cross-worker cache tier: sqlite:///<file>, redis://host:port/db or empty to disable
+    MARKET_DATA_SHARED_CACHE_URL: str = "sqlite:///data/market_cache.db"
+    MARKET_DATA_SHARED_LEASE_SECONDS: float = 20.0
+    # Upstream fallbacks are shared this long so other workers do not each wait on a failing provider
+    MARKET_DATA_SHARED_FALLBACK_SECONDS: float = 15.0
+    # Background refresher: reload entries LEAD (+ up to JITTER) seconds before expiry
+    MARKET_DATA_REFRESH_ENABLED: bool = True
+    MARKET_DATA_REFRESH_INTERVAL_SECONDS: float = 15.0
+    MARKET_DATA_REFRESH_LEAD_SECONDS: float = 60.0
+    MARKET_DATA_REFRESH_JITTER_SECONDS: float = 30.0
+    MARKET_DATA_REFRESH_BACKOFF_SECONDS: float = 30.0
+    MARKET_DATA_REFRESH_MAX_BACKOFF_SECONDS: float = 900.0
+    # Directory of the on-disk daily close store; empty disables it
+    MARKET_DATA_STORE_DIR: str = "data/market"
+    # "yfinance", "record" (yfinance, capturing to the recording dir) or "replay" (offline)
+    MARKET_DATA_PROVIDER: str = "yfinance"
+    MARKET_DATA_RECORDING_DIR: str = "data/recordings"
+    MARKET_DATA_REPLAY_LATENCY_MS: float = 0.0
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,28 @@
+from typing import Dict, List, Optional, Sequence
+
+from fastapi.responses import JSONResponse
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.elevia.columnar+json"
+LAYOUT_PATTERN = "^(rows|columnar)$"
+
+
+def wants_columnar(layout: Optional[str], accept: Optional[str]) -> bool:
+    """An explicit layout query parameter wins over the Accept header"""
+    if layout:
+        return layout == "columnar"
+    return bool(accept) and COLUMNAR_MEDIA_TYPE in accept
+
+
+def columnar_projections(projections: List[Dict], fields: Sequence[str], date_field: str = "date") -> Dict[str, list]:
+    """Pivot row-per-month projection dicts into one list per field"""
+    columns = {"dates": [projection[date_field] for projection in projections]}
+    for field in fields:
+        columns[field] = [projection[field] for projection in projections]
+    return columns
+
+
+def columnar_response(content, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    """
+    Serialize JSON-native content directly, skipping the per-row encoder walk
+    """
+    return JSONResponse(content=content, media_type=COLUMNAR_MEDIA_TYPE, headers=headers)
@@ -1,9 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.core.config import settings
 from app.routers import organizations, financial_metrics, data_sources, model_scenarios, reports, transactions, enhanced_models
+from app.services.market_data import shutdown_fetch_pool
+from app.services.market_data_refresh import market_data_refresher
+from app.services.scenario_workers import shutdown_process_pool
+from app.services.simulation_jobs import simulation_jobs
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.MARKET_DATA_REFRESH_ENABLED:
+        market_data_refresher.start()
+    yield
+    await market_data_refresher.stop()
+    await simulation_jobs.shutdown()
+    shutdown_process_pool()
+    shutdown_fetch_pool()
+
 
 app = FastAPI(
     title="Elevia Financial Intelligence API",
@@ -11,6 +29,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Security middleware
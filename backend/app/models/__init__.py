@@ -2,7 +2,7 @@
 from .user import User
 from .organization import Organization
 from .transaction import Transaction, TransactionDocument, DueDiligenceTask
-from .financial import FinancialMetric, ModelScenario, ModelProjection
+from .financial import FinancialMetric, ModelScenario, ModelProjection, ModelProjectionSeries
 from .data_source import DataSource, DataSyncLog
 from .report import Report
 
@@ -15,6 +15,7 @@ __all__ = [
     "FinancialMetric",
     "ModelScenario",
     "ModelProjection",
+    "ModelProjectionSeries",
     "DataSource",
     "DataSyncLog",
     "Report"
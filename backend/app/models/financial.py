@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Numeric, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, LargeBinary, Numeric, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -49,6 +49,9 @@ class ModelScenario(Base):
     # Relationships
     organization = relationship("Organization", back_populates="model_scenarios")
     projections = relationship("ModelProjection", back_populates="scenario", cascade="all, delete-orphan")
+    projection_series = relationship(
+        "ModelProjectionSeries", back_populates="scenario", uselist=False, cascade="all, delete-orphan"
+    )
 
 
 class ModelProjection(Base):
@@ -71,4 +74,29 @@ class ModelProjection(Base):
 
     __table_args__ = (
         UniqueConstraint("scenarioId", "date", name="unique_scenario_date"),
-    )
\ No newline at end of file
+    )
+
+
+class ModelProjectionSeries(Base):
+    """
+    Packed alternative to ModelProjection: one row per scenario holding every
+    projection series (and optional percentile bands) as little-endian float64
+    arrays in binary columns
+    """
+    __tablename__ = "model_projection_series"
+
+    id = Column(String, primary_key=True, index=True)
+    start_date = Column("startDate", DateTime, nullable=False)  # First projection month
+    months = Column(Integer, nullable=False)
+    metrics = Column(String, nullable=False)  # Comma-separated row order of data
+    data = Column(LargeBinary, nullable=False)  # metrics x months
+    band_metrics = Column("bandMetrics", String, nullable=True)
+    band_percentiles = Column("bandPercentiles", String, nullable=True)
+    bands = Column(LargeBinary, nullable=True)  # band metrics x percentiles x months
+
+    scenario_id = Column("scenarioId", String, ForeignKey("model_scenarios.id"), unique=True)
+    created_at = Column("createdAt", DateTime(timezone=True), server_default=func.now())
+    updated_at = Column("updatedAt", DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships
+    scenario = relationship("ModelScenario", back_populates="projection_series")
@@ -5,18 +5,132 @@ Provides sophisticated financial modeling capabilities with real market data int
 This demonstrates institutional-grade quantitative finance and risk management tools.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import List, Dict, Optional
+import asyncio
+import json
 import logging
 
-from ..services.enhanced_modeling import generate_bloomberg_enhanced_scenarios
+from ..core.database import get_db
+from ..core.layout import LAYOUT_PATTERN, columnar_projections, columnar_response, wants_columnar
+from ..services.enhanced_modeling import (
+    STREAM_CHUNK_MONTHS,
+    enhanced_modeling_engine,
+    generate_bloomberg_enhanced_scenarios,
+)
 from ..services.market_data import market_data_service
+from ..services.market_data_refresh import market_data_refresher
+from ..services.monte_carlo import (
+    DEFAULT_HORIZON_MONTHS,
+    DEFAULT_MAX_ADAPTIVE_PATHS,
+    DEFAULT_PATH_COUNT,
+    DEFAULT_TIME_BUDGET_SECONDS,
+    MAX_JOB_PATHS,
+    MAX_SEED,
+    MAX_SYNC_PATHS,
+    PROJECTION_METRICS,
+    simulation_options,
+)
+from ..services.scenario_cache import scenario_cache
+from ..services.scenario_persistence import (
+    STORAGE_PATTERN,
+    persist_scenarios,
+    persist_scenarios_in_new_session,
+    with_persistence
+)
+from ..services.scenario_sessions import scenario_sessions
+from ..services.sensitivity import validate_grid
+from ..services.simulation_jobs import SUCCEEDED, JobQueueFullError, SimulationJob, simulation_jobs
+from ..schemas.modeling import (
+    ScenarioSessionRequest,
+    ScenarioSessionUpdate,
+    SensitivityGridRequest,
+    SimulationRequest,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Lists "item=reason" for market data values served from defaults
+FALLBACKS_HEADER = "X-Market-Data-Fallbacks"
+
+def get_simulation_options(
+    paths: int = Query(DEFAULT_PATH_COUNT, ge=100, le=MAX_JOB_PATHS, description="Monte Carlo paths per scenario"),
+    horizon_months: int = Query(DEFAULT_HORIZON_MONTHS, ge=1, le=120, description="Projection horizon in months"),
+    volatility_model: str = Query("clustering", description="Volatility model: 'clustering' or 'garch'"),
+    garch_alpha: Optional[float] = Query(None, ge=0, lt=1, description="GARCH(1,1) shock weight"),
+    garch_beta: Optional[float] = Query(None, ge=0, lt=1, description="GARCH(1,1) persistence weight"),
+    garch_omega: Optional[float] = Query(None, gt=0, description="GARCH(1,1) variance intercept (monthly units)"),
+    sampler: str = Query("pseudo", description="Path sampler: 'pseudo', 'antithetic', 'sobol' or 'halton'"),
+    factor_model: str = Query("single", description="Market shock: 'single', 'pca' or 'cholesky' factor model"),
+    factor_universe: Optional[List[str]] = Query(None, description="Index/sector symbols for the factor model"),
+    factor_components: int = Query(3, ge=1, le=20, description="Principal components kept by the pca factor model"),
+    seed: Optional[int] = Query(None, ge=0, le=MAX_SEED, description="Request seed for reproducible results"),
+    common_random_numbers: bool = Query(False, description="Share one random stream across scenarios"),
+    covenant_ebitda_floor: float = Query(0.0, description="Monthly EBITDA covenant floor for breach probability"),
+    target_relative_error: Optional[float] = Query(
+        None, gt=0, lt=1, description="Adaptive mode: P50 terminal revenue precision, e.g. 0.005 for ±0.5%"
+    ),
+    target_confidence: float = Query(0.95, gt=0, lt=1, description="Confidence level of the precision target"),
+    max_paths: int = Query(
+        DEFAULT_MAX_ADAPTIVE_PATHS, ge=100, le=MAX_JOB_PATHS, description="Adaptive mode path cap"
+    ),
+    time_budget_seconds: float = Query(
+        DEFAULT_TIME_BUDGET_SECONDS, gt=0, le=120, description="Adaptive mode time budget per scenario"
+    )
+) -> Dict:
+    """Shared query parameters for scenario simulation endpoints"""
+    try:
+        garch_params = {"alpha": garch_alpha, "beta": garch_beta, "omega": garch_omega}
+        return simulation_options(
+            n_paths=paths,
+            horizon_months=horizon_months,
+            volatility_model=volatility_model,
+            volatility_params={k: v for k, v in garch_params.items() if v is not None},
+            sampler=sampler,
+            factor_model=factor_model,
+            factor_universe=factor_universe,
+            factor_components=factor_components,
+            seed=seed,
+            common_random_numbers=common_random_numbers,
+            covenant_ebitda_floor=covenant_ebitda_floor,
+            target_relative_error=target_relative_error,
+            target_confidence=target_confidence,
+            max_paths=max_paths,
+            time_budget_seconds=time_budget_seconds
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def get_sync_simulation_options(options: Dict = Depends(get_simulation_options)) -> Dict:
+    """
+    Simulation options for endpoints that simulate within the request
+
+    Runs above MAX_SYNC_PATHS are rejected with a pointer to the job queue, and
+    the adaptive path cap is lowered to the same limit.
+    """
+    if options["n_paths"] > MAX_SYNC_PATHS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Runs above {MAX_SYNC_PATHS:,} paths must be submitted as a background job (POST /jobs/scenarios)"
+        )
+    if options["target_relative_error"] is not None:
+        return {**options, "max_paths": min(options["max_paths"], MAX_SYNC_PATHS)}
+    return options
+
 @router.get("/enhanced-scenarios/")
-async def get_enhanced_scenarios() -> List[Dict]:
+async def get_enhanced_scenarios(
+    response: Response,
+    options: Dict = Depends(get_sync_simulation_options),
+    refresh: bool = Query(False, description="Bypass the scenario result cache"),
+    persist: bool = Query(False, description="Upsert the scenarios into model_scenarios/model_projections"),
+    storage: str = Query("rows", pattern=STORAGE_PATTERN, description="Persisted layout: 'rows' or 'packed' arrays"),
+    db: Session = Depends(get_db),
+    layout: Optional[str] = Query(None, pattern=LAYOUT_PATTERN, description="'rows' (default) or 'columnar'"),
+    accept: Optional[str] = Header(None)
+) -> List[Dict]:
     """
     Get sophisticated financial scenarios enhanced with Bloomberg-style market data
 
@@ -25,31 +139,358 @@ async def get_enhanced_scenarios() -> List[Dict]:
     - Market regime awareness (Bull/Bear/Sideways)
     - Correlation modeling with market indices
     - Risk-adjusted projections with Sharpe ratios
-    - Monte Carlo simulation with fat-tail distributions
+    - Vectorized multi-path Monte Carlo with fat-tail distributions
+    - P5/P25/P50/P75/P95 fan bands for revenue, EBITDA and cash flow
     - Advanced analytics (max drawdown, volatility clustering)
+    - Tail risk across all paths: VaR/CVaR of EBITDA and cash flow, covenant
+      breach probability, drawdown and Sharpe distributions
+    - Selectable volatility model (legacy clustering or GARCH(1,1))
+    - Variance reduction: antithetic pairs or scrambled Sobol/Halton sampling
+    - Optional multi-factor market shocks (PCA or Cholesky) from the correlation
+      matrix of an index/sector universe
+    - Adaptive path counts: with target_relative_error set, paths are simulated
+      in batches until P50 terminal revenue meets the precision target (or
+      max_paths / the time budget is reached); paths used and the achieved
+      error are reported in simulation.convergence
+    - Reproducible results: the seed used is returned in each scenario and
+      in the X-Simulation-Seed header
+    - Market data inputs that fell back to defaults (e.g. an identity
+      correlation matrix while the provider is down) are listed in
+      simulation.market_data_fallbacks and the X-Market-Data-Fallbacks header
+    - Results cached until the underlying market data refreshes
+    - At most MAX_SYNC_PATHS paths per scenario (also the adaptive path cap);
+      larger runs go through POST /jobs/scenarios
+    - Opt-in columnar projections ({"dates": [...], "revenue": [...], ...}) via
+      layout=columnar or an application/vnd.elevia.columnar+json Accept header
+    - persist=true bulk-upserts the scenarios and median projections (month-start
+      dates) for the organization, so /financial-metrics/scenarios can serve
+      them without re-simulating; storage=packed stores each scenario's series
+      and fan bands as float64 arrays in a single row instead of a row per month
     """
     try:
         logger.info("🚀 API: Generating Bloomberg-enhanced scenarios")
-        scenarios = await generate_bloomberg_enhanced_scenarios()
+        scenarios = await generate_bloomberg_enhanced_scenarios(options, use_cache=not refresh)
+        headers = {}
+        if scenarios:
+            simulation = scenarios[0]["simulation"]
+            headers = {
+                "X-Simulation-Seed": str(simulation["seed"]),
+                **_fallbacks_header(simulation.get("market_data_fallbacks", {}))
+            }
+        response.headers.update(headers)
+
+        if persist:
+            persistence = await asyncio.to_thread(persist_scenarios, db, scenarios, storage=storage)
+            scenarios = with_persistence(scenarios, persistence)
 
         logger.info(f"✅ API: Generated {len(scenarios)} enhanced scenarios with market data")
+
+        if wants_columnar(layout, accept):
+            columnar = [
+                {
+                    **{key: value for key, value in scenario.items() if key != "projections"},
+                    "layout": "columnar",
+                    "projections": columnar_projections(
+                        scenario["projections"], PROJECTION_METRICS + ("ebitdaMargin",)
+                    )
+                }
+                for scenario in scenarios
+            ]
+            return columnar_response(columnar, headers=headers)
+
         return scenarios
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ API: Error generating enhanced scenarios: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate enhanced scenarios: {str(e)}")
 
+def _format_stream_event(event: Dict, stream_format: str) -> str:
+    """Encode one stream event as an NDJSON line or a Server-Sent Event"""
+    data = json.dumps(event, default=str)
+    if stream_format == "sse":
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+@router.get("/enhanced-scenarios/stream")
+async def stream_enhanced_scenarios(
+    options: Dict = Depends(get_sync_simulation_options),
+    refresh: bool = Query(False, description="Bypass the scenario result cache"),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="Stream format: 'ndjson' or 'sse'"),
+    chunk_months: int = Query(STREAM_CHUNK_MONTHS, ge=1, le=120, description="Months per projections event")
+) -> StreamingResponse:
+    """
+    Stream enhanced scenarios as they are computed (NDJSON or Server-Sent Events)
+
+    Emits a meta event (seed, market context), then each scenario as soon as its
+    simulation finishes: a scenario header followed by month chunks of
+    projections and fan bands, and finally an end event. Errors after the
+    stream has started are reported as an error event.
+    """
+    logger.info(f"🚀 API: Streaming Bloomberg-enhanced scenarios ({format})")
+
+    async def event_stream():
+        try:
+            async for event in enhanced_modeling_engine.stream_market_aware_scenarios(
+                options=options, use_cache=not refresh, chunk_months=chunk_months
+            ):
+                yield _format_stream_event(event, format)
+        except Exception as e:
+            logger.error(f"❌ API: Error streaming enhanced scenarios: {e}")
+            yield _format_stream_event({"event": "error", "detail": str(e)}, format)
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(event_stream(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+@router.get("/enhanced-scenarios/cache")
+async def get_scenario_cache_stats() -> Dict:
+    """
+    Get scenario result cache statistics (entries, memory, hit/miss counters)
+    """
+    return scenario_cache.stats()
+
+def _request_simulation_options(request: SimulationRequest) -> Dict:
+    """
+    Simulation options from a JSON request body
+
+    Raises:
+        ValueError: On invalid options
+    """
+    garch_params = {"alpha": request.garch_alpha, "beta": request.garch_beta, "omega": request.garch_omega}
+    return simulation_options(
+        n_paths=request.paths,
+        horizon_months=request.horizon_months,
+        volatility_model=request.volatility_model,
+        volatility_params={k: v for k, v in garch_params.items() if v is not None},
+        sampler=request.sampler,
+        factor_model=request.factor_model,
+        factor_universe=request.factor_universe,
+        factor_components=request.factor_components,
+        seed=request.seed,
+        common_random_numbers=request.common_random_numbers,
+        covenant_ebitda_floor=request.covenant_ebitda_floor
+    )
+
+@router.post("/sensitivity-grid/")
+async def run_sensitivity_grid(request: SensitivityGridRequest) -> Dict:
+    """
+    Evaluate a sensitivity grid of scenario assumptions in one vectorized pass
+
+    The grid maps scenario parameters (revenue_growth, volatility_factor,
+    market_correlation, margin_improvement) to candidate values; all cells of
+    their cartesian product are simulated over shared random draws. Returns
+    grid-shaped matrices of terminal revenue, average EBITDA margin, Sharpe
+    ratio and max drawdown (medians across paths).
+    """
+    try:
+        options = _request_simulation_options(request)
+        return await enhanced_modeling_engine.run_sensitivity_grid(
+            request.scenario, request.grid, request.base_revenue, options
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ API: Error evaluating sensitivity grid: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to evaluate sensitivity grid: {str(e)}")
+
+@router.post("/scenario-sessions/")
+async def create_scenario_session(request: ScenarioSessionRequest) -> Dict:
+    """
+    Start an interactive what-if session for one scenario
+
+    The session keeps its random draws and intermediate path arrays so later
+    assumption changes only recompute the affected stages.
+    """
+    try:
+        options = _request_simulation_options(request)
+        return await enhanced_modeling_engine.create_scenario_session(
+            request.scenario, request.base_revenue, options
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ API: Error creating scenario session: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create scenario session: {str(e)}")
+
+@router.patch("/scenario-sessions/{session_id}")
+async def update_scenario_session(session_id: str, update: ScenarioSessionUpdate) -> Dict:
+    """
+    Change scenario assumptions and incrementally recompute the session
+
+    Changing margin_improvement only re-derives the financials; revenue_growth
+    or market_correlation rerun revenue and financials; volatility_factor reruns
+    every stage. The response lists the stages that were recomputed.
+    """
+    session = scenario_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Scenario session not found or expired")
+
+    try:
+        return await enhanced_modeling_engine.update_scenario_session(session, update.params)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ API: Error updating scenario session: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to update scenario session: {str(e)}")
+
+@router.delete("/scenario-sessions/{session_id}")
+async def delete_scenario_session(session_id: str) -> Dict:
+    """
+    End a scenario session and release its arrays
+    """
+    if scenario_sessions.get(session_id) is None:
+        raise HTTPException(status_code=404, detail="Scenario session not found or expired")
+
+    scenario_sessions.delete(session_id)
+    return {"session_id": session_id, "deleted": True}
+
+def _submit_job(kind: str, parameters: Dict, body) -> Dict:
+    """Queue a simulation job, mapping a full queue to 429"""
+    try:
+        return simulation_jobs.submit(kind, parameters, body).summary()
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+def _get_job(job_id: str) -> SimulationJob:
+    job = simulation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Simulation job not found or expired")
+    return job
+
+@router.post("/jobs/scenarios", status_code=202)
+async def submit_scenario_job(
+    options: Dict = Depends(get_simulation_options),
+    refresh: bool = Query(False, description="Bypass the scenario result cache"),
+    persist: bool = Query(False, description="Upsert the scenarios into model_scenarios/model_projections"),
+    storage: str = Query("rows", pattern=STORAGE_PATTERN, description="Persisted layout: 'rows' or 'packed' arrays")
+) -> Dict:
+    """
+    Submit enhanced scenario generation as a background job
+
+    Accepts the same options as GET /enhanced-scenarios/, with up to
+    MAX_JOB_PATHS paths per scenario. Poll
+    GET /jobs/{job_id} for status and progress, then fetch the scenarios from
+    GET /jobs/{job_id}/result.
+    """
+    async def body(job: SimulationJob):
+        scenarios = await generate_bloomberg_enhanced_scenarios(
+            options, use_cache=not refresh, progress=job.report_progress
+        )
+        if persist:
+            job.report_progress(1.0, "Persisting scenarios")
+            persistence = await asyncio.to_thread(persist_scenarios_in_new_session, scenarios, storage)
+            scenarios = with_persistence(scenarios, persistence)
+        return scenarios
+
+    return _submit_job("scenarios", {**options, "refresh": refresh, "persist": persist, "storage": storage}, body)
+
+@router.post("/jobs/sensitivity-grid", status_code=202)
+async def submit_sensitivity_grid_job(request: SensitivityGridRequest) -> Dict:
+    """
+    Submit a sensitivity grid evaluation as a background job
+    """
+    try:
+        options = _request_simulation_options(request)
+        validate_grid(request.grid)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def body(job: SimulationJob):
+        job.report_progress(0.0, "Evaluating sensitivity grid")
+        return await enhanced_modeling_engine.run_sensitivity_grid(
+            request.scenario, request.grid, request.base_revenue, options
+        )
+
+    return _submit_job("sensitivity_grid", request.model_dump(), body)
+
+@router.get("/jobs/")
+async def list_simulation_jobs() -> List[Dict]:
+    """
+    List retained simulation jobs, newest first
+    """
+    return [job.summary() for job in simulation_jobs.list()]
+
+@router.get("/jobs/{job_id}")
+async def get_simulation_job(job_id: str) -> Dict:
+    """
+    Get a simulation job's status, progress and retention deadline
+    """
+    return _get_job(job_id).summary()
+
+@router.get("/jobs/{job_id}/result")
+async def get_simulation_job_result(job_id: str):
+    """
+    Get the result of a finished simulation job
+
+    Returns 409 while the job is queued or running, or when it failed or was
+    cancelled (the detail carries the status and error).
+    """
+    job = _get_job(job_id)
+    if job.status != SUCCEEDED:
+        detail = f"Simulation job is {job.status}" + (f": {job.error}" if job.error else "")
+        raise HTTPException(status_code=409, detail=detail)
+    return job.result
+
+@router.delete("/jobs/{job_id}")
+async def cancel_simulation_job(job_id: str) -> Dict:
+    """
+    Cancel a queued or running simulation job
+
+    Simulations already running in a worker process finish in the background
+    and their results are discarded. The cancelled job is retained until it
+    expires.
+    """
+    _get_job(job_id)
+    job = await simulation_jobs.cancel(job_id)
+    return job.summary()
+
+@router.get("/market-data/cache")
+async def get_market_data_cache_stats() -> Dict:
+    """
+    Get market data cache statistics (entries, memory, hit/miss/coalesced/stale
+    counters) and the background refresher's counters
+    """
+    return {
+        **market_data_service.cache_stats(),
+        "refresher": market_data_refresher.stats(),
+        "upstream": market_data_service.upstream_stats()
+    }
+
+def _fallbacks_header(fallbacks: Dict) -> Dict[str, str]:
+    """
+    X-Market-Data-Fallbacks header naming the items served from defaults instead
+    of market data (grouped fallbacks are listed as group.item=reason)
+    """
+    items = [
+        (f"{name}.{item}", reason)
+        for name, group in fallbacks.items() if isinstance(group, dict)
+        for item, reason in group.items()
+    ]
+    items += [(name, reason) for name, reason in fallbacks.items() if not isinstance(reason, dict)]
+    return {FALLBACKS_HEADER: ", ".join(f"{item}={reason}" for item, reason in items)} if items else {}
+
+def _report_fallbacks(response: Response, report: Dict):
+    """Name the items of an indicator report served from defaults in a response header"""
+    response.headers.update(_fallbacks_header(report["fallbacks"]))
+
 @router.get("/market-data/volatility")
-async def get_market_volatility(symbols: str = "SPY,QQQ,IWM") -> Dict[str, float]:
+async def get_market_volatility(response: Response, symbols: str = "SPY,QQQ,IWM") -> Dict[str, float]:
     """
     Get real-time market volatility for specified symbols
     Bloomberg equivalent: RVOL function
+
+    Symbols reported at the 20% default are listed in X-Market-Data-Fallbacks.
     """
     try:
         symbol_list = [s.strip().upper() for s in symbols.split(",")]
 
-        async with market_data_service:
-            volatilities = await market_data_service.get_market_volatility(symbol_list)
+        report = await market_data_service.get_market_volatility_report(symbol_list)
+        _report_fallbacks(response, report)
+        volatilities = report["value"]
 
         logger.info(f"✅ API: Retrieved volatility for {len(symbol_list)} symbols")
         return volatilities
@@ -59,14 +500,15 @@ async def get_market_volatility(symbols: str = "SPY,QQQ,IWM") -> Dict[str, float
         raise HTTPException(status_code=500, detail=f"Failed to fetch volatility: {str(e)}")
 
 @router.get("/market-data/regime")
-async def get_market_regime() -> Dict:
+async def get_market_regime(response: Response) -> Dict:
     """
     Get current market regime analysis
     Bloomberg equivalent: Market regime indicators
     """
     try:
-        async with market_data_service:
-            regime = await market_data_service.get_market_regime()
+        report = await market_data_service.get_market_regime_report()
+        _report_fallbacks(response, report)
+        regime = report["value"]
 
         logger.info(f"✅ API: Current market regime: {regime['regime']}")
         return regime
@@ -76,31 +518,33 @@ async def get_market_regime() -> Dict:
         raise HTTPException(status_code=500, detail=f"Failed to analyze market regime: {str(e)}")
 
 @router.get("/market-data/risk-free-rate")
-async def get_risk_free_rate() -> Dict[str, float]:
+async def get_risk_free_rate(response: Response) -> Dict[str, float]:
     """
     Get current risk-free rate (10-year Treasury yield)
     Bloomberg equivalent: USGG10YR
     """
     try:
-        async with market_data_service:
-            rate = await market_data_service.get_risk_free_rate()
+        report = await market_data_service.get_risk_free_rate_report()
+        _report_fallbacks(response, report)
+        rate = report["value"]
 
         logger.info(f"✅ API: Risk-free rate: {rate:.2%}")
-        return {"risk_free_rate": rate, "source": "10Y_Treasury"}
+        return {"risk_free_rate": rate, "source": "default" if report["fallbacks"] else "10Y_Treasury"}
 
     except Exception as e:
         logger.error(f"❌ API: Error fetching risk-free rate: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch risk-free rate: {str(e)}")
 
 @router.get("/market-data/sector-performance")
-async def get_sector_performance() -> Dict[str, float]:
+async def get_sector_performance(response: Response) -> Dict[str, float]:
     """
     Get sector performance analysis
     Bloomberg equivalent: Sector rotation analysis
     """
     try:
-        async with market_data_service:
-            performance = await market_data_service.get_sector_performance()
+        report = await market_data_service.get_sector_performance_report()
+        _report_fallbacks(response, report)
+        performance = report["value"]
 
         logger.info(f"✅ API: Retrieved performance for {len(performance)} sectors")
         return performance
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import datetime, date
 
 from app.core.database import get_db
+from app.core.layout import LAYOUT_PATTERN, columnar_response, wants_columnar
 from app.models.organization import Organization
 from app.models.financial import FinancialMetric, ModelScenario
+from app.services.scenario_persistence import STORAGE_PATTERN, unpack_projection_series
 from app.schemas.financial import (
     FinancialMetricsResponse,
     FinancialMetricResponse,
@@ -83,9 +85,30 @@ async def get_financial_metrics(
     )
 
 
+PROJECTION_COLUMNS = {
+    'revenue': 'revenue',
+    'cogs': 'cogs',
+    'grossProfit': 'gross_profit',
+    'opex': 'opex',
+    'ebitda': 'ebitda',
+    'netIncome': 'net_income',
+    'cashFlow': 'cash_flow'
+}
+
+
 @router.get("/scenarios", response_model=List[ModelScenarioResponse])
-async def get_model_scenarios(db: Session = Depends(get_db)):
-    """Get model scenarios with projections"""
+async def get_model_scenarios(
+    db: Session = Depends(get_db),
+    layout: Optional[str] = Query(None, pattern=LAYOUT_PATTERN, description="'rows' (default) or 'columnar'"),
+    storage: str = Query("rows", pattern=STORAGE_PATTERN, description="Read 'rows' or 'packed' persisted projections"),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Get model scenarios with projections (row-per-month or columnar layout)
+
+    storage=packed reads scenarios persisted as packed arrays (falling back to
+    their projection rows); the default never touches model_projection_series.
+    """
 
     # Get the organization
     org = db.query(Organization).first()
@@ -93,9 +116,13 @@ async def get_model_scenarios(db: Session = Depends(get_db)):
         return []
 
     # Get scenarios with projections
+    packed = storage == "packed"
+    loads = [joinedload(ModelScenario.projections)]
+    if packed:
+        loads.append(joinedload(ModelScenario.projection_series))
     scenarios = db.query(ModelScenario)\
         .filter(ModelScenario.organization_id == org.id)\
-        .options(joinedload(ModelScenario.projections))\
+        .options(*loads)\
         .all()
 
     # Sort scenarios with base case first
@@ -105,23 +132,29 @@ async def get_model_scenarios(db: Session = Depends(get_db)):
 
     scenarios.sort(key=scenario_sort_key)
 
+    if wants_columnar(layout, accept):
+        return columnar_response([_columnar_scenario(scenario, packed) for scenario in scenarios])
+
     # Convert to response format
     converted_scenarios = []
     for scenario in scenarios:
         # Convert projections
-        converted_projections = []
-        for projection in sorted(scenario.projections, key=lambda p: p.date):
-            converted_projections.append({
-                'id': projection.id,
-                'date': projection.date,
-                'revenue': float(projection.revenue),
-                'cogs': float(projection.cogs),
-                'grossProfit': float(projection.gross_profit),
-                'opex': float(projection.opex),
-                'ebitda': float(projection.ebitda),
-                'netIncome': float(projection.net_income),
-                'cashFlow': float(projection.cash_flow)
-            })
+        if packed and scenario.projection_series is not None:
+            converted_projections = _packed_projection_rows(scenario)
+        else:
+            converted_projections = []
+            for projection in sorted(scenario.projections, key=lambda p: p.date):
+                converted_projections.append({
+                    'id': projection.id,
+                    'date': projection.date,
+                    'revenue': float(projection.revenue),
+                    'cogs': float(projection.cogs),
+                    'grossProfit': float(projection.gross_profit),
+                    'opex': float(projection.opex),
+                    'ebitda': float(projection.ebitda),
+                    'netIncome': float(projection.net_income),
+                    'cashFlow': float(projection.cash_flow)
+                })
 
         converted_scenarios.append(ModelScenarioResponse(
             id=scenario.id,
@@ -135,4 +168,59 @@ async def get_model_scenarios(db: Session = Depends(get_db)):
             projections=converted_projections
         ))
 
-    return converted_scenarios
\ No newline at end of file
+    return converted_scenarios
+
+
+def _packed_dates(arrays: dict) -> List[datetime]:
+    return arrays['dates'].astype('datetime64[s]').tolist()
+
+
+def _packed_projection_rows(scenario: ModelScenario) -> List[dict]:
+    """Row-per-month projections of a scenario stored as packed arrays"""
+    arrays = unpack_projection_series(scenario.projection_series)
+    columns = {field: arrays[field].tolist() for field in PROJECTION_COLUMNS}
+    return [
+        {
+            'id': f"{scenario.id}-{month_start:%Y-%m}",
+            'date': month_start,
+            **{field: values[month] for field, values in columns.items()}
+        }
+        for month, month_start in enumerate(_packed_dates(arrays))
+    ]
+
+
+def _columnar_scenario(scenario: ModelScenario, packed: bool = False) -> dict:
+    """Scenario with projections pivoted into one list per field"""
+    bands = None
+    if packed and scenario.projection_series is not None:
+        # Packed series are already columnar; fan bands come along when stored
+        arrays = unpack_projection_series(scenario.projection_series)
+        columns = {'dates': [month_start.isoformat() for month_start in _packed_dates(arrays)]}
+        for field in PROJECTION_COLUMNS:
+            columns[field] = arrays[field].tolist()
+        bands = {
+            metric: {label: values.tolist() for label, values in metric_bands.items()}
+            for metric, metric_bands in arrays['bands'].items()
+        }
+    else:
+        projections = sorted(scenario.projections, key=lambda p: p.date)
+
+        columns = {'dates': [projection.date.isoformat() for projection in projections]}
+        for field, attribute in PROJECTION_COLUMNS.items():
+            columns[field] = [float(getattr(projection, attribute)) for projection in projections]
+
+    columnar = {
+        'id': scenario.id,
+        'name': scenario.name,
+        'type': scenario.type,
+        'description': scenario.description,
+        'revenueGrowth': float(scenario.revenue_growth),
+        'marginImprovement': float(scenario.margin_improvement),
+        'workingCapitalDays': scenario.working_capital_days,
+        'capexAsPercentRevenue': float(scenario.capex_as_percent_revenue),
+        'layout': 'columnar',
+        'projections': columns
+    }
+    if bands:
+        columnar['bands'] = bands
+    return columnar
@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.layout import LAYOUT_PATTERN
 from app.routers.financial_metrics import get_model_scenarios as get_scenarios
 from app.schemas.financial import ModelScenarioResponse
+from app.services.scenario_persistence import STORAGE_PATTERN
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[ModelScenarioResponse])
-async def get_model_scenarios(db: Session = Depends(get_db)):
+async def get_model_scenarios(
+    db: Session = Depends(get_db),
+    layout: Optional[str] = Query(None, pattern=LAYOUT_PATTERN, description="'rows' (default) or 'columnar'"),
+    storage: str = Query("rows", pattern=STORAGE_PATTERN, description="Read 'rows' or 'packed' persisted projections"),
+    accept: Optional[str] = Header(None)
+):
     """Get model scenarios - delegates to financial metrics router"""
-    return await get_scenarios(db)
\ No newline at end of file
+    return await get_scenarios(db, layout=layout, storage=storage, accept=accept)
\ No newline at end of file
@@ -3,6 +3,7 @@ from .financial import FinancialMetricResponse, ModelScenarioResponse, Financial
 from .data_source import DataSourceResponse, DataSourceSummary
 from .report import ReportResponse, ReportSummary
 from .transaction import TransactionResponse, TransactionDocumentResponse, DueDiligenceTaskResponse
+from .modeling import SimulationRequest, SensitivityGridRequest, ScenarioSessionRequest, ScenarioSessionUpdate
 
 __all__ = [
     "OrganizationResponse",
@@ -16,4 +17,8 @@ __all__ = [
     "TransactionResponse",
     "TransactionDocumentResponse",
     "DueDiligenceTaskResponse",
+    "SimulationRequest",
+    "SensitivityGridRequest",
+    "ScenarioSessionRequest",
+    "ScenarioSessionUpdate",
 ]
\ No newline at end of file
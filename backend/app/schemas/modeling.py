@@ -0,0 +1,34 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from ..services.monte_carlo import MAX_SYNC_PATHS
+
+
+class SimulationRequest(BaseModel):
+    scenario: str = Field("base_case", pattern="^(base_case|bull_case|bear_case)$")
+    base_revenue: float = Field(2500000, gt=0)
+    paths: int = Field(2000, ge=100, le=MAX_SYNC_PATHS)
+    horizon_months: int = Field(36, ge=1, le=120)
+    volatility_model: str = "clustering"
+    garch_alpha: Optional[float] = Field(None, ge=0, lt=1)
+    garch_beta: Optional[float] = Field(None, ge=0, lt=1)
+    garch_omega: Optional[float] = Field(None, gt=0)
+    sampler: str = "pseudo"
+    factor_model: str = "single"
+    factor_universe: Optional[List[str]] = None
+    factor_components: int = Field(3, ge=1, le=20)
+    seed: Optional[int] = Field(None, ge=0)
+    common_random_numbers: bool = False
+    covenant_ebitda_floor: float = 0.0
+
+
+class SensitivityGridRequest(SimulationRequest):
+    grid: Dict[str, List[float]]
+
+
+class ScenarioSessionRequest(SimulationRequest):
+    paths: int = Field(10000, ge=100, le=MAX_SYNC_PATHS)
+
+
+class ScenarioSessionUpdate(BaseModel):
+    params: Dict[str, float]
@@ -0,0 +1,205 @@
+"""
+Bounded In-Memory Cache with LRU Eviction and Per-Key TTLs
+
+A small cache for computed results: entries expire individually, the least
+recently used entries are evicted once the memory budget is exceeded, and
+hit/miss/eviction counters are kept for monitoring endpoints.
+
+get_or_load adds single-flight loading for async callers: concurrent misses on
+the same key await one shared load instead of each hitting the source. With
+max_stale it also serves stale-while-revalidate: an expired entry is returned
+immediately while a single background load replaces it.
+"""
+
+import asyncio
+import logging
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a value by its pickled size"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class BoundedTTLCache:
+    """
+    LRU cache bounded by an approximate byte budget, with per-entry expiry
+    """
+
+    def __init__(self, name: str, max_bytes: int, default_ttl: float = 300):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()  # value, expires_at, size
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+        self._inflight: Dict[str, "asyncio.Task"] = {}
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() < entry[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a live entry (marking it most recently used) or default"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, expires_at, _ = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def expires_in(self, key: str) -> float:
+        """Seconds until an entry expires (0 when missing or expired)"""
+        entry = self._entries.get(key)
+        return max(0.0, entry[1] - time.monotonic()) if entry is not None else 0.0
+
+    def peek(self, key: str, max_stale: float = 0) -> Any:
+        """Entry value even if expired up to max_stale seconds ago (None otherwise), without counting"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[1] + max_stale:
+            return None
+        return entry[0]
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Tuple[Any, float]]], max_stale: float = 0
+    ) -> Any:
+        """
+        Return a live entry, or load it once however many callers miss concurrently
+
+        The load runs as its own task, so a cancelled caller does not cancel it
+        for the callers still waiting on it.
+
+        Args:
+            key: Cache key
+            loader: Coroutine factory returning the value and its TTL in seconds
+                (a TTL of 0 returns the value without caching it)
+            max_stale: Seconds past expiry an entry is still served while it is
+                reloaded in the background (0 waits for the load)
+        """
+        if max_stale > 0:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[1] <= now < entry[1] + max_stale:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._start_load(key, loader)
+                return entry[0]
+
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if key in self._inflight:
+            self.coalesced += 1
+        return await asyncio.shield(self._start_load(key, loader))
+
+    async def refresh(self, key: str, loader: Callable[[], Awaitable[Tuple[Any, float]]]) -> bool:
+        """
+        Reload an entry even if it is live, joining a load already in flight
+
+        Returns:
+            Whether the entry is live afterwards (False when the loader chose not to cache)
+        """
+        await asyncio.shield(self._start_load(key, loader))
+        return key in self
+
+    def _start_load(self, key: str, loader: Callable[[], Awaitable[Tuple[Any, float]]]) -> "asyncio.Task":
+        """The in-flight load of a key, starting one if there is none"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader))
+            task.add_done_callback(self._log_failed_load)
+            self._inflight[key] = task
+        return task
+
+    def _log_failed_load(self, task: "asyncio.Task"):
+        # Background loads may have nobody awaiting them
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"⚠️ {self.name} cache: load failed: {task.exception()!r}")
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Tuple[Any, float]]]) -> Any:
+        try:
+            value, ttl = await loader()
+            if ttl > 0:
+                self.set(key, value, ttl=ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, size: Optional[int] = None):
+        """Store a value, evicting least recently used entries to stay within budget"""
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            logger.warning(f"⚠️ {self.name} cache: entry of {size:,} bytes exceeds budget, not cached")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def delete(self, key: str):
+        """Remove an entry if present"""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: str):
+        _, _, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "coalesced": self.coalesced,
+            "stale_hits": self.stale_hits,
+            "inflight": len(self._inflight),
+        }
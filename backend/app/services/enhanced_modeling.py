@@ -9,26 +9,60 @@ Designed to demonstrate institutional-grade quantitative finance capabilities.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 
+from .convergence import simulate_until_converged
+from .factor_model import get_market_factors
 from .market_data import get_enhanced_scenario_parameters, market_data_service
+from .scenario_cache import scenario_cache, scenario_cache_key, scenario_cache_ttl
+from .risk_analytics import tail_risk_analytics
+from .scenario_sessions import ScenarioSession, store_session
+from .scenario_workers import run_in_worker
+from .sensitivity import evaluate_sensitivity_grid, validate_grid
+from .monte_carlo import (
+    FAN_PERCENTILES,
+    PROJECTION_METRICS,
+    path_percentiles,
+    percentile_bands,
+    resolve_seed,
+    seasonal_factors,
+    simulate_paths,
+    simulation_options,
+    spawn_streams,
+)
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_MONTHS = 12
+
+# Called with (fraction done, status message) by long-running generators
+ProgressCallback = Callable[[float, str], None]
+
+# (market parameter key, scenario type, display name) in response order
+SCENARIO_DEFINITIONS = [
+    ("base_case", "base", "Base Case (Market-Adjusted)"),
+    ("bull_case", "optimistic", "Bull Case (Market-Driven)"),
+    ("bear_case", "pessimistic", "Bear Case (Risk-Adjusted)"),
+]
+
+def build_scenario_configs(market_params: Dict) -> Dict[str, Dict]:
+    """Scenario configs keyed by market parameter key, in response order"""
+    return {
+        key: {"type": scenario_type, "name": name, "params": market_params[key]}
+        for key, scenario_type, name in SCENARIO_DEFINITIONS
+    }
+
 class EnhancedFinancialModelingEngine:
     """
     Sophisticated financial modeling engine with market data integration
     """
 
-    def __init__(self):
-        self.scaler = StandardScaler()
-        self.pca = PCA(n_components=3)
-
-    async def generate_market_aware_scenarios(self, base_revenue: float = 2500000) -> List[Dict]:
+    async def generate_market_aware_scenarios(
+        self, base_revenue: float = 2500000, options: Optional[Dict] = None, use_cache: bool = True,
+        progress: Optional[ProgressCallback] = None
+    ) -> List[Dict]:
         """
         Generate sophisticated scenario projections using real market data
 
@@ -37,155 +71,318 @@ class EnhancedFinancialModelingEngine:
         - Volatility clustering
         - Correlation modeling
         - Risk-adjusted projections
+        - Multi-path Monte Carlo with percentile fan bands
+
+        Scenarios are simulated concurrently in the process pool, each with its
+        own RNG stream spawned from the request seed. The resolved seed is
+        reported in every scenario so results can be reproduced exactly.
+
+        Results are served from the scenario cache while the inputs and the
+        market snapshot are unchanged. progress, if given, is called with the
+        fraction of scenarios finished and a status message.
         """
         logger.info("🔬 Generating market-aware scenario projections")
 
-        # Get enhanced market parameters
-        market_params = await get_enhanced_scenario_parameters()
+        if progress is not None:
+            progress(0.0, "Fetching market data")
+        _, _, tasks = await self._start_scenario_tasks(base_revenue, options, use_cache)
 
-        scenarios = []
-        scenario_configs = [
-            {
-                "type": "base",
-                "name": "Base Case (Market-Adjusted)",
-                "params": market_params["base_case"]
-            },
-            {
-                "type": "optimistic",
-                "name": "Bull Case (Market-Driven)",
-                "params": market_params["bull_case"]
-            },
-            {
-                "type": "pessimistic",
-                "name": "Bear Case (Risk-Adjusted)",
-                "params": market_params["bear_case"]
-            }
-        ]
+        if progress is not None:
+            def report(_):
+                done = sum(task.done() for task in tasks)
+                progress(done / len(tasks), f"Simulated {done}/{len(tasks)} scenarios")
+            report(None)
+            for task in tasks:
+                task.add_done_callback(report)
 
-        for scenario_config in scenario_configs:
-            scenario = await self._generate_sophisticated_projections(
-                scenario_config, base_revenue, market_params["market_context"]
-            )
-            scenarios.append(scenario)
+        scenarios = await asyncio.gather(*tasks)
 
         logger.info(f"✅ Generated {len(scenarios)} market-aware scenarios")
-        return scenarios
+        return list(scenarios)
 
-    async def _generate_sophisticated_projections(
-        self, scenario_config: Dict, base_revenue: float, market_context: Dict
-    ) -> Dict:
+    async def stream_market_aware_scenarios(
+        self, base_revenue: float = 2500000, options: Optional[Dict] = None, use_cache: bool = True,
+        chunk_months: int = STREAM_CHUNK_MONTHS
+    ) -> AsyncIterator[Dict]:
         """
-        Generate sophisticated financial projections with advanced modeling
+        Stream scenario events as each scenario finishes simulating
+
+        Yields a "meta" event (seed, market context), then for every scenario in
+        completion order a "scenario" header followed by "projections" chunks of
+        chunk_months months with matching fan bands, and finally an "end" event.
         """
-        params = scenario_config["params"]
-        projections = []
+        logger.info("🔬 Streaming market-aware scenario projections")
 
-        # Initial values
-        current_revenue = base_revenue
+        market_context, seed, tasks = await self._start_scenario_tasks(base_revenue, options, use_cache)
+        yield {"event": "meta", "seed": seed, "market_context": market_context, "scenarios": len(tasks)}
 
-        # Market regime adjustments
-        regime = market_context["regime"]
-        regime_vol_multiplier = {"BULL": 0.8, "BEAR": 1.4, "SIDEWAYS": 1.0}.get(regime, 1.0)
+        try:
+            for next_scenario in asyncio.as_completed(tasks):
+                scenario = await next_scenario
+                for event in scenario_stream_events(scenario, chunk_months):
+                    yield event
+        finally:
+            # Client went away or a simulation failed: stop waiting on the rest
+            for task in tasks:
+                task.cancel()
+
+        yield {"event": "end", "scenarios": len(tasks)}
+
+    async def _start_scenario_tasks(
+        self, base_revenue: float, options: Optional[Dict], use_cache: bool
+    ) -> Tuple[Dict, int, List[asyncio.Future]]:
+        """
+        Resolve market parameters, serve what the scenario cache already holds and
+        dispatch the remaining scenarios to the process pool
 
-        logger.info(f"📊 Modeling {scenario_config['name']} for {regime} market regime")
+        Returns:
+            (market_context, resolved seed, one future per scenario in config order)
+        """
+        options = options or simulation_options()
 
-        for month in range(36):  # 3-year projections
-            # Advanced growth modeling with multiple factors
-            base_growth = params["revenue_growth"] / 12  # Monthly growth
+        # Get enhanced market parameters
+        market_params = await get_enhanced_scenario_parameters()
+        market_context = await self._market_context(market_params, options)
 
-            # 1. Seasonal effects (retail seasonality)
-            seasonal_factor = 1 + 0.15 * np.sin(2 * np.pi * month / 12 + np.pi/2)
+        scenario_configs = list(build_scenario_configs(market_params).values())
 
-            # 2. Market volatility clustering (GARCH-like)
-            volatility = params["volatility_factor"] * regime_vol_multiplier
-            if month > 0:
-                # Volatility clustering: high vol periods tend to cluster
-                prev_shock = projections[month-1].get("volatility_shock", 0)
-                volatility *= (1 + 0.3 * abs(prev_shock))
+        cache_keys = [
+            scenario_cache_key(scenario_config, base_revenue, market_context, options)
+            for scenario_config in scenario_configs
+        ]
+        cached = [scenario_cache.get(key) if use_cache else None for key in cache_keys]
+
+        # Unseeded requests adopt the seed of any cached scenario so the response reproduces as a whole
+        seed = options["seed"]
+        if seed is None:
+            seed = next((s["simulation"]["seed"] for s in cached if s is not None), None)
+        resolved_options = {**options, "seed": resolve_seed(seed)}
+
+        # Independent child streams per scenario keep parallel results statistically independent
+        child_seeds = spawn_streams(
+            resolved_options["seed"], len(scenario_configs), options["common_random_numbers"]
+        )
+
+        loop = asyncio.get_running_loop()
+        tasks = []
+        for i, scenario_config in enumerate(scenario_configs):
+            if cached[i] is not None:
+                task = loop.create_future()
+                task.set_result(cached[i])
+            else:
+                task = asyncio.ensure_future(self._simulate_and_cache(
+                    scenario_config, base_revenue, market_context, resolved_options,
+                    child_seeds[i], cache_keys[i] if use_cache else None
+                ))
+            tasks.append(task)
+
+        hits = sum(scenario is not None for scenario in cached)
+        if hits:
+            logger.info(f"⚡ Serving {hits}/{len(scenario_configs)} scenarios from cache")
+
+        return market_context, resolved_options["seed"], tasks
+
+    async def _market_context(self, market_params: Dict, options: Dict) -> Dict:
+        """
+        Market context snapshot, with the factor model attached when one is selected
 
-            # 3. Monte Carlo shock with fat tails (Student's t-distribution)
-            degrees_freedom = 5  # Creates fat tails
-            volatility_shock = np.random.standard_t(degrees_freedom) * volatility / 12
+        Correlation and factor-universe volatility fallbacks behind the factor
+        model join the indicator fallbacks in market_context["fallbacks"].
+        """
+        market_context = market_params["market_context"]
+        if options["factor_model"] == "single":
+            return market_context
+
+        market_factors = await get_market_factors(
+            options["factor_model"], options["factor_universe"], options["factor_components"]
+        )
+        factor_fallbacks = market_factors.get("fallbacks", {})
+        fallbacks = {
+            **market_context.get("fallbacks", {}),
+            **{f"factor_{name}": items for name, items in factor_fallbacks.items()}
+        }
+        return {**market_context, "market_factors": market_factors, "fallbacks": fallbacks}
 
-            # 4. Mean reversion component
-            deviation_from_trend = (current_revenue - base_revenue * (1 + base_growth * month)) / base_revenue
-            mean_reversion = -0.1 * deviation_from_trend
+    async def _simulate_and_cache(
+        self, scenario_config: Dict, base_revenue: float, market_context: Dict, options: Dict,
+        seed_sequence: np.random.SeedSequence, cache_key: Optional[str]
+    ) -> Dict:
+        """Simulate one scenario in the process pool and cache the result"""
+        scenario = await run_in_worker(
+            simulate_scenario, scenario_config, base_revenue, market_context, options, seed_sequence
+        )
+        if cache_key is not None:
+            scenario_cache.set(cache_key, scenario, ttl=scenario_cache_ttl())
+        return scenario
 
-            # 5. Market correlation component
-            market_shock = np.random.normal(0, market_context["market_volatility"] / 12)
-            correlated_shock = params["market_correlation"] * market_shock
+    async def run_sensitivity_grid(
+        self, scenario: str, grid: Dict[str, List[float]], base_revenue: float = 2500000,
+        options: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Evaluate a parameter grid around one market-adjusted scenario
 
-            # Combined growth rate
-            total_growth = (base_growth + volatility_shock + mean_reversion +
-                          correlated_shock) * seasonal_factor
+        Args:
+            scenario: Scenario params to vary ('base_case', 'bull_case' or 'bear_case')
+            grid: Parameter name -> values, combined as a cartesian product
+            base_revenue: Starting monthly revenue
+            options: Simulation options from simulation_options()
+        """
+        validate_grid(grid)
+        options = options or simulation_options()
+        market_params = await get_enhanced_scenario_parameters()
+        market_context = await self._market_context(market_params, options)
+        seed = resolve_seed(options["seed"])
+        seed_sequence = spawn_streams(seed, 1)[0]
+
+        result = await run_in_worker(
+            evaluate_sensitivity_grid, market_params[scenario], grid,
+            market_context, base_revenue, options, seed_sequence
+        )
+        result["scenario"] = scenario
+        result["market_regime"] = market_context["regime"]
+        result["simulation"]["seed"] = seed
+        return result
+
+    async def create_scenario_session(
+        self, scenario: str, base_revenue: float = 2500000, options: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Start an interactive session for one scenario
 
-            # Update revenue
-            current_revenue *= (1 + total_growth)
+        The session draws the same stream as the matching scenario in
+        generate_market_aware_scenarios for the same seed, then keeps its
+        intermediate arrays for incremental updates.
+        """
+        options = options or simulation_options()
+        options = {**options, "seed": resolve_seed(options["seed"])}
+        market_params = await get_enhanced_scenario_parameters()
 
-            # Sophisticated margin modeling
-            base_margin = 0.35
-            margin_improvement = params.get("margin_improvement", 0) / 36  # Gradual improvement
-            margin_volatility = 0.02 * np.random.normal()
+        scenario_configs = build_scenario_configs(market_params)
+        index = list(scenario_configs).index(scenario)
+        seed_sequence = spawn_streams(
+            options["seed"], len(scenario_configs), options["common_random_numbers"]
+        )[index]
 
-            # Operating leverage effect
-            revenue_growth_rate = total_growth * 12  # Annualized
-            operating_leverage = 1.5  # 1.5x operating leverage
-            margin_from_leverage = revenue_growth_rate * operating_leverage * 0.1
+        market_context = await self._market_context(market_params, options)
 
-            margin = base_margin + margin_improvement + margin_volatility + margin_from_leverage
-            margin = np.clip(margin, 0.15, 0.65)  # Reasonable bounds
+        session = await asyncio.to_thread(
+            ScenarioSession, scenario_configs[scenario], base_revenue,
+            market_context, options, seed_sequence
+        )
+        store_session(session)
+        logger.info(f"🧪 Started scenario session {session.id[:8]} ({session.nbytes / 1e6:.1f} MB)")
 
-            # Calculate financial metrics
-            revenue = int(current_revenue)
-            cogs = int(revenue * (1 - margin))
-            gross_profit = revenue - cogs
+        return await asyncio.to_thread(self._session_payload, session, list(session.last_timings))
 
-            # OpEx with economies of scale
-            base_opex_rate = 0.25
-            scale_benefit = min(0.05, (revenue / base_revenue - 1) * 0.02)
-            opex_rate = base_opex_rate - scale_benefit
-            opex = int(revenue * opex_rate)
+    async def update_scenario_session(self, session: ScenarioSession, changes: Dict[str, float]) -> Dict:
+        """
+        Apply assumption changes to a session, recomputing only affected stages
 
-            ebitda = gross_profit - opex
+        Raises:
+            ValueError: On parameters a session cannot change
+        """
+        async with session.lock:
+            recomputed = await asyncio.to_thread(session.update, changes)
+            payload = await asyncio.to_thread(self._session_payload, session, recomputed)
+
+        store_session(session)
+        return payload
+
+    def _session_payload(self, session: ScenarioSession, recomputed: List[str]) -> Dict:
+        """Session response: recomputed stages, stage timings and the scenario"""
+        return {
+            "session_id": session.id,
+            "recomputed": recomputed,
+            "timings_ms": session.last_timings,
+            "scenario": self._build_scenario_payload(
+                session.scenario_config, session.market_context, session.options,
+                session.paths, session.stream
+            )
+        }
 
-            # Tax and interest calculations
-            interest_rate = market_context["risk_free_rate"] + 0.02  # Credit spread
-            interest_expense = int(revenue * 0.05 * interest_rate)  # Assume 5% debt/revenue ratio
-            ebt = ebitda - interest_expense
-            tax_rate = 0.25
-            net_income = int(ebt * (1 - tax_rate)) if ebt > 0 else int(ebt * 0.1)  # Loss carry-forward
+    def _generate_sophisticated_projections(
+        self, scenario_config: Dict, base_revenue: float, market_context: Dict, options: Dict,
+        rng: np.random.Generator
+    ) -> Dict:
+        """
+        Generate sophisticated financial projections with advanced modeling
 
-            # Cash flow with working capital
-            working_capital_change = int(revenue * 0.02 * np.random.normal())
-            capex = int(revenue * 0.035)  # 3.5% capex rate
-            cash_flow = net_income + capex - working_capital_change  # Simplified FCF
+        Simulates n_paths Monte Carlo paths at once (or adaptive batches until a
+        target precision is met) and reports the median path as projections
+        alongside P5/P25/P50/P75/P95 fan bands.
+        """
+        params = scenario_config["params"]
+        regime = market_context["regime"]
+        n_paths = options["n_paths"]
+        horizon_months = options["horizon_months"]
+
+        logger.info(f"📊 Modeling {scenario_config['name']} for {regime} market regime "
+                    f"({n_paths:,} paths x {horizon_months} months, {options['volatility_model']} volatility)")
+
+        seed_sequence = rng.bit_generator.seed_seq
+        stream = int(seed_sequence.spawn_key[-1])
 
-            date = datetime.now() + timedelta(days=30 * (month + 1))
+        if options["target_relative_error"] is None:
+            paths = simulate_paths(params, market_context, base_revenue, options, rng)
+            return self._build_scenario_payload(scenario_config, market_context, options, paths, stream)
+
+        paths, convergence = simulate_until_converged(params, market_context, base_revenue, options, seed_sequence)
+        scenario = self._build_scenario_payload(
+            scenario_config, market_context, {**options, "n_paths": convergence["paths_used"]}, paths, stream
+        )
+        scenario["simulation"]["convergence"] = convergence
+        return scenario
+
+    def _build_scenario_payload(
+        self, scenario_config: Dict, market_context: Dict, options: Dict,
+        paths: Dict[str, np.ndarray], stream: int
+    ) -> Dict:
+        """
+        Reduce simulated paths to the scenario response: median-path projections,
+        fan bands, simulation metadata and analytics
+        """
+        params = scenario_config["params"]
+        regime = market_context["regime"]
+        n_paths = options["n_paths"]
+        horizon_months = options["horizon_months"]
+
+        bands = percentile_bands(paths)
+        medians = {
+            metric: bands[metric]["p50"] if metric in bands else path_percentiles(paths[metric], 50)
+            for metric in PROJECTION_METRICS
+        }
+        median_margin = path_percentiles(paths["ebitdaMargin"], 50)
+        median_shock = path_percentiles(paths["volatility_shock"], 50)
+        seasonal = seasonal_factors(horizon_months)
+
+        now = datetime.now()
+        projections = []
+        for month in range(horizon_months):
+            date = now + timedelta(days=30 * (month + 1))
 
             projection = {
                 "id": f"proj-{scenario_config['type']}-{month}",
                 "date": date.isoformat(),
-                "revenue": revenue,
-                "cogs": cogs,
-                "grossProfit": gross_profit,
-                "opex": opex,
-                "ebitda": ebitda,
-                "netIncome": net_income,
-                "cashFlow": cash_flow,
+                **{metric: int(medians[metric][month]) for metric in PROJECTION_METRICS},
                 "scenarioId": f"scenario-{scenario_config['type']}",
                 # Additional Bloomberg-style metrics
-                "ebitdaMargin": ebitda / revenue if revenue > 0 else 0,
-                "volatility_shock": volatility_shock,
+                "ebitdaMargin": float(median_margin[month]),
+                "volatility_shock": float(median_shock[month]),
                 "market_correlation": params["market_correlation"],
-                "seasonal_factor": seasonal_factor
+                "seasonal_factor": float(seasonal[month])
             }
 
             projections.append(projection)
 
         # Calculate scenario summary statistics
         total_revenue_growth = (projections[-1]["revenue"] / projections[0]["revenue"] - 1)
-        avg_margin = np.mean([p["ebitdaMargin"] for p in projections])
-        volatility_realized = np.std([p["revenue"] for p in projections]) / np.mean([p["revenue"] for p in projections])
+        avg_margin = float(np.mean(paths["ebitdaMargin"]))
+        revenue_paths = paths["revenue"]
+        volatility_realized = float(np.mean(np.std(revenue_paths, axis=1) / np.mean(revenue_paths, axis=1)))
+        tail_risk = tail_risk_analytics(
+            paths, market_context["risk_free_rate"], options["covenant_ebitda_floor"]
+        )
 
         scenario = {
             "id": f"scenario-{scenario_config['type']}",
@@ -198,6 +395,25 @@ class EnhancedFinancialModelingEngine:
             "capexAsPercentRevenue": 0.035,
             "organizationId": "1",
             "projections": projections,
+            # Percentile fan bands across all simulated paths
+            "bands": {
+                metric: {label: values.tolist() for label, values in metric_bands.items()}
+                for metric, metric_bands in bands.items()
+            },
+            "simulation": {
+                "paths": n_paths,
+                "horizon_months": horizon_months,
+                "volatility_model": options["volatility_model"],
+                "volatility_params": options["volatility_params"],
+                "sampler": options["sampler"],
+                "factor_model": market_context.get("market_factors", {"method": "single"}),
+                # Market data inputs that were defaults rather than market data
+                "market_data_fallbacks": market_context.get("fallbacks", {}),
+                "seed": options["seed"],
+                "stream": stream,
+                "common_random_numbers": options["common_random_numbers"],
+                "percentiles": list(FAN_PERCENTILES)
+            },
             # Bloomberg-style analytics
             "analytics": {
                 "total_revenue_growth": total_revenue_growth,
@@ -205,42 +421,64 @@ class EnhancedFinancialModelingEngine:
                 "realized_volatility": volatility_realized,
                 "market_regime": regime,
                 "confidence_interval": params["confidence_interval"],
-                "sharpe_ratio": self._calculate_sharpe_ratio(projections, market_context["risk_free_rate"]),
-                "max_drawdown": self._calculate_max_drawdown([p["ebitda"] for p in projections])
+                # Medians of the per-path statistics; full distributions under tail_risk
+                "sharpe_ratio": tail_risk["sharpe_ratio_distribution"]["p50"],
+                "max_drawdown": tail_risk["max_drawdown_distribution"]["p50"],
+                "tail_risk": tail_risk
             }
         }
 
         return scenario
 
-    def _calculate_sharpe_ratio(self, projections: List[Dict], risk_free_rate: float) -> float:
-        """Calculate Sharpe ratio for the projection series"""
-        try:
-            ebitda_series = [p["ebitda"] for p in projections]
-            returns = np.diff(ebitda_series) / ebitda_series[:-1]
-            excess_returns = np.mean(returns) * 12 - risk_free_rate  # Annualized
-            return excess_returns / (np.std(returns) * np.sqrt(12)) if np.std(returns) > 0 else 0
-        except:
-            return 0.0
-
-    def _calculate_max_drawdown(self, series: List[float]) -> float:
-        """Calculate maximum drawdown"""
-        try:
-            peaks = np.maximum.accumulate(series)
-            drawdowns = (peaks - series) / peaks
-            return float(np.max(drawdowns))
-        except:
-            return 0.0
-
 # Global modeling engine instance
 enhanced_modeling_engine = EnhancedFinancialModelingEngine()
 
-async def generate_bloomberg_enhanced_scenarios() -> List[Dict]:
+def scenario_stream_events(scenario: Dict, chunk_months: int = STREAM_CHUNK_MONTHS) -> Iterator[Dict]:
+    """
+    Split a scenario into a header event and month-chunked projection events
+    """
+    yield {
+        "event": "scenario",
+        "scenario": {key: value for key, value in scenario.items() if key not in ("projections", "bands")}
+    }
+
+    projections = scenario["projections"]
+    for start in range(0, len(projections), chunk_months):
+        end = start + chunk_months
+        yield {
+            "event": "projections",
+            "scenarioId": scenario["id"],
+            "start": start,
+            "projections": projections[start:end],
+            "bands": {
+                metric: {label: values[start:end] for label, values in metric_bands.items()}
+                for metric, metric_bands in scenario["bands"].items()
+            }
+        }
+
+def simulate_scenario(
+    scenario_config: Dict, base_revenue: float, market_context: Dict, options: Dict,
+    seed_sequence: np.random.SeedSequence
+) -> Dict:
+    """
+    Process-pool entry point: simulate one scenario on its own RNG stream
+    """
+    rng = np.random.default_rng(seed_sequence)
+    return enhanced_modeling_engine._generate_sophisticated_projections(
+        scenario_config, base_revenue, market_context, options, rng
+    )
+
+async def generate_bloomberg_enhanced_scenarios(
+    options: Optional[Dict] = None, use_cache: bool = True, progress: Optional[ProgressCallback] = None
+) -> List[Dict]:
     """
     Main function to generate Bloomberg-style enhanced scenarios
     """
     logger.info("🚀 Generating Bloomberg-enhanced financial scenarios")
 
-    scenarios = await enhanced_modeling_engine.generate_market_aware_scenarios()
+    scenarios = await enhanced_modeling_engine.generate_market_aware_scenarios(
+        options=options, use_cache=use_cache, progress=progress
+    )
 
     # Log analytics for demonstration
     for scenario in scenarios:
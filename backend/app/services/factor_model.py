@@ -0,0 +1,161 @@
+"""
+Correlated Multi-Factor Market Shocks
+
+Derives a factor model from the correlation matrix of an index/sector universe
+(Cholesky factor, or leading principal components via eigh) and reduces it to
+the loadings of the business's market exposure: an equal-weighted position in
+the universe. The engine then draws independent factor shocks for every path
+and month and maps them to the correlated market shock with one matrix
+multiply. Decompositions are cached per market data snapshot.
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from ..core.config import settings
+from .cache import BoundedTTLCache
+from .market_data import INSUFFICIENT_DATA, market_data_service
+from .monte_carlo import FACTOR_MODELS
+
+logger = logging.getLogger(__name__)
+
+CORRELATION_PERIOD = "1y"
+
+factor_model_cache = BoundedTTLCache(
+    "factor-model",
+    max_bytes=settings.FACTOR_MODEL_CACHE_MAX_BYTES,
+    default_ttl=settings.FACTOR_MODEL_CACHE_TTL_SECONDS
+)
+
+
+def nearest_correlation_eigen(correlation: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Eigen-decomposition with eigenvalues clipped at zero, largest first
+
+    Correlations estimated from misaligned return histories are not always
+    positive semi-definite; clipping gives the nearest valid matrix.
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+    order = np.argsort(eigenvalues)[::-1]
+    return np.clip(eigenvalues[order], 0, None), eigenvectors[:, order]
+
+
+def factor_loadings(correlation: np.ndarray, method: str, n_components: int) -> Tuple[np.ndarray, float]:
+    """
+    Loadings L (assets x factors) with L @ L.T approximating the correlation matrix
+
+    Returns:
+        (loadings, share of total variance the factors explain)
+    """
+    eigenvalues, eigenvectors = nearest_correlation_eigen(correlation)
+
+    if method == "cholesky":
+        try:
+            return np.linalg.cholesky(correlation), 1.0
+        except np.linalg.LinAlgError:
+            # Rebuild from the clipped spectrum with a small ridge so the factor exists
+            repaired = (eigenvectors * eigenvalues) @ eigenvectors.T + 1e-10 * np.eye(len(correlation))
+            scale = np.sqrt(np.diag(repaired))
+            return np.linalg.cholesky(repaired / np.outer(scale, scale)), 1.0
+
+    k = min(n_components, len(eigenvalues))
+    loadings = eigenvectors[:, :k] * np.sqrt(eigenvalues[:k])
+    return loadings, float(eigenvalues[:k].sum() / eigenvalues.sum())
+
+
+def build_market_factors(
+    symbols: List[str], correlation: np.ndarray, volatilities: np.ndarray, method: str, n_components: int
+) -> Dict:
+    """
+    Reduce the universe factor model to the loadings of an equal-weighted exposure
+
+    exposure[f] is the annualized volatility the position takes from factor f,
+    so factor_draws @ exposure is the position's shock. With all factors
+    (Cholesky) its volatility is sqrt(w' S w) for the universe covariance S.
+    With PCA only the leading systematic components are kept.
+    """
+    loadings, explained = factor_loadings(correlation, method, n_components)
+    weights = np.full(len(symbols), 1 / len(symbols))
+    exposure = loadings.T @ (weights * volatilities)
+
+    return {
+        "method": method,
+        "universe": symbols,
+        "components": loadings.shape[1],
+        "explained_variance": explained,
+        "exposure": exposure.tolist(),
+        "volatility": float(np.sqrt(exposure @ exposure)),
+    }
+
+
+def _single_factor_fallback(method: str, reason: str, fallbacks: Dict) -> Dict:
+    return {"method": "single", "requested_method": method, "fallback": reason, "fallbacks": fallbacks}
+
+
+async def get_market_factors(
+    method: str, universe: Optional[List[str]] = None, n_components: int = 3
+) -> Dict:
+    """
+    Market factor model for the given universe from the cached correlation matrix
+
+    The decomposition is keyed by the correlation and volatility snapshot, so
+    it is recomputed only when the market data behind it changes. Symbols
+    without enough history are left out of the universe. When the correlations
+    or volatilities are defaults standing in for unavailable market data (an
+    identity matrix, a flat 20%), or fewer than two symbols remain, the result
+    records a fallback to the single market shock (no exposure) with the
+    reason and the market data fallbacks behind it.
+
+    Raises:
+        ValueError: On an unknown factor model method
+    """
+    if method == "single" or method not in FACTOR_MODELS:
+        raise ValueError(f"No factor model for method '{method}'")
+
+    symbols = list(universe or settings.MARKET_FACTOR_UNIVERSE)
+    correlation_report, volatility_report = await asyncio.gather(
+        market_data_service.get_correlation_matrix_report(symbols, CORRELATION_PERIOD),
+        market_data_service.get_market_volatility_report(symbols, CORRELATION_PERIOD)
+    )
+    fallbacks = {
+        name: report["fallbacks"]
+        for name, report in (("correlation", correlation_report), ("volatility", volatility_report))
+        if report["fallbacks"]
+    }
+    upstream = sorted({
+        reason for items in fallbacks.values() for reason in items.values() if reason != INSUFFICIENT_DATA
+    })
+    if upstream:
+        # Treating missing market data as uncorrelated would understate market risk
+        logger.warning(f"⚠️ Market data unavailable ({', '.join(upstream)}) for {method} factor model, "
+                       f"using the single market shock")
+        return _single_factor_fallback(method, upstream[0], fallbacks)
+
+    # Symbols without enough return history drop out of the universe
+    correlation_frame, volatility_map = correlation_report["value"], volatility_report["value"]
+    symbols = [
+        symbol for symbol in symbols
+        if symbol in correlation_frame.index and symbol not in volatility_report["fallbacks"]
+    ]
+    correlation = correlation_frame.loc[symbols, symbols].to_numpy(dtype=float)
+    volatilities = np.array([volatility_map[symbol] for symbol in symbols])
+    if len(symbols) < 2 or not np.all(np.isfinite(correlation)):
+        logger.warning(f"⚠️ No usable correlation matrix for {method} factor model, using the single market shock")
+        return _single_factor_fallback(method, INSUFFICIENT_DATA, fallbacks)
+
+    digest = hashlib.sha256()
+    digest.update(f"{method}|{n_components}|{'+'.join(symbols)}".encode())
+    digest.update(correlation.tobytes())
+    digest.update(volatilities.tobytes())
+    cache_key = digest.hexdigest()
+
+    factors = factor_model_cache.get(cache_key)
+    if factors is None:
+        factors = build_market_factors(symbols, correlation, volatilities, method, n_components)
+        factor_model_cache.set(cache_key, factors)
+        logger.info(f"🧭 Built {method} factor model over {len(symbols)} assets "
+                    f"({factors['components']} factors, {factors['explained_variance']:.1%} of variance)")
+    return {**factors, "fallbacks": fallbacks} if fallbacks else factors
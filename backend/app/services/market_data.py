@@ -4,333 +4,669 @@ Bloomberg-style Market Data Service for Enhanced Financial Modeling
 This service provides sophisticated market data capabilities similar to Bloomberg Terminal,
 including real-time pricing, historical volatility, correlation analysis, and risk metrics.
 Designed to enhance financial modeling with professional-grade market intelligence.
+
+Prices come from a single shared panel: the union of the index, Treasury, sector
+and factor-universe symbols is downloaded once (one bulk provider call) into
+one date-aligned frame of closes. Volatility, regime, risk-free rate, sector
+returns and correlations are all derived from slices of it, so a refresh is one
+bulk provider call instead of one per symbol and indicator. Symbols or periods
+outside the panel fall back to a bulk download of just what was asked for.
+
+With MARKET_DATA_STORE_DIR set, the panel is also kept in a local PriceStore:
+a restart reloads it from disk, and a refresh downloads only the bars from the
+oldest stored last date onwards instead of the full period.
+
+Behind the per-process cache sits an optional cross-process tier
+(shared_cache), so uvicorn workers share one upstream fetch per entry.
+
+The service is a process-wide singleton shared by concurrent requests and
+holds no per-request resources.
+
+Prices come through the configured MarketDataProvider (see
+market_data_providers). Provider calls are blocking, so they run in a bounded
+thread pool (MARKET_DATA_FETCH_WORKERS) with a per-call timeout, and every
+upstream request goes through a ProviderGateway (rate limit, retries, circuit
+breaker, merging of identical requests; see provider_gateway).
+
+When an indicator falls back to a default value, the *_report methods say so:
+they return {"value": ..., "fallbacks": {item: reason}}, with the reasons
+"insufficient_data", "upstream_unavailable" (circuit open) and
+"upstream_error". Fallbacks caused by upstream failures are never cached (other
+workers only adopt them briefly through the shared tier, see _shared).
 """
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
-import yfinance as yf
-from asyncio_throttle import Throttler
-import aiohttp
+
+from ..core.config import settings
+from .cache import BoundedTTLCache
+from .market_data_providers import get_provider
+from .price_store import PriceStore
+from .provider_gateway import CircuitOpenError, ProviderGateway
+from .shared_cache import get_shared_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class MarketDataService:
+INDEX_SYMBOLS = ["SPY", "QQQ", "IWM"]
+TREASURY_SYMBOL = "^TNX"  # 10-year Treasury yield, quoted in percent
+
+# Major sector ETFs
+SECTOR_ETFS = {
+    "Technology": "XLK",
+    "Healthcare": "XLV",
+    "Financials": "XLF",
+    "Consumer Discretionary": "XLY",
+    "Communication Services": "XLC",
+    "Industrials": "XLI",
+    "Consumer Staples": "XLP",
+    "Energy": "XLE",
+    "Utilities": "XLU",
+    "Real Estate": "XLRE",
+    "Materials": "XLB"
+}
+
+# Union of every symbol the indicators need, in first-seen order
+PANEL_SYMBOLS = list(dict.fromkeys(
+    INDEX_SYMBOLS + [TREASURY_SYMBOL] + list(SECTOR_ETFS.values()) + list(settings.MARKET_FACTOR_UNIVERSE)
+))
+PANEL_PERIOD = "1y"  # Longest lookback any indicator needs
+PANEL_CACHE_SECONDS = 300  # Shortest indicator cache duration
+PANEL_RETRY_SECONDS = 60  # Failed downloads are retried after this long
+DEFAULT_CACHE_SECONDS = 300
+# Stored closes younger than this skip the provider; the background refresher
+# reloads the panel at least this long after the previous sync
+PANEL_STORE_MAX_AGE = max(
+    0.0,
+    PANEL_CACHE_SECONDS - settings.MARKET_DATA_REFRESH_LEAD_SECONDS - settings.MARKET_DATA_REFRESH_JITTER_SECONDS
+)
+
+# Periods served from the panel: trading-day counts or calendar offsets back from the last bar
+PANEL_WINDOWS = {
+    "5d": 5,
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+}
+
+# Bumped when the shape of cached values changes, so workers never adopt
+# shared entries published by an older release
+SHARED_VALUE_VERSION = 3
+
+# Why an indicator reports a default instead of market data
+INSUFFICIENT_DATA = "insufficient_data"
+UPSTREAM_UNAVAILABLE = "upstream_unavailable"
+UPSTREAM_ERROR = "upstream_error"
+
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_price_store: Optional[PriceStore] = None
+_price_store_lock = threading.Lock()  # Created from fetch pool threads
+
+
+def get_fetch_pool() -> ThreadPoolExecutor:
+    """Return the shared market data fetch pool, creating it on first use"""
+    global _fetch_pool
+
+    if _fetch_pool is None:
+        _fetch_pool = ThreadPoolExecutor(
+            max_workers=settings.MARKET_DATA_FETCH_WORKERS,
+            thread_name_prefix="market-data"
+        )
+
+    return _fetch_pool
+
+
+def shutdown_fetch_pool():
+    """Shut down the market data fetch pool (called from the app lifespan)"""
+    global _fetch_pool
+
+    if _fetch_pool is not None:
+        _fetch_pool.shutdown(wait=False, cancel_futures=True)
+        _fetch_pool = None
+
+
+async def run_fetch(fn: Callable[..., Any], *args, **kwargs) -> Any:
     """
-    Professional market data service providing Bloomberg-style capabilities
+    Run a blocking provider call in the fetch pool
+
+    Raises:
+        asyncio.TimeoutError: When the call exceeds MARKET_DATA_FETCH_TIMEOUT_SECONDS
+            (the worker thread finishes in the background, the pool bounds how many can)
     """
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(get_fetch_pool(), partial(fn, *args, **kwargs)),
+        timeout=settings.MARKET_DATA_FETCH_TIMEOUT_SECONDS
+    )
 
-    def __init__(self):
-        self.throttler = Throttler(rate_limit=10, period=1)  # 10 requests per second
-        self.cache = {}
-        self.cache_expiry = {}
-        self.session = None
-
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-
-    def _is_cache_valid(self, key: str, cache_duration: int = 300) -> bool:
-        """Check if cached data is still valid (default 5 minutes)"""
-        return (key in self.cache and
-                key in self.cache_expiry and
-                datetime.now() < self.cache_expiry[key])
-
-    def _cache_data(self, key: str, data, cache_duration: int = 300):
-        """Cache data with expiry"""
-        self.cache[key] = data
-        self.cache_expiry[key] = datetime.now() + timedelta(seconds=cache_duration)
 
-    async def get_market_volatility(self, symbols: List[str], period: str = "1y") -> Dict[str, float]:
-        """
-        Calculate market volatility for given symbols (Bloomberg RVOL equivalent)
+def get_price_store() -> Optional[PriceStore]:
+    """Return the local price store, or None when MARKET_DATA_STORE_DIR is empty"""
+    global _price_store
 
-        Args:
-            symbols: List of ticker symbols (e.g., ['SPY', 'QQQ', 'IWM'])
-            period: Time period ('1m', '5m', '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
+    with _price_store_lock:
+        if _price_store is None and settings.MARKET_DATA_STORE_DIR:
+            _price_store = PriceStore(settings.MARKET_DATA_STORE_DIR)
 
-        Returns:
-            Dictionary mapping symbols to annualized volatility
-        """
-        cache_key = f"volatility_{'+'.join(symbols)}_{period}"
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]
+    return _price_store
 
-        async with self.throttler:
-            logger.info(f"📊 Fetching market volatility for {symbols} ({period})")
 
-            volatilities = {}
+def volatility_cache_key(symbols: List[str], period: str) -> str:
+    return f"volatility_{'+'.join(symbols)}_{period}"
 
-            for symbol in symbols:
-                try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(period=period)
 
-                    if len(hist) > 20:  # Need sufficient data points
-                        # Calculate daily returns
-                        returns = hist['Close'].pct_change().dropna()
+def correlation_cache_key(symbols: List[str], period: str) -> str:
+    return f"correlation_{'+'.join(symbols)}_{period}"
 
-                        # Annualized volatility (252 trading days)
-                        volatility = returns.std() * np.sqrt(252)
-                        volatilities[symbol] = float(volatility)
 
-                        logger.info(f"✅ {symbol}: {volatility:.2%} annual volatility")
-                    else:
-                        logger.warning(f"⚠️ Insufficient data for {symbol}")
-                        volatilities[symbol] = 0.20  # Default 20% volatility
+def fallback_reason(error: Exception) -> str:
+    """Fallback reason for an upstream failure"""
+    return UPSTREAM_UNAVAILABLE if isinstance(error, CircuitOpenError) else UPSTREAM_ERROR
 
-                except Exception as e:
-                    logger.error(f"❌ Error fetching {symbol}: {e}")
-                    volatilities[symbol] = 0.20  # Default fallback
 
-            self._cache_data(cache_key, volatilities)
-            return volatilities
+def indicator_report(value: Any, fallbacks: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Indicator value with the items that fell back to defaults, and why"""
+    return {"value": value, "fallbacks": fallbacks or {}}
 
-    async def get_correlation_matrix(self, symbols: List[str], period: str = "1y") -> pd.DataFrame:
+
+def panel_window(panel: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Rows of the panel within a period (see PANEL_WINDOWS) of its last bar"""
+    if panel.empty:
+        return panel
+    window = PANEL_WINDOWS[period]
+    if isinstance(window, int):
+        return panel.tail(window)
+    return panel.loc[panel.index > panel.index[-1] - window]
+
+
+async def load_price_panel(
+    gateway: ProviderGateway, symbols: List[str], period: str, max_age: float
+) -> pd.DataFrame:
+    """
+    Closes of the symbols over a period, synced through the local price store
+
+    Symbols synced less than max_age seconds ago are served as they are. Stale
+    symbols already in the store are topped up from the oldest of their last
+    stored dates, and only stale symbols with nothing stored are downloaded over
+    the full period. A symbol the provider returns nothing for is still marked as
+    synced, so it does not make every load go upstream. If the provider fails,
+    the stored series are served stale rather than not at all.
+    """
+    store = get_price_store()
+    if store is None:
+        return await gateway.download_closes(symbols, period=period)
+
+    stored = await asyncio.to_thread(store.load_many, symbols)
+    stale = await asyncio.to_thread(store.stale_symbols, symbols, max_age)
+    if stale:
+        missing = [symbol for symbol in stale if symbol not in stored or stored[symbol].empty]
+        topped_up = [symbol for symbol in stale if symbol not in missing]
+        try:
+            requests = []
+            if missing:
+                requests.append(gateway.download_closes(missing, period=period))
+            if topped_up:
+                since = min(stored[symbol].index[-1] for symbol in topped_up).date()
+                requests.append(gateway.download_closes(topped_up, start=since))
+            downloads = await asyncio.gather(*requests)
+
+            def sync() -> int:
+                returned = {symbol for closes in downloads for symbol in closes}
+                new_bars = sum(store.append(symbol, closes[symbol]) for closes in downloads for symbol in closes)
+                for symbol in set(stale) - returned:
+                    store.mark_synced(symbol)
+                return new_bars
+
+            new_bars = await asyncio.to_thread(sync)
+            logger.info(f"💽 Price store synced {len(stale)} symbols: {new_bars} new bars, "
+                        f"{len(missing)} fetched in full")
+            stored = await asyncio.to_thread(store.load_many, symbols)
+        except Exception as e:
+            if not stored:
+                raise
+            logger.warning(f"⚠️ Price store sync failed, serving stored closes: {e!r}")
+
+    if not stored:
+        return pd.DataFrame(columns=symbols, dtype=float)
+    return panel_window(pd.DataFrame(stored).sort_index(), period)
+
+
+class MarketDataService:
+    """
+    Professional market data service providing Bloomberg-style capabilities
+    """
+
+    def __init__(self):
+        # Rate limit, retries and circuit breaker for every upstream request
+        self.gateway = ProviderGateway(run_fetch, get_provider)
+        # Bounded, per-key TTLs; concurrent misses on a key share one load
+        self.cache = BoundedTTLCache("market-data", max_bytes=settings.MARKET_DATA_CACHE_MAX_BYTES)
+
+    def seconds_until_expiry(self, keys: List[str]) -> float:
+        """Seconds until the first of the given cache entries expires (0 if any is missing)"""
+        return min((self.cache.expires_in(key) for key in keys), default=0.0)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Market data cache counters, including callers coalesced onto an in-flight load"""
+        return self.cache.stats()
+
+    def upstream_stats(self) -> Dict[str, Any]:
+        """Provider gateway counters (circuit state, retries, merged requests)"""
+        return self.gateway.stats()
+
+    async def _cached(self, key: str, loader: Callable[[], Awaitable[Tuple[Any, float]]]) -> Any:
+        """Cached value of a key, served stale (up to MARKET_DATA_MAX_STALE_SECONDS) while it reloads"""
+        return await self.cache.get_or_load(
+            key, self._shared(key, loader), max_stale=settings.MARKET_DATA_MAX_STALE_SECONDS
+        )
+
+    def _shared(
+        self, key: str, loader: Callable[[], Awaitable[Tuple[Any, float]]], min_fresh: float = 0.0
+    ) -> Callable[[], Awaitable[Tuple[Any, float]]]:
         """
-        Generate correlation matrix for portfolio risk analysis (Bloomberg CORR equivalent)
+        Loader going through the cross-process shared tier
+
+        A shared entry with more than min_fresh seconds left is adopted for its
+        remaining TTL. Otherwise the worker holding the key's lease loads and
+        publishes the value while the others wait for it, until the lease is
+        released. Uncached fallbacks (ttl 0) are published separately for
+        MARKET_DATA_SHARED_FALLBACK_SECONDS. Other workers adopt them uncached
+        instead of each waiting on the failing provider themselves.
         """
-        cache_key = f"correlation_{'+'.join(symbols)}_{period}"
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]
+        shared_key = f"{key}@v{SHARED_VALUE_VERSION}"
+        fallback_key = f"{shared_key}:fallback"
+
+        async def load() -> Tuple[Any, float]:
+            shared = get_shared_cache()
+            if shared is None:
+                return await loader()
+
+            hit = await shared.get(shared_key)
+            if hit is not None and hit[1] > min_fresh:
+                return hit
+            fallback = await shared.get(fallback_key)
+            if fallback is not None:
+                return fallback[0], 0
+
+            leased = await shared.acquire(shared_key)
+            if not leased:
+                hit = await shared.wait_for(shared_key, min_fresh)
+                if hit is not None:
+                    return hit
+                fallback = await shared.get(fallback_key)
+                if fallback is not None:
+                    return fallback[0], 0
+            try:
+                value, ttl = await loader()
+                if ttl > 0:
+                    await shared.set(shared_key, value, ttl)
+                else:
+                    await shared.set(fallback_key, value, settings.MARKET_DATA_SHARED_FALLBACK_SECONDS)
+                return value, ttl
+            finally:
+                if leased:
+                    await shared.release(shared_key)
 
-        async with self.throttler:
-            logger.info(f"🔗 Computing correlation matrix for {symbols}")
+        return load
 
-            try:
-                # Download data for all symbols
-                data = yf.download(symbols, period=period, group_by='ticker')
+    def refresh_targets(self) -> Dict[str, Callable[[], Awaitable[Tuple[Any, float]]]]:
+        """
+        Cache entries kept warm by the background refresher, with their loaders
 
-                if len(symbols) == 1:
-                    # Single symbol case
-                    returns = data['Close'].pct_change().dropna()
-                    corr_matrix = pd.DataFrame([[1.0]], index=[symbols[0]], columns=[symbols[0]])
-                else:
-                    # Multiple symbols
-                    returns_data = {}
-                    for symbol in symbols:
-                        if symbol in data.columns.levels[0]:
-                            returns_data[symbol] = data[symbol]['Close'].pct_change()
+        The price panel comes first so the indicators refreshed after it are
+        derived from fresh closes. Shared entries are only adopted when they
+        outlive the refresh lead, so the first worker due refreshes upstream
+        and the others pick up its result.
+        """
+        index_symbols = list(INDEX_SYMBOLS)
+        universe = list(settings.MARKET_FACTOR_UNIVERSE)
+        min_fresh = settings.MARKET_DATA_REFRESH_LEAD_SECONDS + settings.MARKET_DATA_REFRESH_JITTER_SECONDS
+        loaders = {
+            "price_panel": self._load_price_panel,
+            volatility_cache_key(index_symbols, "1y"): partial(self._load_market_volatility, index_symbols, "1y"),
+            "market_regime": self._load_market_regime,
+            "risk_free_rate": self._load_risk_free_rate,
+            "sector_performance": self._load_sector_performance,
+            # Factor model inputs for the default universe
+            correlation_cache_key(universe, "1y"): partial(self._load_correlation_matrix, universe, "1y"),
+            volatility_cache_key(universe, "1y"): partial(self._load_market_volatility, universe, "1y"),
+        }
+        return {key: self._shared(key, loader, min_fresh) for key, loader in loaders.items()}
+
+    async def get_price_panel(self) -> pd.DataFrame:
+        """
+        Date-aligned closes of PANEL_SYMBOLS over PANEL_PERIOD, synced through the price store
 
-                    returns_df = pd.DataFrame(returns_data).dropna()
-                    corr_matrix = returns_df.corr()
+        Concurrent callers share a single load. After a failed download the
+        previous panel is kept for PANEL_RETRY_SECONDS; without one the error
+        propagates and the indicators report upstream fallbacks (repeated
+        failures open the gateway circuit, so callers then fail fast).
+        """
+        return await self._cached("price_panel", self._load_price_panel)
+
+    async def _load_price_panel(self) -> Tuple[pd.DataFrame, float]:
+        logger.info(f"📥 Loading price panel for {len(PANEL_SYMBOLS)} symbols ({PANEL_PERIOD})")
+        try:
+            panel = await load_price_panel(self.gateway, PANEL_SYMBOLS, PANEL_PERIOD, PANEL_STORE_MAX_AGE)
+            logger.info(f"✅ Price panel: {panel.shape[0]} dates x {panel.shape[1]} symbols")
+            return panel, PANEL_CACHE_SECONDS
+        except Exception as e:
+            stale = self.cache.peek("price_panel", max_stale=settings.MARKET_DATA_MAX_STALE_SECONDS)
+            if stale is None:
+                raise
+            logger.error(f"❌ Error loading price panel, keeping the previous one: {e!r}")
+            return stale, PANEL_RETRY_SECONDS
+
+    async def _get_closes(self, symbols: List[str], period: str) -> pd.DataFrame:
+        """
+        Closes of the given symbols over a period, sliced from the shared panel when
+        it covers them and bulk-downloaded otherwise; symbols without data are dropped
+        """
+        if period in PANEL_WINDOWS and set(symbols) <= set(PANEL_SYMBOLS):
+            closes = panel_window(await self.get_price_panel(), period).reindex(columns=symbols)
+        else:
+            closes = await self.gateway.download_closes(symbols, period=period)
+        # Dates only other symbols traded on (e.g. bond market days) are dropped too
+        return closes.dropna(axis=1, how="all").dropna(how="all")
+
+    async def get_market_volatility(self, symbols: List[str], period: str = "1y") -> Dict[str, float]:
+        """
+        Calculate market volatility for given symbols (Bloomberg RVOL equivalent)
 
-                logger.info(f"✅ Generated {len(symbols)}x{len(symbols)} correlation matrix")
-                self._cache_data(cache_key, corr_matrix)
-                return corr_matrix
+        Args:
+            symbols: List of ticker symbols (e.g., ['SPY', 'QQQ', 'IWM'])
+            period: Time period ('1m', '5m', '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
 
-            except Exception as e:
-                logger.error(f"❌ Error computing correlations: {e}")
-                # Return identity matrix as fallback
-                return pd.DataFrame(np.eye(len(symbols)), index=symbols, columns=symbols)
+        Returns:
+            Dictionary mapping symbols to annualized volatility
+        """
+        return (await self.get_market_volatility_report(symbols, period))["value"]
+
+    async def get_market_volatility_report(self, symbols: List[str], period: str = "1y") -> Dict:
+        """Market volatility with the symbols that fell back to the 20% default"""
+        cache_key = volatility_cache_key(symbols, period)
+        return await self._cached(cache_key, partial(self._load_market_volatility, symbols, period))
+
+    async def _load_market_volatility(self, symbols: List[str], period: str) -> Tuple[Dict, float]:
+        logger.info(f"📊 Computing market volatility for {symbols} ({period})")
+        try:
+            closes = await self._get_closes(symbols, period)
+        except Exception as e:
+            logger.error(f"❌ Error fetching {symbols}: {e!r}")
+            reason = fallback_reason(e)
+            # Default 20% volatility, not cached
+            return indicator_report(
+                {symbol: 0.20 for symbol in symbols}, {symbol: reason for symbol in symbols}
+            ), 0
+
+        # Annualized volatility of daily returns (252 trading days), all symbols at once
+        returns = closes.pct_change(fill_method=None)
+        observations = returns.count()
+        annualized = returns.std() * np.sqrt(252)
+
+        volatilities, fallbacks = {}, {}
+        for symbol in symbols:
+            if observations.get(symbol, 0) >= 20:  # Need sufficient data points
+                volatilities[symbol] = float(annualized[symbol])
+                logger.info(f"✅ {symbol}: {annualized[symbol]:.2%} annual volatility")
+            else:
+                logger.warning(f"⚠️ Insufficient data for {symbol}")
+                volatilities[symbol] = 0.20  # Default 20% volatility
+                fallbacks[symbol] = INSUFFICIENT_DATA
+
+        return indicator_report(volatilities, fallbacks), DEFAULT_CACHE_SECONDS
+
+    async def get_correlation_matrix(self, symbols: List[str], period: str = "1y") -> pd.DataFrame:
+        """
+        Generate correlation matrix for portfolio risk analysis (Bloomberg CORR equivalent)
+        """
+        return (await self.get_correlation_matrix_report(symbols, period))["value"]
+
+    async def get_correlation_matrix_report(self, symbols: List[str], period: str = "1y") -> Dict:
+        """Correlation matrix with the symbols left out of it, or an identity matrix on upstream failure"""
+        cache_key = correlation_cache_key(symbols, period)
+        return await self._cached(cache_key, partial(self._load_correlation_matrix, symbols, period))
+
+    async def _load_correlation_matrix(self, symbols: List[str], period: str) -> Tuple[Dict, float]:
+        logger.info(f"🔗 Computing correlation matrix for {symbols}")
+
+        try:
+            if len(symbols) == 1:
+                # Single symbol case
+                corr_matrix = pd.DataFrame([[1.0]], index=[symbols[0]], columns=[symbols[0]])
+            else:
+                # Symbols without data drop out of the matrix
+                closes = await self._get_closes(symbols, period)
+                returns_df = closes.pct_change(fill_method=None).dropna()
+                corr_matrix = returns_df.corr()
+
+            logger.info(f"✅ Generated {len(corr_matrix)}x{len(corr_matrix)} correlation matrix")
+            fallbacks = {symbol: INSUFFICIENT_DATA for symbol in symbols if symbol not in corr_matrix.index}
+            return indicator_report(corr_matrix, fallbacks), DEFAULT_CACHE_SECONDS
+
+        except Exception as e:
+            logger.error(f"❌ Error computing correlations: {e!r}")
+            # Return identity matrix as fallback (not cached)
+            reason = fallback_reason(e)
+            return indicator_report(
+                pd.DataFrame(np.eye(len(symbols)), index=symbols, columns=symbols),
+                {symbol: reason for symbol in symbols}
+            ), 0
 
     async def get_risk_free_rate(self) -> float:
         """
         Get current risk-free rate (10-year Treasury yield - Bloomberg equivalent: USGG10YR)
         """
-        cache_key = "risk_free_rate"
-        if self._is_cache_valid(cache_key, cache_duration=3600):  # Cache for 1 hour
-            return self.cache[cache_key]
+        return (await self.get_risk_free_rate_report())["value"]
 
-        async with self.throttler:
-            try:
-                logger.info("📈 Fetching risk-free rate (10Y Treasury)")
+    async def get_risk_free_rate_report(self) -> Dict:
+        """Risk-free rate, flagged when it is the 4.5% default"""
+        return await self._cached("risk_free_rate", self._load_risk_free_rate)
 
-                # Use 10-year Treasury ETF as proxy
-                treasury = yf.Ticker("^TNX")
-                hist = treasury.history(period="5d")
+    async def _load_risk_free_rate(self) -> Tuple[Dict, float]:
+        try:
+            logger.info("📈 Reading risk-free rate (10Y Treasury)")
 
-                if not hist.empty:
-                    risk_free_rate = float(hist['Close'].iloc[-1]) / 100  # Convert percentage
-                    logger.info(f"✅ Risk-free rate: {risk_free_rate:.2%}")
-                else:
-                    risk_free_rate = 0.045  # Default 4.5%
-                    logger.warning("⚠️ Using default risk-free rate: 4.5%")
+            closes = await self._get_closes([TREASURY_SYMBOL], "5d")
 
-                self._cache_data(cache_key, risk_free_rate, cache_duration=3600)
-                return risk_free_rate
+            if TREASURY_SYMBOL in closes:
+                risk_free_rate = float(closes[TREASURY_SYMBOL].dropna().iloc[-1]) / 100  # Convert percentage
+                logger.info(f"✅ Risk-free rate: {risk_free_rate:.2%}")
+                return indicator_report(risk_free_rate), 3600  # Cache for 1 hour
 
-            except Exception as e:
-                logger.error(f"❌ Error fetching risk-free rate: {e}")
-                return 0.045  # Default fallback
+            logger.warning("⚠️ Using default risk-free rate: 4.5%")
+            return indicator_report(0.045, {"risk_free_rate": INSUFFICIENT_DATA}), 3600
+
+        except Exception as e:
+            logger.error(f"❌ Error fetching risk-free rate: {e!r}")
+            return indicator_report(0.045, {"risk_free_rate": fallback_reason(e)}), 0  # Default fallback
 
     async def get_market_regime(self) -> Dict[str, any]:
         """
         Analyze current market regime (Bull/Bear/Sideways) using multiple indicators
         Bloomberg equivalent: Market regime analysis
         """
-        cache_key = "market_regime"
-        if self._is_cache_valid(cache_key, cache_duration=1800):  # Cache for 30 minutes
-            return self.cache[cache_key]
-
-        async with self.throttler:
-            try:
-                logger.info("🔍 Analyzing market regime")
-
-                # Analyze S&P 500 for market regime
-                spy = yf.Ticker("SPY")
-                hist = spy.history(period="6mo")
-
-                if len(hist) > 50:
-                    # Calculate moving averages
-                    hist['MA_20'] = hist['Close'].rolling(20).mean()
-                    hist['MA_50'] = hist['Close'].rolling(50).mean()
-
-                    current_price = hist['Close'].iloc[-1]
-                    ma_20 = hist['MA_20'].iloc[-1]
-                    ma_50 = hist['MA_50'].iloc[-1]
-
-                    # Calculate recent volatility
-                    recent_returns = hist['Close'].pct_change().tail(20)
-                    volatility = recent_returns.std() * np.sqrt(252)
-
-                    # Determine regime
-                    if current_price > ma_20 > ma_50 and volatility < 0.25:
-                        regime = "BULL"
-                        confidence = 0.8
-                    elif current_price < ma_20 < ma_50 and volatility > 0.30:
-                        regime = "BEAR"
-                        confidence = 0.7
-                    else:
-                        regime = "SIDEWAYS"
-                        confidence = 0.6
-
-                    result = {
-                        "regime": regime,
-                        "confidence": confidence,
-                        "volatility": float(volatility),
-                        "trend_strength": float(abs(current_price - ma_50) / ma_50),
-                        "price_vs_ma20": float((current_price - ma_20) / ma_20),
-                        "timestamp": datetime.now().isoformat()
-                    }
-
-                    logger.info(f"✅ Market regime: {regime} (confidence: {confidence:.1%})")
-                    self._cache_data(cache_key, result, cache_duration=1800)
-                    return result
-
-            except Exception as e:
-                logger.error(f"❌ Error analyzing market regime: {e}")
-
-            # Default fallback
-            return {
-                "regime": "SIDEWAYS",
-                "confidence": 0.5,
-                "volatility": 0.20,
-                "trend_strength": 0.05,
-                "price_vs_ma20": 0.0,
-                "timestamp": datetime.now().isoformat()
-            }
+        return (await self.get_market_regime_report())["value"]
+
+    async def get_market_regime_report(self) -> Dict:
+        """Market regime, flagged when it is the SIDEWAYS default"""
+        return await self._cached("market_regime", self._load_market_regime)
+
+    async def _load_market_regime(self) -> Tuple[Dict, float]:
+        try:
+            logger.info("🔍 Analyzing market regime")
+
+            # Analyze S&P 500 for market regime
+            closes = await self._get_closes(["SPY"], "6mo")
+            close = closes["SPY"].dropna() if "SPY" in closes else pd.Series(dtype=float)
+
+            if len(close) > 50:
+                # Calculate moving averages
+                current_price = close.iloc[-1]
+                ma_20 = close.rolling(20).mean().iloc[-1]
+                ma_50 = close.rolling(50).mean().iloc[-1]
+
+                # Calculate recent volatility
+                recent_returns = close.pct_change().tail(20)
+                volatility = recent_returns.std() * np.sqrt(252)
+
+                # Determine regime
+                if current_price > ma_20 > ma_50 and volatility < 0.25:
+                    regime = "BULL"
+                    confidence = 0.8
+                elif current_price < ma_20 < ma_50 and volatility > 0.30:
+                    regime = "BEAR"
+                    confidence = 0.7
+                else:
+                    regime = "SIDEWAYS"
+                    confidence = 0.6
+
+                result = {
+                    "regime": regime,
+                    "confidence": confidence,
+                    "volatility": float(volatility),
+                    "trend_strength": float(abs(current_price - ma_50) / ma_50),
+                    "price_vs_ma20": float((current_price - ma_20) / ma_20),
+                    "timestamp": datetime.now().isoformat()
+                }
+
+                logger.info(f"✅ Market regime: {regime} (confidence: {confidence:.1%})")
+                return indicator_report(result), 1800  # Cache for 30 minutes
+
+            logger.warning("⚠️ Insufficient SPY history for regime analysis")
+            reason, ttl = INSUFFICIENT_DATA, DEFAULT_CACHE_SECONDS
+
+        except Exception as e:
+            logger.error(f"❌ Error analyzing market regime: {e!r}")
+            reason, ttl = fallback_reason(e), 0
+
+        # Default fallback
+        return indicator_report({
+            "regime": "SIDEWAYS",
+            "confidence": 0.5,
+            "volatility": 0.20,
+            "trend_strength": 0.05,
+            "price_vs_ma20": 0.0,
+            "timestamp": datetime.now().isoformat()
+        }, {"regime": reason}), ttl
 
     async def get_sector_performance(self) -> Dict[str, float]:
         """
         Get sector performance data (Bloomberg equivalent: Sector analysis)
         """
-        cache_key = "sector_performance"
-        if self._is_cache_valid(cache_key, cache_duration=3600):
-            return self.cache[cache_key]
-
-        # Major sector ETFs
-        sector_etfs = {
-            "Technology": "XLK",
-            "Healthcare": "XLV",
-            "Financials": "XLF",
-            "Consumer Discretionary": "XLY",
-            "Communication Services": "XLC",
-            "Industrials": "XLI",
-            "Consumer Staples": "XLP",
-            "Energy": "XLE",
-            "Utilities": "XLU",
-            "Real Estate": "XLRE",
-            "Materials": "XLB"
-        }
-
-        async with self.throttler:
-            logger.info("📊 Fetching sector performance data")
-
-            performance = {}
-
-            for sector, etf in sector_etfs.items():
-                try:
-                    ticker = yf.Ticker(etf)
-                    hist = ticker.history(period="1mo")
-
-                    if len(hist) > 5:
-                        # Calculate 1-month performance
-                        start_price = hist['Close'].iloc[0]
-                        end_price = hist['Close'].iloc[-1]
-                        perf = (end_price - start_price) / start_price
-                        performance[sector] = float(perf)
-
-                except Exception as e:
-                    logger.warning(f"⚠️ Error fetching {sector} ({etf}): {e}")
-                    performance[sector] = 0.0
-
-            logger.info(f"✅ Retrieved performance for {len(performance)} sectors")
-            self._cache_data(cache_key, performance, cache_duration=3600)
-            return performance
+        return (await self.get_sector_performance_report())["value"]
+
+    async def get_sector_performance_report(self) -> Dict:
+        """Sector performance with the sectors reported as 0.0 for lack of data"""
+        return await self._cached("sector_performance", self._load_sector_performance)
+
+    async def _load_sector_performance(self) -> Tuple[Dict, float]:
+        logger.info("📊 Computing sector performance data")
+
+        try:
+            closes = await self._get_closes(list(SECTOR_ETFS.values()), "1mo")
+        except Exception as e:
+            logger.warning(f"⚠️ Error fetching sector ETFs: {e!r}")
+            reason = fallback_reason(e)
+            return indicator_report({sector: 0.0 for sector in SECTOR_ETFS}, dict.fromkeys(SECTOR_ETFS, reason)), 0
+
+        performance, fallbacks = {}, {}
+        for sector, etf in SECTOR_ETFS.items():
+            if etf not in closes:
+                performance[sector] = 0.0
+                fallbacks[sector] = INSUFFICIENT_DATA
+                continue
+
+            close = closes[etf].dropna()
+            # Sectors with too short a history are left out
+            if len(close) > 5:
+                # Calculate 1-month performance
+                start_price = close.iloc[0]
+                end_price = close.iloc[-1]
+                performance[sector] = float((end_price - start_price) / start_price)
+
+        logger.info(f"✅ Retrieved performance for {len(performance)} sectors")
+        return indicator_report(performance, fallbacks), 3600
 
 # Global market data service instance
 market_data_service = MarketDataService()
 
+# Cache entries that feed get_enhanced_scenario_parameters
+SCENARIO_PARAMETER_CACHE_KEYS = [
+    volatility_cache_key(INDEX_SYMBOLS, "1y"),
+    "market_regime",
+    "risk_free_rate",
+    "sector_performance",
+]
+
 async def get_enhanced_scenario_parameters() -> Dict[str, any]:
     """
     Generate sophisticated scenario parameters using real market data
     This enhances our financial modeling with Bloomberg-style market intelligence
     """
-    async with market_data_service:
-        logger.info("🚀 Generating enhanced scenario parameters with market data")
-
-        # Get market indicators
-        market_vol = await market_data_service.get_market_volatility(["SPY", "QQQ", "IWM"])
-        market_regime = await market_data_service.get_market_regime()
-        risk_free_rate = await market_data_service.get_risk_free_rate()
-        sector_performance = await market_data_service.get_sector_performance()
-
-        # Calculate enhanced parameters
-        spy_vol = market_vol.get("SPY", 0.20)
-        regime_multiplier = {
-            "BULL": 1.2,
-            "BEAR": 0.7,
-            "SIDEWAYS": 0.9
-        }.get(market_regime["regime"], 1.0)
-
-        # Enhanced scenario parameters
-        parameters = {
-            "base_case": {
-                "revenue_growth": 0.12 * regime_multiplier,
-                "volatility_factor": spy_vol * 0.8,
-                "market_correlation": 0.6,
-                "confidence_interval": 0.68
-            },
-            "bull_case": {
-                "revenue_growth": 0.25 * regime_multiplier,
-                "volatility_factor": spy_vol * 1.2,
-                "market_correlation": 0.8,
-                "confidence_interval": 0.90
-            },
-            "bear_case": {
-                "revenue_growth": -0.05 * regime_multiplier,
-                "volatility_factor": spy_vol * 1.5,
-                "market_correlation": 0.9,
-                "confidence_interval": 0.75
-            },
-            "market_context": {
-                "regime": market_regime["regime"],
-                "regime_confidence": market_regime["confidence"],
-                "market_volatility": spy_vol,
-                "risk_free_rate": risk_free_rate,
-                "sector_rotation": sector_performance
-            }
+    logger.info("🚀 Generating enhanced scenario parameters with market data")
+
+    # Get market indicators concurrently: cold-start latency is the slowest fetch, not the sum
+    reports = await asyncio.gather(
+        market_data_service.get_market_volatility_report(INDEX_SYMBOLS),
+        market_data_service.get_market_regime_report(),
+        market_data_service.get_risk_free_rate_report(),
+        market_data_service.get_sector_performance_report()
+    )
+    market_vol, market_regime, risk_free_rate, sector_performance = (report["value"] for report in reports)
+    # Indicators that are defaults rather than market data, so callers can tell them apart
+    fallbacks = {
+        name: report["fallbacks"]
+        for name, report in zip(("market_volatility", "regime", "risk_free_rate", "sector_rotation"), reports)
+        if report["fallbacks"]
+    }
+
+    # Calculate enhanced parameters
+    spy_vol = market_vol.get("SPY", 0.20)
+    regime_multiplier = {
+        "BULL": 1.2,
+        "BEAR": 0.7,
+        "SIDEWAYS": 0.9
+    }.get(market_regime["regime"], 1.0)
+
+    # Enhanced scenario parameters
+    parameters = {
+        "base_case": {
+            "revenue_growth": 0.12 * regime_multiplier,
+            "volatility_factor": spy_vol * 0.8,
+            "market_correlation": 0.6,
+            "confidence_interval": 0.68
+        },
+        "bull_case": {
+            "revenue_growth": 0.25 * regime_multiplier,
+            "volatility_factor": spy_vol * 1.2,
+            "market_correlation": 0.8,
+            "confidence_interval": 0.90
+        },
+        "bear_case": {
+            "revenue_growth": -0.05 * regime_multiplier,
+            "volatility_factor": spy_vol * 1.5,
+            "market_correlation": 0.9,
+            "confidence_interval": 0.75
+        },
+        "market_context": {
+            "regime": market_regime["regime"],
+            "regime_confidence": market_regime["confidence"],
+            "market_volatility": spy_vol,
+            "risk_free_rate": risk_free_rate,
+            "sector_rotation": sector_performance,
+            "fallbacks": fallbacks
         }
+    }
 
-        logger.info(f"✅ Generated enhanced parameters for {market_regime['regime']} market regime")
-        return parameters
\ No newline at end of file
+    logger.info(f"✅ Generated enhanced parameters for {market_regime['regime']} market regime")
+    return parameters
\ No newline at end of file
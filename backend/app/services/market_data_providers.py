@@ -0,0 +1,199 @@
+"""
+Pluggable Market Data Providers
+
+MarketDataService reads prices through a MarketDataProvider instead of calling
+yfinance directly, selected by MARKET_DATA_PROVIDER:
+
+- "yfinance": live Yahoo Finance data
+- "record": yfinance, with every downloaded close series also captured to
+  MARKET_DATA_RECORDING_DIR
+- "replay": serves the captured series from MARKET_DATA_RECORDING_DIR with
+  MARKET_DATA_REPLAY_LATENCY_MS of synthetic latency per call, needing no
+  network access
+
+Replay windows are measured back from the last recorded bar rather than from
+today, so a recording gives the same indicators every time it is replayed.
+Recordings use the PriceStore file format (one NumPy file per symbol).
+"""
+
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+import pandas as pd
+
+from ..core.config import settings
+from .price_store import PriceStore
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = ("yfinance", "record", "replay")
+
+_provider: Optional["MarketDataProvider"] = None
+_provider_lock = threading.Lock()
+
+
+class MarketDataProvider(ABC):
+    """
+    Source of daily close prices
+    """
+
+    name = "abstract"
+
+    @abstractmethod
+    def download_closes(
+        self, symbols: List[str], period: Optional[str] = None, start: Optional[date] = None
+    ) -> pd.DataFrame:
+        """
+        Closes of several symbols in one call, over a period or from a start date
+
+        Returns:
+            Date-indexed frame with one column per symbol that returned data
+        """
+
+    def history(self, symbol: str, period: str) -> pd.Series:
+        """Closes of a single symbol over a period (empty when it has no data)"""
+        closes = self.download_closes([symbol], period=period)
+        return closes[symbol] if symbol in closes else pd.Series(dtype=float, name=symbol)
+
+
+class YFinanceProvider(MarketDataProvider):
+    """
+    Live Yahoo Finance data through yfinance
+    """
+
+    name = "yfinance"
+
+    def __init__(self):
+        # Imported here so replay runs do not need yfinance installed
+        import yfinance
+        self._yf = yfinance
+
+    def download_closes(
+        self, symbols: List[str], period: Optional[str] = None, start: Optional[date] = None
+    ) -> pd.DataFrame:
+        if start is not None:
+            data = self._yf.download(symbols, start=start, auto_adjust=True, progress=False)
+        else:
+            data = self._yf.download(symbols, period=period, auto_adjust=True, progress=False)
+        if data.empty:
+            return pd.DataFrame(columns=symbols, dtype=float)
+
+        if isinstance(data.columns, pd.MultiIndex):
+            closes = data["Close"]
+        else:
+            # Older yfinance returns flat columns for a single symbol
+            closes = data[["Close"]].set_axis(symbols[:1], axis=1)
+        return closes.dropna(axis=1, how="all").sort_index()
+
+    def history(self, symbol: str, period: str) -> pd.Series:
+        return self._yf.Ticker(symbol).history(period=period)["Close"].rename(symbol)
+
+
+class RecordingProvider(MarketDataProvider):
+    """
+    Wraps another provider and captures every close series it returns
+    """
+
+    name = "record"
+
+    def __init__(self, inner: MarketDataProvider, directory: str):
+        self.inner = inner
+        self.recording = PriceStore(directory)
+
+    def download_closes(
+        self, symbols: List[str], period: Optional[str] = None, start: Optional[date] = None
+    ) -> pd.DataFrame:
+        closes = self.inner.download_closes(symbols, period=period, start=start)
+        for symbol in closes:
+            self.recording.append(symbol, closes[symbol])
+        return closes
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serves recorded close series with a fixed synthetic latency per call
+    """
+
+    name = "replay"
+
+    def __init__(self, directory: str, latency_ms: float = 0.0):
+        self.recording = PriceStore(directory)
+        self.latency_ms = latency_ms
+
+    def download_closes(
+        self, symbols: List[str], period: Optional[str] = None, start: Optional[date] = None
+    ) -> pd.DataFrame:
+        if self.latency_ms > 0:
+            # Blocks the calling fetch worker the way a network round trip would
+            time.sleep(self.latency_ms / 1000)
+
+        recorded = self.recording.load_many(symbols)
+        if not recorded:
+            return pd.DataFrame(columns=symbols, dtype=float)
+
+        closes = pd.DataFrame(recorded).sort_index()
+        if start is not None:
+            return closes.loc[closes.index >= pd.Timestamp(start)].dropna(axis=1, how="all")
+        return replay_window(closes, period or "max").dropna(axis=1, how="all")
+
+
+def replay_window(closes: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Rows of a recorded frame within a yfinance-style period of its last bar
+
+    Raises:
+        ValueError: On a period that is not Nd, Nmo, Ny, ytd or max
+    """
+    if period == "max" or closes.empty:
+        return closes
+    last = closes.index[-1]
+    if period == "ytd":
+        return closes.loc[closes.index >= pd.Timestamp(last.year, 1, 1)]
+
+    match = re.fullmatch(r"(\d+)(d|mo|y)", period)
+    if match is None:
+        raise ValueError(f"Unsupported period '{period}'")
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        return closes.tail(count)  # Trading days, as yfinance counts them
+    offset = pd.DateOffset(months=count) if unit == "mo" else pd.DateOffset(years=count)
+    return closes.loc[closes.index > last - offset]
+
+
+def build_provider(name: str) -> MarketDataProvider:
+    """
+    Provider for a MARKET_DATA_PROVIDER name
+
+    Raises:
+        ValueError: On an unknown provider name
+    """
+    if name == "yfinance":
+        return YFinanceProvider()
+    if name == "record":
+        return RecordingProvider(YFinanceProvider(), settings.MARKET_DATA_RECORDING_DIR)
+    if name == "replay":
+        return ReplayProvider(settings.MARKET_DATA_RECORDING_DIR, settings.MARKET_DATA_REPLAY_LATENCY_MS)
+    raise ValueError(f"MARKET_DATA_PROVIDER must be one of {PROVIDERS}, got '{name}'")
+
+
+def get_provider() -> MarketDataProvider:
+    """Return the configured market data provider, creating it on first use"""
+    global _provider
+
+    with _provider_lock:
+        if _provider is None:
+            _provider = build_provider(settings.MARKET_DATA_PROVIDER)
+            logger.info(f"🔌 Market data provider: {_provider.name}")
+
+    return _provider
+
+
+def set_provider(provider: Optional[MarketDataProvider]):
+    """Replace the market data provider (None goes back to MARKET_DATA_PROVIDER)"""
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,114 @@
+"""
+Background Refresh of Market Data Indicators
+
+Without it, the first request after an indicator expires pays the provider
+latency. The refresher runs on the app lifespan and reloads each entry of
+MarketDataService.refresh_targets shortly before it expires. Meanwhile request
+handlers keep getting the cached value, served stale if needed, so once the
+service is warm no request waits on an upstream fetch.
+
+Each entry is refreshed MARKET_DATA_REFRESH_LEAD_SECONDS plus a random jitter
+before expiry. The jitter is redrawn after every refresh, so entries and worker
+processes do not all refresh together. A refresh that fails or returns an
+uncached fallback is retried with exponential backoff (also jittered), and the
+previous value is served in the meantime.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Optional
+
+from ..core.config import settings
+from .market_data import MarketDataService, market_data_service
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataRefresher:
+    """
+    Periodic task keeping market data cache entries warm
+    """
+
+    def __init__(self, service: MarketDataService):
+        self.service = service
+        self.interval = settings.MARKET_DATA_REFRESH_INTERVAL_SECONDS
+        self.lead = settings.MARKET_DATA_REFRESH_LEAD_SECONDS
+        self.jitter = settings.MARKET_DATA_REFRESH_JITTER_SECONDS
+        self.backoff = settings.MARKET_DATA_REFRESH_BACKOFF_SECONDS
+        self.max_backoff = settings.MARKET_DATA_REFRESH_MAX_BACKOFF_SECONDS
+        self._task: Optional[asyncio.Task] = None
+        self._leads: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, float] = {}
+        self.refreshes = 0
+        self.failures = 0
+
+    def start(self):
+        """Start the refresh loop (called from the app lifespan)"""
+        if self._task is None:
+            logger.info(f"🔄 Starting market data refresher (every {self.interval}s, {self.lead}s lead)")
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the refresh loop (called from the app lifespan)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh_due()
+            except Exception as e:
+                logger.error(f"❌ Market data refresh pass failed: {e!r}")
+            await asyncio.sleep(self.interval)
+
+    def _lead(self, key: str) -> float:
+        if key not in self._leads:
+            self._leads[key] = self.lead + random.uniform(0, self.jitter)
+        return self._leads[key]
+
+    async def refresh_due(self):
+        """Refresh every target that expires within its lead and is not backing off"""
+        cache = self.service.cache
+        for key, loader in self.service.refresh_targets().items():
+            now = time.monotonic()
+            if now < self._retry_at.get(key, 0.0) or cache.expires_in(key) > self._lead(key):
+                continue
+
+            try:
+                refreshed = await cache.refresh(key, loader)
+            except Exception as e:
+                logger.warning(f"⚠️ Refresh of {key} failed: {e!r}")
+                refreshed = False
+
+            if refreshed:
+                self.refreshes += 1
+                self._failures.pop(key, None)
+                self._retry_at.pop(key, None)
+                self._leads.pop(key, None)  # Redraw the jitter for the next cycle
+            else:
+                self.failures += 1
+                failures = self._failures.get(key, 0) + 1
+                self._failures[key] = failures
+                delay = min(self.max_backoff, self.backoff * 2 ** (failures - 1)) * random.uniform(0.5, 1.5)
+                self._retry_at[key] = now + delay
+                logger.warning(f"⚠️ {key} not refreshed ({failures} in a row), retrying in {delay:.0f}s")
+
+    def stats(self) -> Dict:
+        """Refresher counters for monitoring"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "backing_off": sorted(key for key, retry_at in self._retry_at.items() if retry_at > time.monotonic()),
+        }
+
+
+market_data_refresher = MarketDataRefresher(market_data_service)
@@ -0,0 +1,441 @@
+"""
+Vectorized Monte Carlo Path Engine for Enhanced Financial Modeling
+
+Simulates many projection paths at once as NumPy arrays (paths x months) instead
+of stepping a single path through a Python loop. Scenario parameters may also be
+1-D arrays of grid cells, in which case every array gains a trailing cell axis
+(paths x months x cells) and all cells share the same random draws. The model mirrors the engine's
+projection logic - fat-tailed shocks, volatility clustering, mean reversion,
+market correlation, operating leverage and working capital noise - and reduces
+the simulated paths to percentile fan bands for charting and risk reporting.
+"""
+
+import logging
+import secrets
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from scipy import stats
+from scipy.stats import qmc
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH_COUNT = 10000
+DEFAULT_HORIZON_MONTHS = 36
+DEFAULT_MAX_ADAPTIVE_PATHS = 100000
+MAX_SYNC_PATHS = 20000  # Largest run simulated inside a request; bigger runs go through the job queue
+MAX_JOB_PATHS = 200000
+DEFAULT_TIME_BUDGET_SECONDS = 20.0
+FAN_PERCENTILES = (5, 25, 50, 75, 95)
+BAND_METRICS = ("revenue", "ebitda", "cashFlow")
+PROJECTION_METRICS = ("revenue", "cogs", "grossProfit", "opex", "ebitda", "netIncome", "cashFlow")
+
+REGIME_VOL_MULTIPLIERS = {"BULL": 0.8, "BEAR": 1.4, "SIDEWAYS": 1.0}
+T_DEGREES_FREEDOM = 5  # Creates fat tails
+MIN_MONTHLY_GROWTH = -0.9  # Keeps revenue positive under extreme tail draws
+
+SHOCK_NAMES = ("volatility", "market", "margin", "working_capital")
+SAMPLERS = ("pseudo", "antithetic", "sobol", "halton")
+QMC_SAMPLERS = ("sobol", "halton")
+QMC_EPSILON = 1e-12
+FACTOR_MODELS = ("single", "pca", "cholesky")
+
+DEFAULT_GARCH_PARAMS = {"alpha": 0.10, "beta": 0.85, "omega": None}
+
+# Seeds stay within 2^53 so they round-trip exactly through JSON / JavaScript clients
+MAX_SEED = 2 ** 53 - 1
+
+
+def resolve_seed(seed: Optional[int] = None) -> int:
+    """Return the request seed, drawing a fresh one from OS entropy when omitted"""
+    if seed is None:
+        return secrets.randbelow(MAX_SEED + 1)
+    if not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"Seed must be between 0 and {MAX_SEED}")
+    return seed
+
+
+def spawn_streams(seed: int, n_streams: int, common_random_numbers: bool = False) -> List[np.random.SeedSequence]:
+    """
+    Derive per-scenario (or per-worker) child streams from a request-level seed
+
+    Children are spawned deterministically, so the same seed always maps to the
+    same streams regardless of which worker runs them. With common random
+    numbers every consumer shares one stream, which makes scenario diffs
+    reflect assumptions rather than sampling noise.
+    """
+    root = np.random.SeedSequence(seed)
+    if common_random_numbers:
+        return root.spawn(1) * n_streams
+    return root.spawn(n_streams)
+
+
+def draw_shocks(
+    rng: np.random.Generator, n_paths: int, n_months: int, sampler: str = "pseudo", n_factors: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Draw every random input of the model up front as (paths, months) arrays
+
+    With n_factors > 0 the market draws are independent factor shocks of shape
+    (paths, months, factors), mapped to the market shock by the factor model.
+
+    Samplers:
+        pseudo: independent pseudo-random draws
+        antithetic: half the paths are drawn, the other half mirror them (-z);
+            valid because both shock distributions are symmetric
+        sobol / halton: scrambled low-discrepancy points in the unit cube (one
+            dimension per shock, factor and month) mapped through the inverse
+            CDFs. Sobol points are balanced for power-of-two path counts.
+    """
+    if sampler == "antithetic":
+        half = draw_shocks(rng, (n_paths + 1) // 2, n_months, n_factors=n_factors)
+        return {name: np.concatenate([values, -values])[:n_paths] for name, values in half.items()}
+
+    if sampler in QMC_SAMPLERS:
+        return _quasi_random_shocks(rng, n_paths, n_months, sampler, n_factors)
+
+    shape = (n_paths, n_months)
+    return {
+        "volatility": rng.standard_t(T_DEGREES_FREEDOM, size=shape),
+        "market": rng.standard_normal(shape + (n_factors,) if n_factors else shape),
+        "margin": rng.standard_normal(shape),
+        "working_capital": rng.standard_normal(shape),
+    }
+
+
+def _quasi_random_shocks(
+    rng: np.random.Generator, n_paths: int, n_months: int, sampler: str, n_factors: int = 0
+) -> Dict[str, np.ndarray]:
+    """Scrambled Sobol/Halton draws mapped through the t and normal inverse CDFs"""
+    widths = {name: (n_factors or 1) if name == "market" else 1 for name in SHOCK_NAMES}
+    n_dims = sum(widths.values()) * n_months
+    if sampler == "sobol":
+        engine = qmc.Sobol(n_dims, scramble=True, seed=rng)
+        points = engine.random_base2(int(np.ceil(np.log2(max(n_paths, 2)))))[:n_paths]
+    else:
+        points = qmc.Halton(n_dims, scramble=True, seed=rng).random(n_paths)
+
+    # Scrambled points can land exactly on 0, which the inverse CDFs map to -inf
+    points = np.clip(points, QMC_EPSILON, 1 - QMC_EPSILON).reshape(n_paths, -1, n_months)
+
+    shocks = {}
+    offset = 0
+    for name in SHOCK_NAMES:
+        uniforms = points[:, offset:offset + widths[name], :]
+        offset += widths[name]
+        if name == "volatility":
+            values = stats.t.ppf(uniforms, T_DEGREES_FREEDOM)
+        else:
+            values = stats.norm.ppf(uniforms)
+        # (paths, width, months) -> (paths, months[, factors])
+        shocks[name] = np.moveaxis(values, 1, 2) if name == "market" and n_factors else values[:, 0, :]
+    return shocks
+
+
+def factor_exposure(market_context: Dict) -> Optional[List[float]]:
+    """Factor model exposure attached to the market context, if any"""
+    return (market_context.get("market_factors") or {}).get("exposure")
+
+
+def factor_count(market_context: Dict) -> int:
+    """Number of market factors drawn per month (0 for the single market shock)"""
+    return len(factor_exposure(market_context) or ())
+
+
+def market_shocks(shocks: Dict[str, np.ndarray], market_context: Dict) -> np.ndarray:
+    """
+    Annualized market shock per path and month: the single draw scaled by market
+    volatility, or the factor draws mapped through the factor model exposure
+    """
+    exposure = factor_exposure(market_context)
+    if exposure is None:
+        return shocks["market"] * market_context["market_volatility"]
+    # One matrix multiply over all paths and months (factor axis 2, before any cell axis)
+    return np.tensordot(shocks["market"], np.asarray(exposure), axes=([2], [0]))
+
+
+def seasonal_factors(n_months: int) -> np.ndarray:
+    """Retail seasonality multiplier for each projection month"""
+    months = np.arange(n_months)
+    return 1 + 0.15 * np.sin(2 * np.pi * months / 12 + np.pi / 2)
+
+
+def clustered_volatility_shocks(z: np.ndarray, base_volatility) -> np.ndarray:
+    """
+    Volatility clustering: each month's volatility is scaled up by the size of
+    the previous month's shock. Steps all paths together along the month axis.
+    """
+    shocks = []
+    prev_shock = 0.0
+    for month in range(z.shape[1]):
+        volatility = base_volatility * (1 + 0.3 * np.abs(prev_shock))
+        prev_shock = z[:, month] * volatility / 12
+        shocks.append(prev_shock)
+    return np.stack(shocks, axis=1)
+
+
+def garch_volatility_shocks(
+    z: np.ndarray, base_volatility, alpha: float = 0.10, beta: float = 0.85, omega: Optional[float] = None
+) -> np.ndarray:
+    """
+    GARCH(1,1) volatility: sigma2[t] = omega + alpha * eps[t-1]^2 + beta * sigma2[t-1]
+
+    The t-distributed draws are standardised to unit variance so alpha/beta/omega
+    keep their usual meaning. When omega is omitted it is chosen so the long-run
+    monthly variance matches (base_volatility / 12)^2, and the recursion starts
+    at that long-run level.
+    """
+    long_run_variance = (np.asarray(base_volatility) / 12) ** 2
+    if omega is None:
+        omega = (1 - alpha - beta) * long_run_variance
+    z = z * np.sqrt((T_DEGREES_FREEDOM - 2) / T_DEGREES_FREEDOM)
+
+    shocks = []
+    variance = long_run_variance
+    prev_shock = 0.0
+    for month in range(z.shape[1]):
+        if month > 0:
+            variance = omega + alpha * prev_shock ** 2 + beta * variance
+        prev_shock = np.sqrt(variance) * z[:, month]
+        shocks.append(prev_shock)
+    return np.stack(shocks, axis=1)
+
+
+VOLATILITY_MODELS: Dict[str, Callable[..., np.ndarray]] = {
+    "clustering": clustered_volatility_shocks,
+    "garch": garch_volatility_shocks,
+}
+
+DEFAULT_SIMULATION_OPTIONS = {
+    "n_paths": DEFAULT_PATH_COUNT,
+    "horizon_months": DEFAULT_HORIZON_MONTHS,
+    "volatility_model": "clustering",
+    "volatility_params": {},
+    "seed": None,
+    "common_random_numbers": False,
+    "sampler": "pseudo",
+    # Monthly EBITDA level below which a path counts as a covenant breach
+    "covenant_ebitda_floor": 0.0,
+    # Adaptive path counts: when a target is set, n_paths is the first batch
+    "target_relative_error": None,
+    "target_confidence": 0.95,
+    "max_paths": DEFAULT_MAX_ADAPTIVE_PATHS,
+    "time_budget_seconds": DEFAULT_TIME_BUDGET_SECONDS,
+    # Market shock: 'single' (market volatility) or a pca/cholesky factor model
+    # over factor_universe (None for the configured universe)
+    "factor_model": "single",
+    "factor_universe": None,
+    "factor_components": 3,
+}
+
+
+def simulation_options(**overrides) -> Dict:
+    """
+    Build a validated simulation options dict from defaults plus overrides
+
+    Raises:
+        ValueError: On unknown options or invalid model parameters
+    """
+    unknown = set(overrides) - set(DEFAULT_SIMULATION_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown simulation options: {', '.join(sorted(unknown))}")
+
+    options = {**DEFAULT_SIMULATION_OPTIONS, **{k: v for k, v in overrides.items() if v is not None}}
+
+    if options["seed"] is not None and not 0 <= options["seed"] <= MAX_SEED:
+        raise ValueError(f"Seed must be between 0 and {MAX_SEED}")
+
+    if options["target_relative_error"] is not None:
+        if not 0 < options["target_relative_error"] < 1:
+            raise ValueError("target_relative_error must be between 0 and 1")
+        if not 0 < options["target_confidence"] < 1:
+            raise ValueError("target_confidence must be between 0 and 1")
+        if options["max_paths"] < options["n_paths"]:
+            raise ValueError("max_paths must be at least the initial path count")
+        if options["time_budget_seconds"] <= 0:
+            raise ValueError("time_budget_seconds must be positive")
+
+    if options["factor_model"] not in FACTOR_MODELS:
+        raise ValueError(f"Unknown factor model '{options['factor_model']}' "
+                         f"(expected one of {', '.join(FACTOR_MODELS)})")
+    if options["factor_components"] < 1:
+        raise ValueError("factor_components must be at least 1")
+    if options["factor_universe"] is not None and len(options["factor_universe"]) < 2:
+        raise ValueError("factor_universe needs at least two symbols")
+
+    if options["sampler"] not in SAMPLERS:
+        raise ValueError(f"Unknown sampler '{options['sampler']}' (expected one of {', '.join(SAMPLERS)})")
+
+    if options["volatility_model"] not in VOLATILITY_MODELS:
+        raise ValueError(f"Unknown volatility model '{options['volatility_model']}' "
+                         f"(expected one of {', '.join(VOLATILITY_MODELS)})")
+
+    if options["volatility_model"] == "garch":
+        garch = {**DEFAULT_GARCH_PARAMS, **options["volatility_params"]}
+        if garch["alpha"] < 0 or garch["beta"] < 0:
+            raise ValueError("GARCH alpha and beta must be non-negative")
+        # alpha + beta >= 1 makes the variance recursion non-stationary, with or without an explicit omega
+        if garch["alpha"] + garch["beta"] >= 1:
+            raise ValueError("GARCH alpha + beta must be below 1 for a stationary variance")
+        if garch["omega"] is not None and garch["omega"] <= 0:
+            raise ValueError("GARCH omega must be positive")
+        options["volatility_params"] = garch
+    else:
+        options["volatility_params"] = {}
+
+    return options
+
+
+def simulate_volatility(
+    shocks: Dict[str, np.ndarray], params: Dict, market_context: Dict,
+    volatility_model: str = "clustering", volatility_params: Optional[Dict] = None
+) -> np.ndarray:
+    """Regime-adjusted idiosyncratic volatility shocks from the selected volatility model"""
+    regime_vol_multiplier = REGIME_VOL_MULTIPLIERS.get(market_context["regime"], 1.0)
+    volatility = params["volatility_factor"] * regime_vol_multiplier
+    volatility_kernel = VOLATILITY_MODELS[volatility_model]
+    return volatility_kernel(shocks["volatility"], volatility, **(volatility_params or {}))
+
+
+def simulate_revenue(
+    shocks: Dict[str, np.ndarray], params: Dict, market_context: Dict, base_revenue: float,
+    volatility_model: str = "clustering", volatility_params: Optional[Dict] = None,
+    volatility_shock: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate revenue paths. Mean reversion couples each month to the previous
+    revenue level, so the month axis is stepped while all paths move together.
+
+    Precomputed volatility shocks may be passed in to skip the volatility stage.
+    """
+    n_months = shocks["volatility"].shape[1]
+
+    base_growth = params["revenue_growth"] / 12  # Monthly growth
+    seasonal = seasonal_factors(n_months)
+
+    if volatility_shock is None:
+        volatility_shock = simulate_volatility(shocks, params, market_context, volatility_model, volatility_params)
+
+    market_shock = market_shocks(shocks, market_context) / 12
+    correlated_shock = params["market_correlation"] * market_shock
+
+    current_revenue = base_revenue
+    revenue, total_growth = [], []
+    for month in range(n_months):
+        trend = base_revenue * (1 + base_growth * month)
+        mean_reversion = -0.1 * (current_revenue - trend) / base_revenue
+        growth = (base_growth + volatility_shock[:, month] + mean_reversion +
+                  correlated_shock[:, month]) * seasonal[month]
+        # With thousands of paths some t-draws exceed -100% growth; a negative revenue
+        # level would then make the mean reversion term diverge
+        growth = np.maximum(growth, MIN_MONTHLY_GROWTH)
+        current_revenue = current_revenue * (1 + growth)
+        revenue.append(current_revenue)
+        total_growth.append(growth)
+
+    return {
+        "revenue": np.stack(revenue, axis=1),
+        "total_growth": np.stack(total_growth, axis=1),
+        "volatility_shock": volatility_shock,
+    }
+
+
+def compute_financials(
+    revenue_state: Dict[str, np.ndarray], shocks: Dict[str, np.ndarray],
+    params: Dict, market_context: Dict, base_revenue: float
+) -> Dict[str, np.ndarray]:
+    """Derive margins, P&L lines and cash flow from simulated revenue paths"""
+    revenue = revenue_state["revenue"]
+
+    # Margin with gradual improvement, noise and operating leverage
+    base_margin = 0.35
+    margin_improvement = params.get("margin_improvement", 0) / 36
+    margin_volatility = 0.02 * shocks["margin"]
+    operating_leverage = 1.5
+    margin_from_leverage = revenue_state["total_growth"] * 12 * operating_leverage * 0.1
+    margin = np.clip(base_margin + margin_improvement + margin_volatility + margin_from_leverage, 0.15, 0.65)
+
+    cogs = revenue * (1 - margin)
+    gross_profit = revenue - cogs
+
+    # OpEx with economies of scale
+    scale_benefit = np.minimum(0.05, (revenue / base_revenue - 1) * 0.02)
+    opex = revenue * (0.25 - scale_benefit)
+    ebitda = gross_profit - opex
+
+    # Interest on 5% debt/revenue at risk-free plus credit spread, loss carry-forward below zero
+    interest_rate = market_context["risk_free_rate"] + 0.02
+    ebt = ebitda - revenue * 0.05 * interest_rate
+    net_income = np.where(ebt > 0, ebt * (1 - 0.25), ebt * 0.1)
+
+    # Simplified FCF with working capital noise
+    working_capital_change = revenue * 0.02 * shocks["working_capital"]
+    capex = revenue * 0.035
+    cash_flow = net_income + capex - working_capital_change
+
+    return {
+        "revenue": revenue,
+        "cogs": cogs,
+        "grossProfit": gross_profit,
+        "opex": opex,
+        "ebitda": ebitda,
+        "netIncome": net_income,
+        "cashFlow": cash_flow,
+        "ebitdaMargin": np.divide(ebitda, revenue, out=np.zeros_like(ebitda), where=revenue > 0),
+        "volatility_shock": revenue_state["volatility_shock"],
+    }
+
+
+def simulate_paths(
+    params: Dict,
+    market_context: Dict,
+    base_revenue: float,
+    options: Optional[Dict] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate the configured number of paths x months for one scenario
+
+    Args:
+        params: Scenario parameters (revenue_growth, volatility_factor, ...)
+        market_context: Market context from get_enhanced_scenario_parameters
+        base_revenue: Starting monthly revenue
+        options: Simulation options from simulation_options()
+        rng: Random generator (a fresh one is created when omitted)
+
+    Returns:
+        Dictionary mapping metric names to (paths, months) arrays
+    """
+    options = options or simulation_options()
+    rng = rng if rng is not None else np.random.default_rng()
+    shocks = draw_shocks(
+        rng, options["n_paths"], options["horizon_months"], options["sampler"], factor_count(market_context)
+    )
+    revenue_state = simulate_revenue(
+        shocks, params, market_context, base_revenue,
+        options["volatility_model"], options["volatility_params"]
+    )
+    return compute_financials(revenue_state, shocks, params, market_context, base_revenue)
+
+
+def percentile_bands(
+    paths: Dict[str, np.ndarray],
+    metrics: Sequence[str] = BAND_METRICS,
+    percentiles: Sequence[int] = FAN_PERCENTILES,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """Reduce simulated paths to per-month percentile fan bands"""
+    bands = {}
+    for metric in metrics:
+        values = path_percentiles(paths[metric], percentiles)
+        bands[metric] = {f"p{p}": values[i] for i, p in enumerate(percentiles)}
+    return bands
+
+
+def path_percentiles(values: np.ndarray, percentiles) -> np.ndarray:
+    """
+    Percentiles across the path axis
+
+    Selection runs on a month-major contiguous copy, which is markedly faster
+    than reducing along the strided path axis of a (paths, months) array.
+    """
+    month_major = np.ascontiguousarray(np.moveaxis(values, 0, -1))
+    return np.percentile(month_major, percentiles, axis=-1)
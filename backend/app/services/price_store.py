@@ -0,0 +1,135 @@
+"""
+Local On-Disk Store for Daily Close Series
+
+Keeps one NumPy file per symbol (a structured array of day-resolution dates and
+closes) so the price panel survives process restarts and each refresh only has
+to fetch the bars after the last stored date. Files are memory-mapped on load
+and replaced atomically on write, so readers never see a partial series.
+
+Staleness is tracked per symbol: a file's modification time is when the symbol
+was last synced. A sync that returns nothing for a symbol touches its file, or
+an empty marker file when nothing is stored yet. That symbol then stays fresh
+like the others instead of sending every load back to the provider.
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BAR_DTYPE = np.dtype([("date", "<M8[D]"), ("close", "<f8")])
+
+
+def _as_day_index(index: pd.Index) -> np.ndarray:
+    """Provider timestamps (possibly tz-aware) as datetime64[D]"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype("datetime64[D]")
+
+
+class PriceStore:
+    """
+    Per-symbol daily close series under one directory
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()  # Appends read-modify-write a file
+
+    def _path(self, symbol: str, suffix: str = ".npy") -> Path:
+        # Index symbols such as ^TNX are not safe file names
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9.-]', '_', symbol)}{suffix}"
+
+    def _empty_marker(self, symbol: str) -> Path:
+        return self._path(symbol, ".empty")
+
+    def load(self, symbol: str) -> Optional[pd.Series]:
+        """Stored closes of a symbol indexed by date, or None when nothing is stored"""
+        path = self._path(symbol)
+        if not path.exists():
+            return None
+        try:
+            bars = np.load(path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Unreadable price store file {path.name}, ignoring it: {e}")
+            return None
+        index = pd.DatetimeIndex(np.asarray(bars["date"]).astype("datetime64[ns]"))
+        return pd.Series(np.asarray(bars["close"]), index=index, name=symbol)
+
+    def load_many(self, symbols: List[str]) -> Dict[str, pd.Series]:
+        """Stored closes of every symbol that has a series"""
+        series = {symbol: self.load(symbol) for symbol in symbols}
+        return {symbol: closes for symbol, closes in series.items() if closes is not None}
+
+    def age_seconds(self, symbol: str) -> float:
+        """Seconds since a symbol was last synced, with or without data (inf if never)"""
+        for path in (self._path(symbol), self._empty_marker(symbol)):
+            try:
+                return time.time() - path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+        return float("inf")
+
+    def stale_symbols(self, symbols: List[str], max_age: float) -> List[str]:
+        """Symbols last synced max_age seconds ago or more"""
+        return [symbol for symbol in symbols if self.age_seconds(symbol) >= max_age]
+
+    def mark_synced(self, symbol: str):
+        """Record a sync that returned no new bars for a symbol"""
+        path = self._path(symbol)
+        with self._write_lock:
+            if path.exists():
+                os.utime(path)
+            else:
+                self._empty_marker(symbol).touch()
+
+    def append(self, symbol: str, closes: pd.Series) -> int:
+        """
+        Merge newly fetched closes into a symbol's series
+
+        Stored bars from the first new date onwards are replaced, so a partial
+        bar fetched during the trading day is corrected by the next sync.
+
+        Returns:
+            Number of new bars after the previously stored last date
+        """
+        closes = closes.dropna()
+        new_bars = np.empty(len(closes), dtype=BAR_DTYPE)
+        new_bars["date"] = _as_day_index(closes.index)
+        new_bars["close"] = closes.to_numpy(dtype=float)
+        new_bars = new_bars[np.argsort(new_bars["date"], kind="stable")]
+
+        path = self._path(symbol)
+        with self._write_lock:
+            if path.exists():
+                stored = np.load(path)
+                last_date = stored["date"][-1] if len(stored) else None
+                if len(new_bars):
+                    stored = stored[stored["date"] < new_bars["date"][0]]
+                bars = np.concatenate([stored, new_bars])
+            else:
+                last_date = None
+                bars = new_bars
+
+            # Write to a temporary file and rename so readers never see a partial series
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    np.save(handle, bars)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            self._empty_marker(symbol).unlink(missing_ok=True)
+
+        return int(np.sum(new_bars["date"] > last_date)) if last_date is not None else len(new_bars)
@@ -0,0 +1,231 @@
+"""
+Rate-Limited, Retrying Gateway to the Market Data Provider
+
+Every upstream request goes through one ProviderGateway, which applies:
+
+- a token bucket (MARKET_DATA_RATE_LIMIT_PER_SECOND, MARKET_DATA_RATE_BURST)
+  per request, rather than one throttle slot for a whole indicator method
+- a cap on concurrent upstream requests (MARKET_DATA_MAX_CONCURRENT_REQUESTS)
+- retries with exponential backoff and full jitter, except after a timeout:
+  the timed-out call keeps its fetch pool thread until the provider returns,
+  so retrying a hung provider would only fill the pool
+- a circuit breaker that fails fast for MARKET_DATA_CIRCUIT_RESET_SECONDS after
+  MARKET_DATA_CIRCUIT_FAILURE_THRESHOLD consecutive failed requests (a request
+  fails once its retries are exhausted), then lets one trial request through
+- merging of identical in-flight requests, so callers asking for the same
+  symbols and window at the same time share one upstream call
+
+An empty result is the provider's answer (no data for those symbols), not a
+failure. Only exceptions and timeouts are retried and counted by the breaker.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, List, Optional
+import pandas as pd
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the provider while the circuit is open"""
+
+
+class TokenBucket:
+    """
+    Async token bucket: rate tokens per second, holding at most burst
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait for a token (callers are served in arrival order)"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with a single half-open trial
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_seconds:
+            return "open"
+        return "half-open"
+
+    def before_request(self) -> bool:
+        """
+        Returns:
+            True when this request is the half-open trial (the caller must call
+            end_trial once it finishes, however it finishes)
+
+        Raises:
+            CircuitOpenError: While open, or while the half-open trial is running
+        """
+        state = self.state
+        if state == "open" or (state == "half-open" and self._trial_running):
+            raise CircuitOpenError("Market data provider circuit is open")
+        if state == "half-open":
+            self._trial_running = True
+            return True
+        return False
+
+    def end_trial(self):
+        """Let another trial through after one ended without an outcome (e.g. cancelled)"""
+        self._trial_running = False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info("✅ Market data provider circuit closed")
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        reopen = self._trial_running
+        self._trial_running = False
+        if reopen or (self.opened_at is None and self.failures >= self.failure_threshold):
+            self.opened_at = time.monotonic()
+            logger.warning(f"🚫 Market data provider circuit open for {self.reset_seconds:.0f}s "
+                           f"after {self.failures} consecutive failures")
+
+
+class ProviderGateway:
+    """
+    Single entry point for upstream market data requests
+    """
+
+    def __init__(self, run: Callable[..., Any], provider: Callable[[], Any]):
+        """
+        Args:
+            run: Coroutine function running a blocking call off the event loop
+                with a timeout (run_fetch)
+            provider: Returns the current MarketDataProvider
+        """
+        self._run = run
+        self._provider = provider
+        self.bucket = TokenBucket(settings.MARKET_DATA_RATE_LIMIT_PER_SECOND, settings.MARKET_DATA_RATE_BURST)
+        self.breaker = CircuitBreaker(
+            settings.MARKET_DATA_CIRCUIT_FAILURE_THRESHOLD, settings.MARKET_DATA_CIRCUIT_RESET_SECONDS
+        )
+        self.retries = settings.MARKET_DATA_RETRIES
+        self.backoff = settings.MARKET_DATA_RETRY_BACKOFF_SECONDS
+        self.max_backoff = settings.MARKET_DATA_RETRY_MAX_BACKOFF_SECONDS
+        self._semaphore = asyncio.Semaphore(settings.MARKET_DATA_MAX_CONCURRENT_REQUESTS)
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.requests = 0
+        self.retried = 0
+        self.failed = 0
+        self.rejected = 0
+        self.merged = 0
+
+    async def download_closes(
+        self, symbols: List[str], period: Optional[str] = None, start: Optional[date] = None
+    ) -> pd.DataFrame:
+        """
+        Bulk closes through the limiter, merged with an identical request in flight
+
+        Raises:
+            CircuitOpenError: While the provider circuit is open
+            Exception: The provider's last error once retries are exhausted
+        """
+        key = ("download_closes", tuple(symbols), period, start)
+        return await self._merged(
+            key, lambda: self._request(lambda: self._provider().download_closes, symbols, period=period, start=start)
+        )
+
+    async def _merged(self, key: Hashable, request: Callable[[], Any]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.merged += 1
+        return await asyncio.shield(task)
+
+    async def _request(self, method: Callable[[], Callable[..., Any]], *args, **kwargs) -> Any:
+        try:
+            trial = self.breaker.before_request()
+        except CircuitOpenError:
+            self.rejected += 1
+            raise
+
+        try:
+            result = await self._attempts(method, *args, **kwargs)
+        except Exception:
+            self.failed += 1
+            self.breaker.record_failure()
+            raise
+        else:
+            self.breaker.record_success()
+            return result
+        finally:
+            if trial:
+                self.breaker.end_trial()
+
+    async def _attempts(self, method: Callable[[], Callable[..., Any]], *args, **kwargs) -> Any:
+        """One request: the first attempt plus up to self.retries retries"""
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._semaphore:
+                    await self.bucket.acquire()
+                    self.requests += 1
+                    return await self._run(method(), *args, **kwargs)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Provider request timed out, not retrying")
+                raise
+            except Exception as e:
+                if attempt == self.retries:
+                    raise
+                # Full jitter: uniform over the exponential backoff window
+                delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                self.retried += 1
+                logger.warning(f"⚠️ Provider request failed ({e!r}), retry {attempt + 1}/{self.retries} "
+                               f"in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Gateway counters for monitoring"""
+        return {
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "tokens": round(min(self.bucket.burst, self.bucket.tokens), 2),
+            "inflight": len(self._inflight),
+            "requests": self.requests,
+            "retried": self.retried,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "merged": self.merged,
+        }
@@ -0,0 +1,107 @@
+"""
+Vectorized Risk Analytics for Simulated Projection Paths
+
+Array kernels that compute performance and risk statistics for every simulated
+path (and grid cell) at once. Inputs follow the Monte Carlo engine's layout:
+paths x months, optionally with a trailing grid cell axis.
+"""
+
+import logging
+from typing import Dict, Sequence
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MONTH_AXIS = 1
+VAR_LEVELS = (0.95, 0.99)
+
+
+def sharpe_ratios(series: np.ndarray, risk_free_rate: float) -> np.ndarray:
+    """
+    Annualized Sharpe ratio of month-over-month changes, per path
+
+    Months whose starting value is not positive have no meaningful return and
+    are ignored; paths without any valid return (or zero dispersion) get 0.
+    """
+    previous = series[:, :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(previous > 0, np.diff(series, axis=MONTH_AXIS) / previous, np.nan)
+        valid = np.isfinite(returns)
+        counts = valid.sum(axis=MONTH_AXIS)
+        mean = np.where(valid, returns, 0).sum(axis=MONTH_AXIS) / counts
+        variance = np.where(valid, (returns - np.expand_dims(mean, MONTH_AXIS)) ** 2, 0).sum(axis=MONTH_AXIS) / counts
+        std = np.sqrt(variance)
+        sharpe = (mean * 12 - risk_free_rate) / (std * np.sqrt(12))
+    return np.where((counts > 0) & (std > 0), sharpe, 0.0)
+
+
+def max_drawdowns(series: np.ndarray) -> np.ndarray:
+    """
+    Maximum peak-to-trough decline relative to the running peak, per path
+
+    Drawdowns are only measured while the running peak is positive.
+    """
+    peaks = np.maximum.accumulate(series, axis=MONTH_AXIS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(peaks > 0, (peaks - series) / peaks, 0.0)
+    return drawdowns.max(axis=MONTH_AXIS)
+
+
+def value_at_risk(values: np.ndarray, level: float = 0.95) -> np.ndarray:
+    """
+    Outcome at the (1 - level) quantile across paths: the value that outcomes
+    fall below with probability 1 - level
+    """
+    return np.quantile(values, 1 - level, axis=0)
+
+
+def conditional_value_at_risk(values: np.ndarray, level: float = 0.95) -> np.ndarray:
+    """Expected outcome across paths in the tail at or below the VaR"""
+    var = value_at_risk(values, level)
+    tail = values <= var
+    return np.where(tail, values, 0).sum(axis=0) / np.maximum(tail.sum(axis=0), 1)
+
+
+def breach_probability(series: np.ndarray, floor: float) -> np.ndarray:
+    """Share of paths that fall below the floor in at least one month"""
+    return (series < floor).any(axis=MONTH_AXIS).mean(axis=0)
+
+
+def distribution_summary(values: np.ndarray, percentiles=(5, 25, 50, 75, 95)) -> Dict[str, float]:
+    """Mean and percentiles of a per-path statistic"""
+    summary = {"mean": float(np.mean(values))}
+    for p, value in zip(percentiles, np.percentile(values, percentiles)):
+        summary[f"p{p}"] = float(value)
+    return summary
+
+
+def tail_risk_analytics(
+    paths: Dict[str, np.ndarray], risk_free_rate: float, covenant_ebitda_floor: float = 0.0,
+    levels: Sequence[float] = VAR_LEVELS
+) -> Dict:
+    """
+    Tail statistics across all simulated paths of one scenario
+
+    VaR/CVaR are measured on horizon-total EBITDA and cash flow per path;
+    drawdown and Sharpe distributions on the monthly EBITDA series.
+    """
+    totals = {
+        "ebitda": paths["ebitda"].sum(axis=MONTH_AXIS),
+        "cash_flow": paths["cashFlow"].sum(axis=MONTH_AXIS),
+    }
+
+    var_cvar = {}
+    for metric, values in totals.items():
+        for level in levels:
+            label = f"{int(round(level * 100))}"
+            var_cvar[f"{metric}_var_{label}"] = float(value_at_risk(values, level))
+            var_cvar[f"{metric}_cvar_{label}"] = float(conditional_value_at_risk(values, level))
+
+    return {
+        "horizon_totals": {f"{metric}_median": float(np.median(values)) for metric, values in totals.items()},
+        **var_cvar,
+        "covenant_ebitda_floor": covenant_ebitda_floor,
+        "covenant_breach_probability": float(breach_probability(paths["ebitda"], covenant_ebitda_floor)),
+        "max_drawdown_distribution": distribution_summary(max_drawdowns(paths["ebitda"])),
+        "sharpe_ratio_distribution": distribution_summary(sharpe_ratios(paths["ebitda"], risk_free_rate)),
+    }
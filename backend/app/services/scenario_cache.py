@@ -0,0 +1,52 @@
+"""
+Scenario Result Cache
+
+Caches simulated scenarios keyed by a hash of everything that determines the
+result: base revenue, scenario parameters, the market context snapshot, the
+requested seed and the simulation options (path count, horizon, models).
+Entries expire when the market data behind them is due for refresh, so polling
+dashboards are served from memory until the inputs can actually change.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Dict
+
+from ..core.config import settings
+from .cache import BoundedTTLCache
+from .market_data import SCENARIO_PARAMETER_CACHE_KEYS, market_data_service
+
+logger = logging.getLogger(__name__)
+
+scenario_cache = BoundedTTLCache(
+    "scenario",
+    max_bytes=settings.SCENARIO_CACHE_MAX_BYTES,
+    default_ttl=settings.SCENARIO_CACHE_MIN_TTL_SECONDS
+)
+
+
+def scenario_cache_key(scenario_config: Dict, base_revenue: float, market_context: Dict, options: Dict) -> str:
+    """
+    Hash the inputs of one scenario simulation
+
+    options must carry the seed as requested (None for "any seed"), not the
+    resolved one, so unseeded polling requests share a cache entry.
+    """
+    payload = {
+        "base_revenue": base_revenue,
+        "type": scenario_config["type"],
+        "params": scenario_config["params"],
+        "market_context": market_context,
+        "options": options,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def scenario_cache_ttl() -> float:
+    """Time until the market data behind the scenario parameters refreshes"""
+    return max(
+        settings.SCENARIO_CACHE_MIN_TTL_SECONDS,
+        market_data_service.seconds_until_expiry(SCENARIO_PARAMETER_CACHE_KEYS)
+    )
@@ -0,0 +1,251 @@
+"""
+Bulk Persistence of Generated Scenarios
+
+Writes engine scenarios into model_scenarios / model_projections so later reads
+(e.g. /financial-metrics/scenarios) are plain database reads instead of a
+re-simulation. Rows are written with batched multi-row INSERT ... ON CONFLICT DO
+UPDATE statements (upserting projections on unique_scenario_date) rather than
+one ORM object per projection, so thousands of rows take milliseconds.
+
+The "packed" storage layout writes one model_projection_series row per scenario
+instead, holding all projection series and percentile bands as float64 blobs;
+load_projection_arrays reads them back as NumPy arrays with np.frombuffer,
+without materializing a row (or a Decimal) per month.
+"""
+
+import logging
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional
+import numpy as np
+
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..core.database import SessionLocal
+from ..models.financial import ModelProjection, ModelProjectionSeries, ModelScenario
+from ..models.organization import Organization
+from .monte_carlo import PROJECTION_METRICS
+
+logger = logging.getLogger(__name__)
+
+PERSIST_BATCH_ROWS = 1000
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+STORAGE_LAYOUTS = ("rows", "packed")
+STORAGE_PATTERN = f"^({'|'.join(STORAGE_LAYOUTS)})$"
+# Fixed little-endian float64 so blobs read back the same on any host
+PACKED_DTYPE = np.dtype("<f8")
+
+
+def projection_month(start: date, month: int) -> datetime:
+    """First day of the month `month` months after the start month"""
+    year, month_index = divmod(start.month - 1 + month, 12)
+    return datetime(start.year + year, month_index + 1, 1)
+
+
+def persisted_scenario_id(scenario: Dict, organization_id: str) -> str:
+    return f"enhanced-{organization_id}-{scenario['type']}"
+
+
+def pack_array(values) -> bytes:
+    return np.ascontiguousarray(values, dtype=PACKED_DTYPE).tobytes()
+
+
+def unpack_array(blob: bytes, shape) -> np.ndarray:
+    """Read-only float64 view over a packed blob (no copy)"""
+    return np.frombuffer(blob, dtype=PACKED_DTYPE).reshape(shape)
+
+
+def projection_series_row(scenario: Dict, scenario_id: str, start: date) -> Dict:
+    """model_projection_series row packing a scenario's projections and fan bands"""
+    projections = scenario["projections"]
+    data = np.array([[projection[metric] for projection in projections] for metric in PROJECTION_METRICS])
+
+    row = {
+        "id": scenario_id,
+        "startDate": projection_month(start, 1),
+        "months": len(projections),
+        "metrics": ",".join(PROJECTION_METRICS),
+        "data": pack_array(data),
+        "bandMetrics": None,
+        "bandPercentiles": None,
+        "bands": None,
+        "scenarioId": scenario_id,
+    }
+
+    bands = scenario.get("bands")
+    if bands:
+        band_metrics = list(bands)
+        labels = list(bands[band_metrics[0]])
+        row.update({
+            "bandMetrics": ",".join(band_metrics),
+            "bandPercentiles": ",".join(labels),
+            "bands": pack_array([[bands[metric][label] for label in labels] for metric in band_metrics]),
+        })
+    return row
+
+
+def unpack_projection_series(series: ModelProjectionSeries) -> Dict:
+    """
+    NumPy view of a packed projection series
+
+    Returns:
+        dates (datetime64[M]), one array per projection metric and
+        bands[metric][percentile label] arrays when bands were stored
+    """
+    metrics = series.metrics.split(",")
+    data = unpack_array(series.data, (len(metrics), series.months))
+    arrays = {
+        "dates": np.datetime64(series.start_date.strftime("%Y-%m"), "M") + np.arange(series.months),
+        **dict(zip(metrics, data)),
+        "bands": {},
+    }
+
+    if series.bands is not None:
+        band_metrics = series.band_metrics.split(",")
+        labels = series.band_percentiles.split(",")
+        bands = unpack_array(series.bands, (len(band_metrics), len(labels), series.months))
+        arrays["bands"] = {
+            metric: dict(zip(labels, metric_bands)) for metric, metric_bands in zip(band_metrics, bands)
+        }
+    return arrays
+
+
+def load_projection_arrays(db: Session, scenario_id: str) -> Optional[Dict]:
+    """Packed projections of a scenario as NumPy arrays, or None when not stored packed"""
+    series = db.query(ModelProjectionSeries).filter(ModelProjectionSeries.scenario_id == scenario_id).first()
+    return unpack_projection_series(series) if series is not None else None
+
+
+def _upsert(db: Session, table, rows: List[Dict], conflict_columns: List[str]):
+    """Batched executemany upsert of plain row dicts keyed by column name"""
+    if not rows:
+        return
+    insert = UPSERT_DIALECTS[db.get_bind().dialect.name]
+    statement = insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={column: statement.excluded[column] for column in rows[0] if column not in conflict_columns}
+    )
+    for start in range(0, len(rows), PERSIST_BATCH_ROWS):
+        db.execute(statement, rows[start:start + PERSIST_BATCH_ROWS])
+
+
+def persist_scenarios(
+    db: Session, scenarios: List[Dict], organization_id: Optional[str] = None, start: Optional[date] = None,
+    storage: str = "rows"
+) -> Dict:
+    """
+    Upsert scenarios and their median-path projections
+
+    Projections are dated on month starts counted from the month after `start`
+    (default: today), so re-persisting a scenario replaces its rows in place;
+    rows beyond a shortened horizon are removed. With storage="packed" each
+    scenario gets one model_projection_series row (including its fan bands)
+    instead of a row per month. A scenario is kept in one layout only, so
+    switching layouts removes the other representation.
+
+    Returns:
+        Persisted scenario ids, projection count, storage layout and elapsed milliseconds
+
+    Raises:
+        ValueError: When there is no organization to attach the scenarios to,
+            the storage layout is unknown or the database dialect has no upsert support
+    """
+    if storage not in STORAGE_LAYOUTS:
+        raise ValueError(f"storage must be one of {STORAGE_LAYOUTS}, got '{storage}'")
+    if db.get_bind().dialect.name not in UPSERT_DIALECTS:
+        raise ValueError(f"Bulk scenario upsert is not supported on {db.get_bind().dialect.name}")
+
+    if organization_id is None:
+        organization = db.query(Organization).first()
+        if organization is None:
+            raise ValueError("No organization to persist scenarios for")
+        organization_id = organization.id
+
+    begin = time.perf_counter()
+    start = start or date.today()
+
+    scenario_rows, projection_rows, series_rows = [], [], []
+    horizons = {}
+    for scenario in scenarios:
+        scenario_id = persisted_scenario_id(scenario, organization_id)
+        scenario_rows.append({
+            "id": scenario_id,
+            "name": scenario["name"],
+            "type": scenario["type"],
+            "description": scenario["description"],
+            "revenueGrowth": scenario["revenueGrowth"],
+            "marginImprovement": scenario["marginImprovement"],
+            "workingCapitalDays": scenario["workingCapitalDays"],
+            "capexAsPercentRevenue": scenario["capexAsPercentRevenue"],
+            "organizationId": organization_id,
+        })
+
+        horizons[scenario_id] = projection_month(start, len(scenario["projections"]))
+        if storage == "packed":
+            series_rows.append(projection_series_row(scenario, scenario_id, start))
+            continue
+
+        for month, projection in enumerate(scenario["projections"]):
+            month_start = projection_month(start, month + 1)
+            projection_rows.append({
+                "id": f"{scenario_id}-{month_start:%Y-%m}",
+                "date": month_start,
+                **{metric: projection[metric] for metric in PROJECTION_METRICS},
+                "scenarioId": scenario_id,
+            })
+
+    projections = ModelProjection.__table__
+    series = ModelProjectionSeries.__table__
+    try:
+        _upsert(db, ModelScenario.__table__, scenario_rows, ["id"])
+        if storage == "packed":
+            _upsert(db, series, series_rows, ["scenarioId"])
+            db.execute(delete(projections).where(projections.c.scenarioId.in_(list(horizons))))
+        else:
+            _upsert(db, projections, projection_rows, ["scenarioId", "date"])
+            for scenario_id, last_month in horizons.items():
+                db.execute(delete(projections).where(
+                    projections.c.scenarioId == scenario_id,
+                    projections.c.date > last_month
+                ))
+            db.execute(delete(series).where(series.c.scenarioId.in_(list(horizons))))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    elapsed_ms = (time.perf_counter() - begin) * 1000
+    projection_count = sum(len(scenario["projections"]) for scenario in scenarios)
+    logger.info(f"💾 Persisted {len(scenario_rows)} scenarios / {projection_count} projections "
+                f"({storage}) in {elapsed_ms:.1f} ms")
+    return {
+        "scenario_ids": list(horizons),
+        "projections": projection_count,
+        "storage": storage,
+        "elapsed_ms": round(elapsed_ms, 1),
+    }
+
+
+def persist_scenarios_in_new_session(scenarios: List[Dict], storage: str = "rows") -> Dict:
+    """persist_scenarios on a session of its own, for background jobs"""
+    db = SessionLocal()
+    try:
+        return persist_scenarios(db, scenarios, storage=storage)
+    finally:
+        db.close()
+
+
+def with_persistence(scenarios: List[Dict], persistence: Dict) -> List[Dict]:
+    """Copies of the (possibly cached) scenarios annotated with where they were persisted"""
+    return [
+        {**scenario, "persisted": {
+            "scenarioId": scenario_id,
+            "projections": len(scenario["projections"]),
+            "storage": persistence["storage"],
+            "elapsed_ms": persistence["elapsed_ms"],
+        }}
+        for scenario, scenario_id in zip(scenarios, persistence["scenario_ids"])
+    ]
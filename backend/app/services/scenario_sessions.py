@@ -0,0 +1,138 @@
+"""
+Interactive Scenario Sessions with Incremental Recomputation
+
+A session keeps one scenario's random draws and intermediate path arrays in
+memory. When an analyst changes an assumption only the stages downstream of
+that parameter are recomputed - nudging margin_improvement re-derives the
+financials but leaves the revenue paths untouched - which keeps what-if
+editing interactive on large path counts.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Dict, List, Optional
+import numpy as np
+
+from ..core.config import settings
+from .cache import BoundedTTLCache
+from .monte_carlo import compute_financials, draw_shocks, factor_count, simulate_revenue, simulate_volatility
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in execution order and the scenario parameters each one reads
+STAGE_ORDER = ("volatility", "revenue", "financials")
+STAGE_PARAMETERS = {
+    "volatility": {"volatility_factor"},
+    "revenue": {"revenue_growth", "market_correlation"},
+    "financials": {"margin_improvement"},
+}
+SESSION_PARAMETERS = set().union(*STAGE_PARAMETERS.values())
+
+
+class ScenarioSession:
+    """
+    One scenario's shocks and stage outputs, recomputed stage by stage
+    """
+
+    def __init__(
+        self, scenario_config: Dict, base_revenue: float, market_context: Dict, options: Dict,
+        seed_sequence: np.random.SeedSequence
+    ):
+        self.id = uuid.uuid4().hex
+        self.scenario_config = {**scenario_config, "params": dict(scenario_config["params"])}
+        self.base_revenue = base_revenue
+        self.market_context = market_context
+        self.options = options
+        self.stream = int(seed_sequence.spawn_key[-1]) if seed_sequence.spawn_key else 0
+        self.lock = asyncio.Lock()
+
+        rng = np.random.default_rng(seed_sequence)
+        self.shocks = draw_shocks(
+            rng, options["n_paths"], options["horizon_months"], options["sampler"], factor_count(market_context)
+        )
+        self.volatility_shock: Optional[np.ndarray] = None
+        self.revenue_state: Optional[Dict[str, np.ndarray]] = None
+        self.paths: Optional[Dict[str, np.ndarray]] = None
+        self.last_timings: Dict[str, float] = {}
+
+        self.recompute(STAGE_ORDER[0])
+
+    @property
+    def params(self) -> Dict:
+        return self.scenario_config["params"]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the session's arrays, each counted once"""
+        arrays = [*self.shocks.values(), self.volatility_shock]
+        arrays += [*(self.revenue_state or {}).values(), *(self.paths or {}).values()]
+        # Stages hand arrays on (paths["revenue"] is revenue_state["revenue"]), so dedupe by identity
+        retained = {id(array): array for array in arrays if isinstance(array, np.ndarray)}
+        return sum(array.nbytes for array in retained.values())
+
+    def update(self, changes: Dict[str, float]) -> List[str]:
+        """
+        Apply parameter changes and recompute only the affected stages
+
+        Returns:
+            Names of the stages that were recomputed
+
+        Raises:
+            ValueError: On parameters a session cannot change
+        """
+        unknown = set(changes) - SESSION_PARAMETERS
+        if unknown:
+            raise ValueError(f"Unsupported session parameters: {', '.join(sorted(unknown))} "
+                             f"(expected any of {', '.join(sorted(SESSION_PARAMETERS))})")
+
+        changed = {name for name, value in changes.items() if self.params.get(name) != value}
+        self.params.update(changes)
+
+        first_stage = next((stage for stage in STAGE_ORDER if STAGE_PARAMETERS[stage] & changed), None)
+        if first_stage is None:
+            self.last_timings = {}
+            return []
+        return self.recompute(first_stage)
+
+    def recompute(self, from_stage: str) -> List[str]:
+        """Rerun the pipeline from the given stage onwards"""
+        stages = list(STAGE_ORDER[STAGE_ORDER.index(from_stage):])
+        timings = {}
+
+        for stage in stages:
+            start = time.perf_counter()
+            if stage == "volatility":
+                self.volatility_shock = simulate_volatility(
+                    self.shocks, self.params, self.market_context,
+                    self.options["volatility_model"], self.options["volatility_params"]
+                )
+            elif stage == "revenue":
+                self.revenue_state = simulate_revenue(
+                    self.shocks, self.params, self.market_context, self.base_revenue,
+                    volatility_shock=self.volatility_shock
+                )
+            else:
+                self.paths = compute_financials(
+                    self.revenue_state, self.shocks, self.params, self.market_context, self.base_revenue
+                )
+            timings[stage] = (time.perf_counter() - start) * 1000
+
+        self.last_timings = timings
+        logger.info(f"♻️ Session {self.id[:8]}: recomputed {', '.join(stages)} "
+                    f"in {sum(timings.values()):.1f} ms")
+        return stages
+
+
+# Sessions are evicted least-recently-used once their arrays exceed the memory budget
+scenario_sessions = BoundedTTLCache(
+    "scenario-session",
+    max_bytes=settings.SCENARIO_SESSION_MAX_BYTES,
+    default_ttl=settings.SCENARIO_SESSION_TTL_SECONDS
+)
+
+
+def store_session(session: ScenarioSession):
+    """Store (or touch) a session, refreshing its idle timeout"""
+    scenario_sessions.set(session.id, session, size=session.nbytes)
@@ -0,0 +1,58 @@
+"""
+Process Pool for CPU-bound Scenario Simulation
+
+Monte Carlo scenario generation is pure NumPy work. Running it on the uvicorn
+event loop stalls every other request, so simulations are dispatched to a shared
+process pool sized by MODELING_PROCESS_WORKERS. With the setting at 0 the work
+falls back to the loop's default thread executor, which still keeps the event
+loop free for I/O-bound endpoints.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared simulation process pool, creating it on first use"""
+    global _process_pool
+
+    if _process_pool is None and settings.MODELING_PROCESS_WORKERS > 0:
+        logger.info(f"⚙️ Starting simulation process pool ({settings.MODELING_PROCESS_WORKERS} workers)")
+        # Spawn rather than fork: the API process runs an event loop and threads
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.MODELING_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """Shut down the shared process pool (called from the app lifespan)"""
+    global _process_pool
+
+    if _process_pool is not None:
+        logger.info("🛑 Shutting down simulation process pool")
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def run_in_worker(fn: Callable[..., Any], *args) -> Any:
+    """
+    Run a CPU-bound function off the event loop
+
+    Args:
+        fn: Module-level (picklable) function to execute
+        *args: Picklable positional arguments
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), fn, *args)
@@ -0,0 +1,317 @@
+"""
+Cross-Process Shared Cache Tier
+
+Each uvicorn worker keeps its own in-memory market data cache. Without a
+shared tier, N workers each fetch the same panel and indicators and together
+use N times the provider rate limit. This tier sits behind the per-process
+cache: a worker that misses locally reads the shared entry before going
+upstream and publishes what it loads. A lease per key lets only one worker
+fetch while the others wait for its result. Waiting ends as soon as the lease
+is released, whether or not a value was published.
+
+Backends are selected by MARKET_DATA_SHARED_CACHE_URL:
+
+- sqlite:///path/to/file.db: a local SQLite file in WAL mode, shared by every
+  worker on the host (the default)
+- redis://host:port/db: a Redis-compatible server for multi-host deployments
+  (needs the optional redis package)
+- empty: disabled
+
+Values are stored compactly. Frames are stored as raw float64/int64 arrays in
+an npz container, and everything else as JSON. Dicts holding frames, such as
+indicator reports, store their frames the same way next to a JSON header. Shared-tier errors are logged
+and treated as misses, so an unavailable tier never fails a request.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FRAME_TAG = b"F"
+JSON_TAG = b"J"
+MIXED_TAG = b"M"  # Dict with frame values: JSON header, then the encoded frames
+LEASE_POLL_SECONDS = 0.1
+
+_shared_cache: Optional["SharedCache"] = None
+_shared_cache_lock = threading.Lock()
+
+
+def encode_value(value: Any) -> bytes:
+    """Serialize a cache value: frames as packed arrays, anything else as JSON"""
+    if isinstance(value, dict) and any(isinstance(item, pd.DataFrame) for item in value.values()):
+        frames = {key: encode_value(item) for key, item in value.items() if isinstance(item, pd.DataFrame)}
+        header = json.dumps({
+            "items": {key: item for key, item in value.items() if key not in frames},
+            "frames": [[key, len(blob)] for key, blob in frames.items()],
+        }).encode()
+        return MIXED_TAG + len(header).to_bytes(4, "little") + header + b"".join(frames.values())
+    if isinstance(value, pd.DataFrame):
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            # asi8 counts in the index's own unit, so normalize to the ns that decode_value reads
+            index=value.index.as_unit("ns").asi8 if isinstance(value.index, pd.DatetimeIndex) else np.array([]),
+            labels=np.array([str(label) for label in value.index]),
+            columns=np.array([str(column) for column in value.columns]),
+            values=value.to_numpy(dtype=float),
+            dated=np.array(isinstance(value.index, pd.DatetimeIndex)),
+        )
+        return FRAME_TAG + buffer.getvalue()
+    return JSON_TAG + json.dumps(value).encode()
+
+
+def decode_value(blob: bytes) -> Any:
+    """Inverse of encode_value"""
+    tag, payload = blob[:1], blob[1:]
+    if tag == JSON_TAG:
+        return json.loads(payload)
+    if tag == MIXED_TAG:
+        header_end = 4 + int.from_bytes(payload[:4], "little")
+        header = json.loads(payload[4:header_end])
+        value, offset = header["items"], header_end
+        for key, length in header["frames"]:
+            value[key] = decode_value(payload[offset:offset + length])
+            offset += length
+        return value
+    if tag != FRAME_TAG:
+        raise ValueError(f"Unknown shared cache value tag {tag!r}")
+
+    with np.load(io.BytesIO(payload)) as arrays:
+        if arrays["dated"]:
+            index = pd.DatetimeIndex(arrays["index"].astype("datetime64[ns]"))
+        else:
+            index = pd.Index(arrays["labels"].tolist())
+        return pd.DataFrame(arrays["values"], index=index, columns=arrays["columns"].tolist())
+
+
+class SharedCache(ABC):
+    """
+    Byte-valued key store with expiry and per-key leases, shared between processes
+    """
+
+    def __init__(self):
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    @abstractmethod
+    def get_bytes(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Stored bytes and seconds until expiry, or None"""
+
+    @abstractmethod
+    def set_bytes(self, key: str, blob: bytes, ttl: float):
+        """Store bytes for ttl seconds"""
+
+    @abstractmethod
+    def acquire_lease(self, key: str, seconds: float) -> bool:
+        """Take the key's lease unless another live owner holds it"""
+
+    @abstractmethod
+    def release_lease(self, key: str):
+        """Give up a lease this process holds"""
+
+    @abstractmethod
+    def lease_held(self, key: str) -> bool:
+        """Whether any owner holds a live lease on the key"""
+
+    async def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Shared value and seconds until expiry, or None (also on tier errors)"""
+        try:
+            hit = await asyncio.to_thread(self.get_bytes, key)
+            return (decode_value(hit[0]), hit[1]) if hit is not None else None
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache read of {key} failed: {e!r}")
+            return None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        """Publish a value (tier errors are logged, not raised)"""
+        try:
+            await asyncio.to_thread(self.set_bytes, key, encode_value(value), ttl)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache write of {key} failed: {e!r}")
+
+    async def acquire(self, key: str) -> bool:
+        """Take the lease for loading a key; True on tier errors so the caller loads itself"""
+        try:
+            return await asyncio.to_thread(self.acquire_lease, key, settings.MARKET_DATA_SHARED_LEASE_SECONDS)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache lease on {key} failed: {e!r}")
+            return True
+
+    async def release(self, key: str):
+        try:
+            await asyncio.to_thread(self.release_lease, key)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache lease release on {key} failed: {e!r}")
+
+    async def leased(self, key: str) -> bool:
+        """Whether another load of the key is in progress; False on tier errors"""
+        try:
+            return await asyncio.to_thread(self.lease_held, key)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache lease check on {key} failed: {e!r}")
+            return False
+
+    async def wait_for(self, key: str, min_fresh: float) -> Optional[Tuple[Any, float]]:
+        """
+        Poll for a value another process is loading
+
+        Returns None once the lease is released without a fresh value being
+        published (e.g. the load failed), or after the lease duration.
+        """
+        deadline = time.monotonic() + settings.MARKET_DATA_SHARED_LEASE_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LEASE_POLL_SECONDS)
+            # Values are published before the lease is released, so check the lease first
+            held = await self.leased(key)
+            hit = await self.get(key)
+            if hit is not None and hit[1] > min_fresh:
+                return hit
+            if not held:
+                return None
+        return None
+
+
+class SQLiteSharedCache(SharedCache):
+    """
+    Shared tier in a local SQLite file, for workers on one host
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS market_cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS market_cache_leases "
+                "(key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; calls arrive from asyncio.to_thread workers
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+        return connection
+
+    def get_bytes(self, key: str) -> Optional[Tuple[bytes, float]]:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM market_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        return (row[0], remaining) if remaining > 0 else None
+
+    def set_bytes(self, key: str, blob: bytes, ttl: float):
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT INTO market_cache (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+                (key, sqlite3.Binary(blob), time.time() + ttl)
+            )
+
+    def acquire_lease(self, key: str, seconds: float) -> bool:
+        now = time.time()
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "INSERT INTO market_cache_leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE market_cache_leases.expires_at <= ?",
+                (key, self.owner, now + seconds, now)
+            )
+            return cursor.rowcount == 1
+
+    def release_lease(self, key: str):
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM market_cache_leases WHERE key = ? AND owner = ?", (key, self.owner)
+            )
+
+    def lease_held(self, key: str) -> bool:
+        row = self._connection().execute(
+            "SELECT 1 FROM market_cache_leases WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row is not None
+
+
+class RedisSharedCache(SharedCache):
+    """
+    Shared tier on a Redis-compatible server, for workers across hosts
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        # Optional dependency, only needed for this backend
+        import redis
+        self.client = redis.Redis.from_url(url)
+
+    def get_bytes(self, key: str) -> Optional[Tuple[bytes, float]]:
+        pipeline = self.client.pipeline()
+        pipeline.get(f"market:{key}")
+        pipeline.pttl(f"market:{key}")
+        blob, remaining_ms = pipeline.execute()
+        return (blob, remaining_ms / 1000) if blob is not None and remaining_ms > 0 else None
+
+    def set_bytes(self, key: str, blob: bytes, ttl: float):
+        self.client.set(f"market:{key}", blob, px=max(1, int(ttl * 1000)))
+
+    def acquire_lease(self, key: str, seconds: float) -> bool:
+        return bool(self.client.set(f"market-lease:{key}", self.owner, nx=True, px=int(seconds * 1000)))
+
+    def release_lease(self, key: str):
+        lease_key = f"market-lease:{key}"
+        if self.client.get(lease_key) == self.owner.encode():
+            self.client.delete(lease_key)
+
+    def lease_held(self, key: str) -> bool:
+        return bool(self.client.exists(f"market-lease:{key}"))
+
+
+def build_shared_cache(url: str) -> Optional[SharedCache]:
+    """
+    Shared cache backend for a MARKET_DATA_SHARED_CACHE_URL
+
+    Raises:
+        ValueError: On an unsupported URL scheme
+    """
+    if not url:
+        return None
+    if url.startswith("sqlite:///"):
+        return SQLiteSharedCache(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://")):
+        return RedisSharedCache(url)
+    raise ValueError(f"Unsupported MARKET_DATA_SHARED_CACHE_URL '{url}' (sqlite:/// or redis://)")
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """Return the shared cache tier, or None when it is disabled"""
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None and settings.MARKET_DATA_SHARED_CACHE_URL:
+            _shared_cache = build_shared_cache(settings.MARKET_DATA_SHARED_CACHE_URL)
+            logger.info(f"🗄️ Shared market data cache: {settings.MARKET_DATA_SHARED_CACHE_URL}")
+
+    return _shared_cache
@@ -0,0 +1,187 @@
+"""
+In-Process Job Queue for Long-Running Simulations
+
+Large simulations (100k paths, long horizons, adaptive precision targets) can
+outlast HTTP timeouts. Jobs are submitted, polled for status and progress and
+fetched once finished, instead of holding a request open. Jobs run as asyncio
+tasks that dispatch the NumPy work to the simulation process pool, so neither
+request workers nor the event loop are tied up. A semaphore bounds how many
+jobs run at once; finished jobs are kept for a retention period and then expire.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+# A job body receives the job so it can report progress, and returns the result
+JobBody = Callable[["SimulationJob"], Awaitable[Any]]
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when too many jobs are already queued or running"""
+
+
+class SimulationJob:
+    """
+    One submitted simulation: status, progress, result and retention deadline
+    """
+
+    def __init__(self, kind: str, parameters: Dict):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.parameters = parameters
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = "Queued"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.expires_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def report_progress(self, fraction: float, message: Optional[str] = None):
+        """Record progress as a fraction of the work done (0-1)"""
+        self.progress = round(100 * min(max(fraction, 0.0), 1.0), 1)
+        if message:
+            self.message = message
+
+    def summary(self) -> Dict:
+        """Status view of the job, without the result"""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "parameters": self.parameters,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "expires_in_seconds": (
+                round(max(0.0, self.expires_at - time.monotonic()), 1) if self.expires_at else None
+            ),
+        }
+
+
+class SimulationJobQueue:
+    """
+    In-memory job store with bounded concurrency and result retention
+    """
+
+    def __init__(self, max_running: int, max_pending: int, retention_seconds: float):
+        self.max_running = max_running
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self._jobs: Dict[str, SimulationJob] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def submit(self, kind: str, parameters: Dict, body: JobBody) -> SimulationJob:
+        """
+        Queue a job; it starts as soon as a running slot is free
+
+        Raises:
+            JobQueueFullError: When max_pending jobs are already queued or running
+        """
+        self._purge_expired()
+        pending = sum(not job.finished for job in self._jobs.values())
+        if pending >= self.max_pending:
+            raise JobQueueFullError(f"{pending} simulation jobs are already queued or running")
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_running)
+
+        job = SimulationJob(kind, parameters)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, body))
+        logger.info(f"📥 Queued {kind} job {job.id[:8]} ({pending + 1} pending)")
+        return job
+
+    def get(self, job_id: str) -> Optional[SimulationJob]:
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[SimulationJob]:
+        self._purge_expired()
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    async def cancel(self, job_id: str) -> Optional[SimulationJob]:
+        """
+        Cancel a queued or running job and wait for it to settle
+
+        Simulations already executing in a worker process run to completion;
+        their results are discarded.
+        """
+        job = self.get(job_id)
+        if job is not None and not job.finished and job.task is not None:
+            job.task.cancel()
+            await asyncio.gather(job.task, return_exceptions=True)
+            if not job.finished:
+                # Cancelled before its task first ran, so _run never recorded the outcome
+                job.status = CANCELLED
+                job.message = "Cancelled"
+                job.finished_at = datetime.now()
+                job.expires_at = time.monotonic() + self.retention_seconds
+        return job
+
+    async def shutdown(self):
+        """Cancel every unfinished job (called from the app lifespan)"""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: SimulationJob, body: JobBody):
+        try:
+            async with self._slots:
+                job.status = RUNNING
+                job.started_at = datetime.now()
+                job.message = "Running"
+                logger.info(f"▶️ Started {job.kind} job {job.id[:8]}")
+
+                job.result = await body(job)
+                job.status = SUCCEEDED
+                job.report_progress(1.0, "Completed")
+
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+            job.message = "Cancelled"
+            logger.info(f"🛑 Cancelled {job.kind} job {job.id[:8]}")
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+            job.message = "Failed"
+            logger.error(f"❌ {job.kind} job {job.id[:8]} failed: {e}")
+        finally:
+            job.finished_at = datetime.now()
+            job.expires_at = time.monotonic() + self.retention_seconds
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        expired = [job_id for job_id, job in self._jobs.items() if job.expires_at is not None and job.expires_at <= now]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Global simulation job queue
+simulation_jobs = SimulationJobQueue(
+    max_running=settings.SIMULATION_JOB_MAX_RUNNING,
+    max_pending=settings.SIMULATION_JOB_MAX_PENDING,
+    retention_seconds=settings.SIMULATION_JOB_RETENTION_SECONDS
+)
@@ -0,0 +1,94 @@
+"""
+Market data endpoint load benchmark
+
+Drives the MarketDataService calls behind the /bloomberg/market-data/*
+endpoints in-process against the replay provider, so results are deterministic
+and need no network access. The service is called directly rather than through
+the app, so the benchmark does not need the database or the rest of the API to
+import. Each round clears the service cache first (cold) and then repeats the
+same requests against the warm cache, reporting latency percentiles.
+
+Capture a recording once with network access by running the API (or this
+benchmark with --provider record), then replay it offline.
+
+Usage (from the backend directory):
+    python -m benchmarks.market_data_endpoints --recordings data/recordings --latency-ms 80 --requests 200
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+import numpy as np
+
+# Service call behind each endpoint
+ENDPOINTS = {
+    "volatility": lambda service, symbols: service.get_market_volatility_report(symbols),
+    "regime": lambda service, symbols: service.get_market_regime_report(),
+    "risk-free-rate": lambda service, symbols: service.get_risk_free_rate_report(),
+    "sector-performance": lambda service, symbols: service.get_sector_performance_report(),
+}
+
+
+async def _timed_requests(service, symbols, names, concurrency: int) -> np.ndarray:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(name: str) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await ENDPOINTS[name](service, symbols)
+            return time.perf_counter() - start
+
+    return np.array(await asyncio.gather(*(request(name) for name in names)))
+
+
+def _report(label: str, latencies: np.ndarray, elapsed: float):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    print(f"  {label:<6} {len(latencies):6d} requests  {len(latencies) / elapsed:9.1f} req/s  "
+          f"p50 {p50:8.2f} ms  p95 {p95:8.2f} ms  p99 {p99:8.2f} ms")
+
+
+async def run(args):
+    from app.services.market_data import INDEX_SYMBOLS, market_data_service
+
+    names = [list(ENDPOINTS)[i % len(ENDPOINTS)] for i in range(args.requests)]
+    print(f"{args.provider} provider, {args.latency_ms:g} ms latency, concurrency {args.concurrency}")
+    for round_number in range(args.rounds):
+        market_data_service.cache.clear()
+        print(f"round {round_number + 1}")
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            latencies = await _timed_requests(market_data_service, INDEX_SYMBOLS, names, args.concurrency)
+            _report(label, latencies, time.perf_counter() - start)
+
+    stats = market_data_service.cache_stats()
+    print(f"cache: {stats['hits']} hits, {stats['misses']} misses, {stats['coalesced']} coalesced")
+    upstream = market_data_service.upstream_stats()
+    print(f"upstream: {upstream['requests']} requests, {upstream['merged']} merged, "
+          f"{upstream['retried']} retried, circuit {upstream['circuit']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", choices=["replay", "record"], default="replay")
+    parser.add_argument("--recordings", default="data/recordings")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    # Settings are read at import, so configure them before loading the app
+    os.environ["MARKET_DATA_PROVIDER"] = args.provider
+    os.environ["MARKET_DATA_RECORDING_DIR"] = args.recordings
+    os.environ["MARKET_DATA_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    # Every cold round goes to the provider
+    os.environ["MARKET_DATA_STORE_DIR"] = ""
+    os.environ["MARKET_DATA_SHARED_CACHE_URL"] = ""
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Sampler convergence benchmark
+
+Estimates how many paths each sampler (pseudo-random, antithetic, scrambled
+Sobol and Halton) needs to reach a target standard error on the statistics the
+scenario endpoints report: median and P5 terminal revenue and mean horizon
+EBITDA. Each sampler is replicated over independent seeds at several path
+counts; the standard error across replications is fitted as c * n^-b and
+solved for the path count that reaches each target relative error.
+
+Usage (from the backend directory):
+    python -m benchmarks.sampler_convergence --replications 20 --targets 0.001 0.0005
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.services.monte_carlo import SAMPLERS, simulate_paths, simulation_options
+
+BASE_REVENUE = 2500000
+SCENARIO_PARAMS = {
+    "revenue_growth": 0.15,
+    "volatility_factor": 0.20,
+    "market_correlation": 0.6,
+    "margin_improvement": 0.02,
+}
+MARKET_CONTEXT = {"regime": "SIDEWAYS", "market_volatility": 0.18, "risk_free_rate": 0.045}
+
+ESTIMATORS = {
+    "p50 terminal revenue": lambda paths: np.median(paths["revenue"][:, -1]),
+    "p5 terminal revenue": lambda paths: np.percentile(paths["revenue"][:, -1], 5),
+    "mean horizon ebitda": lambda paths: paths["ebitda"].sum(axis=1).mean(),
+}
+
+
+def replicate(sampler: str, n_paths: int, months: int, replications: int) -> np.ndarray:
+    """Estimator values (replications x estimators) over independent seeds"""
+    options = simulation_options(n_paths=n_paths, horizon_months=months, sampler=sampler)
+    results = np.empty((replications, len(ESTIMATORS)))
+    for replication in range(replications):
+        rng = np.random.default_rng(np.random.SeedSequence(replication))
+        paths = simulate_paths(SCENARIO_PARAMS, MARKET_CONTEXT, BASE_REVENUE, options, rng)
+        results[replication] = [estimator(paths) for estimator in ESTIMATORS.values()]
+    return results
+
+
+def paths_for_target(path_counts, relative_errors, target: float) -> float:
+    """Solve the fitted log-log convergence line for the target relative error"""
+    slope, intercept = np.polyfit(np.log(path_counts), np.log(relative_errors), 1)
+    return float(np.exp((np.log(target) - intercept) / slope))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paths", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--replications", type=int, default=20)
+    parser.add_argument("--targets", type=float, nargs="+", default=[0.001, 0.0005])
+    parser.add_argument("--samplers", nargs="+", default=list(SAMPLERS), choices=SAMPLERS)
+    args = parser.parse_args()
+
+    summary = {}
+    for sampler in args.samplers:
+        start = time.perf_counter()
+        relative_errors = []
+        for n_paths in args.paths:
+            values = replicate(sampler, n_paths, args.months, args.replications)
+            relative_errors.append(values.std(axis=0, ddof=1) / np.abs(values.mean(axis=0)))
+        summary[sampler] = (np.array(relative_errors), time.perf_counter() - start)
+
+    header = "".join(f"  se@{n:<8}" for n in args.paths)
+    header += "".join(f"  paths@{target:<7.2%}" for target in args.targets)
+    print(f"{args.replications} replications x {args.months} months (relative standard errors)")
+
+    for index, name in enumerate(ESTIMATORS):
+        print(f"\n{name}")
+        print(f"  {'sampler':<12}{header}")
+        for sampler, (relative_errors, _) in summary.items():
+            errors = relative_errors[:, index]
+            row = "".join(f"  {error:<11.4%}" for error in errors)
+            row += "".join(f"  {paths_for_target(args.paths, errors, target):<13,.0f}" for target in args.targets)
+            print(f"  {sampler:<12}{row}")
+
+    print("\nwall time per sampler")
+    for sampler, (_, elapsed) in summary.items():
+        print(f"  {sampler:<12}{elapsed:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
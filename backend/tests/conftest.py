@@ -0,0 +1,32 @@
+"""
+Shared test configuration
+
+Settings are read at import, so the environment is set before any app module
+loads: an in-memory SQLite database instead of Postgres, no on-disk price store
+or shared cache tier unless a test builds one itself, and simulations on the
+default thread executor rather than a process pool.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("MARKET_DATA_STORE_DIR", "")
+os.environ.setdefault("MARKET_DATA_SHARED_CACHE_URL", "")
+os.environ.setdefault("MARKET_DATA_REFRESH_ENABLED", "false")
+os.environ.setdefault("MODELING_PROCESS_WORKERS", "0")
+
+
+@pytest.fixture
+def scenario_params():
+    """Base case assumptions in the shape of get_enhanced_scenario_parameters"""
+    return {"revenue_growth": 0.15, "volatility_factor": 0.2, "market_correlation": 0.6,
+            "confidence_interval": 0.9, "margin_improvement": 0.02}
+
+
+@pytest.fixture
+def market_context():
+    """Single-factor sideways market context"""
+    return {"regime": "SIDEWAYS", "regime_confidence": 0.5, "market_volatility": 0.2,
+            "risk_free_rate": 0.045, "sector_rotation": {}}
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from app.services.cache import BoundedTTLCache
+
+
+def counting_loader(value="value", ttl=60.0, delay=0.05):
+    """Loader factory recording how many times it ran"""
+    calls = []
+
+    async def loader():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value, ttl
+
+    return loader, calls
+
+
+@pytest.fixture
+def cache():
+    return BoundedTTLCache("test", max_bytes=1024 * 1024)
+
+
+async def test_concurrent_misses_share_one_load(cache):
+    loader, calls = counting_loader()
+
+    results = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(10)))
+
+    assert results == ["value"] * 10
+    assert len(calls) == 1
+    assert cache.coalesced == 9
+    assert "key" in cache
+
+
+async def test_live_entry_is_served_without_loading(cache):
+    loader, calls = counting_loader()
+    await cache.get_or_load("key", loader)
+
+    assert await cache.get_or_load("key", loader) == "value"
+    assert len(calls) == 1
+
+
+async def test_zero_ttl_is_returned_but_not_cached(cache):
+    loader, calls = counting_loader(ttl=0)
+
+    assert await cache.get_or_load("key", loader) == "value"
+    assert await cache.get_or_load("key", loader) == "value"
+    assert len(calls) == 2
+    assert "key" not in cache
+
+
+async def test_failed_load_propagates_to_every_waiter_and_is_not_cached(cache):
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    results = await asyncio.gather(*(cache.get_or_load("key", failing) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert "key" not in cache
+    assert cache.stats()["inflight"] == 0
+
+
+async def test_cancelled_caller_does_not_cancel_shared_load(cache):
+    loader, calls = counting_loader(delay=0.05)
+    first = asyncio.create_task(cache.get_or_load("key", loader))
+    second = asyncio.create_task(cache.get_or_load("key", loader))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+
+    assert await second == "value"
+    assert len(calls) == 1
+
+
+async def test_expired_entry_is_reloaded_without_max_stale(cache):
+    cache.set("key", "old", ttl=0.01)
+    await asyncio.sleep(0.02)
+    loader, calls = counting_loader(value="new")
+
+    assert await cache.get_or_load("key", loader) == "new"
+    assert len(calls) == 1
+
+
+async def test_stale_entry_is_served_while_one_background_load_replaces_it(cache):
+    cache.set("key", "old", ttl=0.01)
+    await asyncio.sleep(0.02)
+    loader, calls = counting_loader(value="new", delay=0.05)
+
+    stale = await asyncio.gather(*(cache.get_or_load("key", loader, max_stale=60) for _ in range(5)))
+
+    assert stale == ["old"] * 5
+    assert cache.stale_hits == 5
+    await asyncio.sleep(0.1)
+    assert len(calls) == 1
+    assert await cache.get_or_load("key", loader, max_stale=60) == "new"
+
+
+async def test_entry_past_max_stale_waits_for_the_load(cache):
+    cache.set("key", "old", ttl=0.01)
+    await asyncio.sleep(0.05)
+    loader, _ = counting_loader(value="new")
+
+    assert await cache.get_or_load("key", loader, max_stale=0.02) == "new"
+
+
+async def test_failed_background_load_keeps_the_stale_entry(cache):
+    cache.set("key", "old", ttl=0.01)
+    await asyncio.sleep(0.02)
+
+    async def failing():
+        raise ConnectionError("down")
+
+    assert await cache.get_or_load("key", failing, max_stale=60) == "old"
+    await asyncio.sleep(0.01)
+    assert cache.peek("key", max_stale=60) == "old"
+
+
+async def test_refresh_reports_whether_the_entry_is_live(cache):
+    fresh, _ = counting_loader(value="new")
+    uncached, _ = counting_loader(value="fallback", ttl=0)
+
+    assert await cache.refresh("key", fresh) is True
+    assert cache.get("key") == "new"
+    cache.delete("key")
+    assert await cache.refresh("key", uncached) is False
+
+
+def test_lru_eviction_stays_within_budget():
+    cache = BoundedTTLCache("test", max_bytes=300)
+    for index in range(5):
+        cache.set(f"key-{index}", "x" * 50, size=100)
+
+    assert cache.current_bytes <= 300
+    assert "key-0" not in cache
+    assert "key-4" in cache
+    assert cache.evictions == 2
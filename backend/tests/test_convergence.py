@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from app.services.convergence import quantile_confidence_interval, simulate_until_converged
+from app.services.monte_carlo import simulation_options
+
+
+def adaptive_options(**overrides):
+    return simulation_options(n_paths=1000, horizon_months=12, **{"time_budget_seconds": 60.0, **overrides})
+
+
+def test_quantile_interval_brackets_the_median():
+    values = np.random.default_rng(0).standard_normal(10000)
+
+    lower, upper = quantile_confidence_interval(values, 0.5, 0.95)
+
+    assert lower < np.median(values) < upper
+    assert upper - lower == pytest.approx(2 * 1.96 * np.sqrt(np.pi / 2) / 100, rel=0.2)
+
+
+def test_loose_target_stops_before_max_paths(scenario_params, market_context):
+    options = adaptive_options(target_relative_error=0.05, max_paths=20000)
+
+    paths, report = simulate_until_converged(
+        scenario_params, market_context, 2.5e6, options, np.random.SeedSequence(1)
+    )
+
+    assert report["converged"]
+    assert report["stopped_by"] == "target"
+    assert report["achieved_relative_error"] <= 0.05
+    assert report["paths_used"] < 20000
+    assert paths["revenue"].shape == (report["paths_used"], 12)
+
+
+def test_unreachable_target_stops_at_the_path_cap(scenario_params, market_context):
+    options = adaptive_options(target_relative_error=1e-6, max_paths=3000)
+
+    paths, report = simulate_until_converged(
+        scenario_params, market_context, 2.5e6, options, np.random.SeedSequence(2)
+    )
+
+    assert not report["converged"]
+    assert report["stopped_by"] == "max_paths"
+    assert report["paths_used"] == 3000
+    assert report["batches"] > 1
+    assert paths["revenue"].shape == (3000, 12)
+
+
+def test_seeded_adaptive_runs_reproduce(scenario_params, market_context):
+    options = adaptive_options(target_relative_error=1e-6, max_paths=3000)
+
+    first, _ = simulate_until_converged(scenario_params, market_context, 2.5e6, options, np.random.SeedSequence(3))
+    second, _ = simulate_until_converged(scenario_params, market_context, 2.5e6, options, np.random.SeedSequence(3))
+
+    np.testing.assert_array_equal(first["revenue"], second["revenue"])
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from app.services import enhanced_modeling
+from app.services.enhanced_modeling import enhanced_modeling_engine
+from app.services.monte_carlo import simulation_options, spawn_streams
+
+
+@pytest.fixture(autouse=True)
+def market_params(monkeypatch, scenario_params, market_context):
+    """Fixed scenario parameters in place of the market data service"""
+    params = {
+        "base_case": scenario_params,
+        "bull_case": {**scenario_params, "revenue_growth": 0.3},
+        "bear_case": {**scenario_params, "revenue_growth": 0.0},
+        "market_context": market_context,
+    }
+
+    async def get_enhanced_scenario_parameters():
+        return params
+
+    monkeypatch.setattr(enhanced_modeling, "get_enhanced_scenario_parameters", get_enhanced_scenario_parameters)
+    return params
+
+
+async def simulate(**overrides):
+    options = simulation_options(n_paths=300, horizon_months=12, **overrides)
+    _, seed, tasks = await enhanced_modeling_engine._start_scenario_tasks(2.5e6, options, use_cache=False)
+    return seed, [await task for task in tasks]
+
+
+def undated(scenario):
+    """Scenario payload without the wall-clock projection dates"""
+    projections = [{k: v for k, v in row.items() if k != "date"} for row in scenario["projections"]]
+    return {**scenario, "projections": projections}
+
+
+def volatility_shocks(scenario):
+    return [row["volatility_shock"] for row in scenario["projections"]]
+
+
+def test_spawned_streams_are_deterministic_per_seed():
+    first, second = spawn_streams(7, 3), spawn_streams(7, 3)
+
+    draws = [np.random.default_rng(stream).random(4) for stream in first]
+    assert all(np.array_equal(a, np.random.default_rng(b).random(4)) for a, b in zip(draws, second))
+    assert not np.array_equal(draws[0], draws[1])
+
+
+async def test_same_seed_reproduces_the_scenario_payloads():
+    seed, first = await simulate(seed=11)
+    _, second = await simulate(seed=11)
+
+    assert seed == 11
+    assert [undated(s) for s in first] == [undated(s) for s in second]
+    assert [s["simulation"]["stream"] for s in first] == [0, 1, 2]
+
+
+async def test_unseeded_requests_report_a_seed_that_reproduces_them():
+    seed, first = await simulate()
+    _, second = await simulate(seed=seed)
+
+    assert all(s["simulation"]["seed"] == seed for s in first)
+    assert [undated(s) for s in first] == [undated(s) for s in second]
+
+
+async def test_common_random_numbers_share_draws_across_scenarios():
+    # Scenarios differ only in revenue_growth, so their volatility shocks come from the draws alone
+    _, independent = await simulate(seed=3)
+    _, shared = await simulate(seed=3, common_random_numbers=True)
+
+    assert volatility_shocks(independent[0]) != volatility_shocks(independent[1])
+    assert volatility_shocks(shared[0]) == volatility_shocks(shared[1]) == volatility_shocks(shared[2])
+    assert shared[0]["projections"][-1]["revenue"] != shared[1]["projections"][-1]["revenue"]
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import factor_model
+from app.services.factor_model import build_market_factors, factor_loadings, get_market_factors
+from app.services.market_data import INSUFFICIENT_DATA, UPSTREAM_UNAVAILABLE, indicator_report, market_data_service
+from app.services.monte_carlo import draw_shocks, factor_count, market_shocks
+
+SYMBOLS = ["SPY", "QQQ", "IWM"]
+CORRELATION = np.array([
+    [1.0, 0.8, 0.6],
+    [0.8, 1.0, 0.5],
+    [0.6, 0.5, 1.0],
+])
+VOLATILITIES = np.array([0.18, 0.24, 0.22])
+
+
+@pytest.fixture
+def market_reports(monkeypatch):
+    """Serve fixed correlation/volatility reports in place of the market data service"""
+    reports = {
+        "correlation": indicator_report(pd.DataFrame(CORRELATION, index=SYMBOLS, columns=SYMBOLS)),
+        "volatility": indicator_report(dict(zip(SYMBOLS, VOLATILITIES))),
+    }
+
+    async def get_correlation_matrix_report(symbols, period="1y"):
+        return reports["correlation"]
+
+    async def get_market_volatility_report(symbols, period="1y"):
+        return reports["volatility"]
+
+    monkeypatch.setattr(market_data_service, "get_correlation_matrix_report", get_correlation_matrix_report)
+    monkeypatch.setattr(market_data_service, "get_market_volatility_report", get_market_volatility_report)
+    factor_model.factor_model_cache.clear()
+    return reports
+
+
+def test_pca_loadings_are_scaled_leading_eigenvectors():
+    eigenvalues, eigenvectors = np.linalg.eigh(CORRELATION)
+
+    loadings, explained = factor_loadings(CORRELATION, "pca", 1)
+
+    assert loadings.shape == (3, 1)
+    np.testing.assert_allclose(np.abs(loadings[:, 0]), np.sqrt(eigenvalues[-1]) * np.abs(eigenvectors[:, -1]))
+    assert explained == pytest.approx(eigenvalues[-1] / 3)
+
+
+def test_full_pca_and_cholesky_reproduce_the_correlation():
+    for method in ("pca", "cholesky"):
+        loadings, explained = factor_loadings(CORRELATION, method, 3)
+        np.testing.assert_allclose(loadings @ loadings.T, CORRELATION, atol=1e-12)
+        assert explained == pytest.approx(1.0)
+
+
+def test_cholesky_repairs_an_indefinite_correlation():
+    indefinite = np.array([[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]])
+
+    loadings, _ = factor_loadings(indefinite, "cholesky", 3)
+
+    np.testing.assert_allclose(np.diag(loadings @ loadings.T), 1.0)
+
+
+def test_full_factor_exposure_matches_the_portfolio_volatility():
+    factors = build_market_factors(SYMBOLS, CORRELATION, VOLATILITIES, "cholesky", 3)
+
+    weighted = VOLATILITIES / 3
+    assert factors["volatility"] == pytest.approx(np.sqrt(weighted @ CORRELATION @ weighted))
+
+
+def test_market_shocks_default_to_the_single_market_shock(market_context):
+    shocks = draw_shocks(np.random.default_rng(0), 100, 12)
+
+    assert factor_count(market_context) == 0
+    np.testing.assert_array_equal(market_shocks(shocks, market_context), shocks["market"] * 0.2)
+
+
+def test_one_factor_at_market_volatility_reduces_to_the_single_shock(market_context):
+    single = draw_shocks(np.random.default_rng(1), 100, 12)
+    factored = {**single, "market": single["market"][..., np.newaxis]}
+    context = {**market_context, "market_factors": {"exposure": [0.2]}}
+
+    assert factor_count(context) == 1
+    np.testing.assert_allclose(market_shocks(factored, context), market_shocks(single, market_context))
+
+
+async def test_factor_model_from_market_data(market_reports):
+    factors = await get_market_factors("pca", SYMBOLS, 2)
+
+    assert factors["method"] == "pca"
+    assert factors["universe"] == SYMBOLS
+    assert len(factors["exposure"]) == 2
+    assert "fallbacks" not in factors
+
+
+async def test_default_correlations_fall_back_to_the_single_shock(market_reports):
+    # Provider down: identity correlations and flat 20% volatilities
+    unavailable = {symbol: UPSTREAM_UNAVAILABLE for symbol in SYMBOLS}
+    market_reports["correlation"] = indicator_report(
+        pd.DataFrame(np.eye(3), index=SYMBOLS, columns=SYMBOLS), unavailable
+    )
+    market_reports["volatility"] = indicator_report({symbol: 0.2 for symbol in SYMBOLS}, unavailable)
+
+    factors = await get_market_factors("cholesky", SYMBOLS)
+
+    assert factors["method"] == "single"
+    assert factors["requested_method"] == "cholesky"
+    assert factors["fallback"] == UPSTREAM_UNAVAILABLE
+    assert set(factors["fallbacks"]) == {"correlation", "volatility"}
+    assert factor_count({"market_factors": factors}) == 0
+
+
+async def test_symbols_without_history_drop_out_of_the_universe(market_reports):
+    market_reports["volatility"] = indicator_report(
+        dict(zip(SYMBOLS, VOLATILITIES)), {"IWM": INSUFFICIENT_DATA}
+    )
+
+    factors = await get_market_factors("pca", SYMBOLS, 3)
+
+    assert factors["universe"] == ["SPY", "QQQ"]
+    assert factors["fallbacks"] == {"volatility": {"IWM": INSUFFICIENT_DATA}}
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from app.services.monte_carlo import (
+    BAND_METRICS,
+    FAN_PERCENTILES,
+    PROJECTION_METRICS,
+    QMC_SAMPLERS,
+    SAMPLERS,
+    SHOCK_NAMES,
+    _quasi_random_shocks,
+    draw_shocks,
+    garch_volatility_shocks,
+    percentile_bands,
+    simulate_paths,
+    simulation_options,
+)
+
+
+def test_garch_long_run_variance_stays_bounded():
+    z = np.random.default_rng(0).standard_t(5, size=(20000, 120))
+    shocks = garch_volatility_shocks(z, 0.24, alpha=0.10, beta=0.85)
+
+    target_variance = (0.24 / 12) ** 2
+    assert np.all(np.isfinite(shocks))
+    assert shocks[:, -12:].var() == pytest.approx(target_variance, rel=0.1)
+
+
+@pytest.mark.parametrize("omega", [None, 1e-4])
+def test_non_stationary_garch_is_rejected(omega):
+    params = {"alpha": 0.5, "beta": 0.9, "omega": omega}
+
+    with pytest.raises(ValueError, match="alpha \\+ beta"):
+        simulation_options(volatility_model="garch", volatility_params=params)
+
+
+def test_explicit_omega_with_stationary_weights_is_accepted():
+    options = simulation_options(volatility_model="garch", volatility_params={"alpha": 0.05, "omega": 1e-4})
+
+    assert options["volatility_params"] == {"alpha": 0.05, "beta": 0.85, "omega": 1e-4}
+
+
+def test_simulate_paths_returns_paths_by_months(scenario_params, market_context):
+    options = simulation_options(n_paths=500, horizon_months=24)
+
+    paths = simulate_paths(scenario_params, market_context, 2.5e6, options, np.random.default_rng(1))
+
+    for metric in PROJECTION_METRICS + ("ebitdaMargin",):
+        assert paths[metric].shape == (500, 24)
+
+
+def test_percentile_bands_are_ordered(scenario_params, market_context):
+    options = simulation_options(n_paths=2000, horizon_months=36)
+    paths = simulate_paths(scenario_params, market_context, 2.5e6, options, np.random.default_rng(2))
+
+    bands = percentile_bands(paths)
+
+    assert set(bands) == set(BAND_METRICS)
+    for metric_bands in bands.values():
+        assert list(metric_bands) == [f"p{p}" for p in FAN_PERCENTILES]
+        stacked = np.stack(list(metric_bands.values()))
+        assert stacked.shape == (len(FAN_PERCENTILES), 36)
+        assert np.all(np.diff(stacked, axis=0) >= 0)
+
+
+def test_tail_draws_keep_revenue_positive(scenario_params, market_context):
+    # A volatile bear market at a high path count reaches the far t tails
+    params = {**scenario_params, "volatility_factor": 1.5}
+    bear = {**market_context, "regime": "BEAR", "market_volatility": 0.6}
+    options = simulation_options(n_paths=20000, horizon_months=60)
+
+    paths = simulate_paths(params, bear, 2.5e6, options, np.random.default_rng(3))
+
+    for metric in PROJECTION_METRICS:
+        assert not np.isnan(paths[metric]).any()
+    assert paths["revenue"].min() > 0
+
+
+def test_antithetic_pairs_mirror_each_other():
+    shocks = draw_shocks(np.random.default_rng(4), 1001, 12, "antithetic", n_factors=3)
+
+    assert shocks["market"].shape == (1001, 12, 3)
+    for values in shocks.values():
+        assert len(values) == 1001
+        np.testing.assert_array_equal(values[501:], -values[:500])
+
+
+@pytest.mark.parametrize("sampler", QMC_SAMPLERS)
+@pytest.mark.parametrize("n_factors", [0, 3])
+def test_quasi_random_shocks_have_standard_normal_moments(sampler, n_factors):
+    shocks = draw_shocks(np.random.default_rng(5), 4096, 12, sampler, n_factors)
+
+    assert shocks["market"].shape == ((4096, 12, n_factors) if n_factors else (4096, 12))
+    for name in ("market", "margin", "working_capital"):
+        assert shocks[name].shape[:2] == (4096, 12)
+        assert np.all(np.isfinite(shocks[name]))
+        assert shocks[name].mean() == pytest.approx(0, abs=0.01)
+        assert shocks[name].std() == pytest.approx(1, abs=0.02)
+    # Student t with 5 degrees of freedom has variance 5/3
+    assert shocks["volatility"].var() == pytest.approx(5 / 3, rel=0.05)
+
+
+@pytest.mark.parametrize("sampler", QMC_SAMPLERS)
+def test_quasi_random_shocks_take_any_path_count(sampler):
+    shocks = _quasi_random_shocks(np.random.default_rng(8), 1000, 7, sampler)
+
+    for values in shocks.values():
+        assert values.shape == (1000, 7)
+        assert np.all(np.isfinite(values))
+
+
+@pytest.mark.parametrize("sampler", SAMPLERS)
+def test_samplers_reproduce_their_draws_for_a_seed(sampler):
+    first = draw_shocks(np.random.default_rng(6), 512, 6, sampler, n_factors=2)
+    second = draw_shocks(np.random.default_rng(6), 512, 6, sampler, n_factors=2)
+    other = draw_shocks(np.random.default_rng(7), 512, 6, sampler, n_factors=2)
+
+    assert set(first) == set(SHOCK_NAMES)
+    for name in SHOCK_NAMES:
+        np.testing.assert_array_equal(first[name], second[name])
+        assert not np.array_equal(first[name], other[name])
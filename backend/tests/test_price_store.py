@@ -0,0 +1,84 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import market_data
+from app.services.price_store import PriceStore
+
+
+class FakeGateway:
+    """Returns rising closes for every requested symbol except those in `empty`"""
+
+    def __init__(self, empty=()):
+        self.empty = set(empty)
+        self.calls = []
+
+    async def download_closes(self, symbols, period=None, start=None):
+        self.calls.append((tuple(symbols), period, start))
+        index = pd.bdate_range("2026-01-01", periods=30)
+        return pd.DataFrame(
+            {symbol: np.arange(30.0) + 1 for symbol in symbols if symbol not in self.empty}, index=index
+        )
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = PriceStore(str(tmp_path))
+    monkeypatch.setattr(market_data, "get_price_store", lambda: store)
+    return store
+
+
+def age_files(directory, seconds):
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        os.utime(path, (time.time() - seconds,) * 2)
+
+
+def test_append_replaces_bars_from_the_first_new_date(tmp_path):
+    store = PriceStore(str(tmp_path))
+    index = pd.bdate_range("2026-01-01", periods=6)
+    store.append("SPY", pd.Series([1.0, 2, 3, 4, 5], index=index[:5]))
+
+    # Corrects the last two stored bars and adds one
+    new_bars = store.append("SPY", pd.Series([40.0, 50, 60], index=index[3:]))
+
+    closes = store.load("SPY")
+    assert new_bars == 1
+    assert closes.tolist() == [1.0, 2, 3, 40, 50, 60]
+
+
+async def test_symbol_without_data_does_not_keep_the_panel_stale(store):
+    gateway = FakeGateway(empty={"DEAD"})
+
+    panel = await market_data.load_price_panel(gateway, ["SPY", "DEAD"], "1y", max_age=300)
+    await market_data.load_price_panel(gateway, ["SPY", "DEAD"], "1y", max_age=300)
+
+    assert list(panel.columns) == ["SPY"]
+    assert len(gateway.calls) == 1
+    assert store.stale_symbols(["SPY", "DEAD"], 300) == []
+
+
+async def test_stale_symbols_are_topped_up_or_refetched(store, tmp_path):
+    gateway = FakeGateway(empty={"DEAD"})
+    await market_data.load_price_panel(gateway, ["SPY", "DEAD"], "1y", max_age=300)
+    age_files(tmp_path, 1000)
+
+    await market_data.load_price_panel(gateway, ["SPY", "DEAD"], "1y", max_age=300)
+
+    assert gateway.calls[1:] == [(("DEAD",), "1y", None), (("SPY",), None, pd.Timestamp("2026-02-11").date())]
+
+
+async def test_stored_closes_are_served_when_the_provider_fails(store, tmp_path):
+    await market_data.load_price_panel(FakeGateway(), ["SPY"], "1y", max_age=300)
+    age_files(tmp_path, 1000)
+
+    class DownGateway:
+        async def download_closes(self, symbols, period=None, start=None):
+            raise ConnectionError("down")
+
+    panel = await market_data.load_price_panel(DownGateway(), ["SPY"], "1y", max_age=300)
+
+    assert len(panel) == 30
@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.provider_gateway import CircuitBreaker, CircuitOpenError, ProviderGateway, TokenBucket
+
+
+class FakeProvider:
+    """Provider failing its first `failures` calls, optionally slow"""
+
+    def __init__(self, failures=0, error=ConnectionError("down")):
+        self.failures = failures
+        self.error = error
+        self.calls = []
+
+    def download_closes(self, symbols, period=None, start=None):
+        self.calls.append((tuple(symbols), period, start))
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        return {"symbols": list(symbols)}
+
+
+def make_gateway(provider, delay=0.0, retries=2, threshold=3, reset_seconds=0.2, timeout_after=None):
+    async def run(fn, *args, **kwargs):
+        if timeout_after is not None:
+            raise asyncio.TimeoutError()
+        await asyncio.sleep(delay)
+        return fn(*args, **kwargs)
+
+    gateway = ProviderGateway(run, lambda: provider)
+    gateway.bucket = TokenBucket(rate=1000, burst=100)
+    gateway.breaker = CircuitBreaker(threshold, reset_seconds)
+    gateway.retries = retries
+    gateway.backoff = 0.001
+    gateway.max_backoff = 0.002
+    return gateway
+
+
+async def test_identical_inflight_requests_are_merged():
+    provider = FakeProvider()
+    gateway = make_gateway(provider, delay=0.05)
+
+    results = await asyncio.gather(
+        *(gateway.download_closes(["SPY", "QQQ"], period="1y") for _ in range(5)),
+        gateway.download_closes(["SPY", "QQQ"], period="6mo")
+    )
+
+    assert results[0] == {"symbols": ["SPY", "QQQ"]}
+    assert len(provider.calls) == 2
+    assert gateway.merged == 4
+    assert gateway.stats()["inflight"] == 0
+
+
+async def test_failed_attempts_are_retried():
+    provider = FakeProvider(failures=1)
+    gateway = make_gateway(provider)
+
+    assert await gateway.download_closes(["SPY"], period="1y") == {"symbols": ["SPY"]}
+    assert len(provider.calls) == 2
+    assert gateway.retried == 1
+    assert gateway.breaker.failures == 0
+
+
+async def test_request_failing_all_retries_counts_as_one_breaker_failure():
+    provider = FakeProvider(failures=100)
+    gateway = make_gateway(provider, retries=2, threshold=3)
+
+    with pytest.raises(ConnectionError):
+        await gateway.download_closes(["SPY"], period="1y")
+
+    assert len(provider.calls) == 3
+    assert gateway.failed == 1
+    assert gateway.breaker.failures == 1
+    assert gateway.breaker.state == "closed"
+
+
+async def test_timeouts_are_not_retried():
+    provider = FakeProvider()
+    gateway = make_gateway(provider, timeout_after=0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await gateway.download_closes(["SPY"], period="1y")
+
+    assert gateway.requests == 1
+    assert gateway.retried == 0
+    assert gateway.breaker.failures == 1
+
+
+async def open_circuit(gateway, threshold):
+    for index in range(threshold):
+        with pytest.raises(ConnectionError):
+            await gateway.download_closes([f"S{index}"], period="1y")
+
+
+async def test_circuit_opens_after_threshold_and_fails_fast():
+    provider = FakeProvider(failures=100)
+    gateway = make_gateway(provider, retries=0, threshold=3)
+    await open_circuit(gateway, 3)
+    calls = len(provider.calls)
+
+    with pytest.raises(CircuitOpenError):
+        await gateway.download_closes(["SPY"], period="1y")
+
+    assert gateway.breaker.state == "open"
+    assert gateway.rejected == 1
+    assert len(provider.calls) == calls
+
+
+async def test_successful_half_open_trial_closes_the_circuit():
+    provider = FakeProvider(failures=3)
+    gateway = make_gateway(provider, retries=0, threshold=3, reset_seconds=0.05)
+    await open_circuit(gateway, 3)
+    await asyncio.sleep(0.06)
+
+    assert gateway.breaker.state == "half-open"
+    assert await gateway.download_closes(["SPY"], period="1y") == {"symbols": ["SPY"]}
+    assert gateway.breaker.state == "closed"
+    assert gateway.breaker.failures == 0
+
+
+async def test_failed_half_open_trial_reopens_the_circuit():
+    provider = FakeProvider(failures=100)
+    gateway = make_gateway(provider, retries=0, threshold=3, reset_seconds=0.05)
+    await open_circuit(gateway, 3)
+    await asyncio.sleep(0.06)
+
+    with pytest.raises(ConnectionError):
+        await gateway.download_closes(["SPY"], period="1y")
+
+    assert gateway.breaker.state == "open"
+
+
+async def test_only_one_half_open_trial_runs_at_a_time():
+    provider = FakeProvider(failures=3)
+    gateway = make_gateway(provider, delay=0.05, retries=0, threshold=3, reset_seconds=0.05)
+    await open_circuit(gateway, 3)
+    await asyncio.sleep(0.11)
+
+    trial = asyncio.create_task(gateway.download_closes(["SPY"], period="1y"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(CircuitOpenError):
+        await gateway.download_closes(["QQQ"], period="1y")
+    assert await trial == {"symbols": ["SPY"]}
+
+
+async def test_cancelled_half_open_trial_lets_the_next_request_through():
+    provider = FakeProvider(failures=3)
+    gateway = make_gateway(provider, delay=0.05, retries=0, threshold=3, reset_seconds=0.05)
+    await open_circuit(gateway, 3)
+    await asyncio.sleep(0.11)
+
+    trial = asyncio.create_task(gateway._request(lambda: provider.download_closes, ["SPY"], period="1y"))
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    assert await gateway.download_closes(["QQQ"], period="1y") == {"symbols": ["QQQ"]}
+    assert gateway.breaker.state == "closed"
+
+
+async def test_token_bucket_limits_the_request_rate():
+    bucket = TokenBucket(rate=20, burst=1)
+    start = time.monotonic()
+
+    for _ in range(3):
+        await bucket.acquire()
+
+    # The burst token is immediate, the next two wait 1/20 s each
+    assert time.monotonic() - start >= 0.09
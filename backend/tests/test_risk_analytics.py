@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from app.services.risk_analytics import (
+    breach_probability,
+    conditional_value_at_risk,
+    max_drawdowns,
+    sharpe_ratios,
+    tail_risk_analytics,
+    value_at_risk,
+)
+
+OUTCOMES = np.arange(1.0, 101.0)
+
+
+def test_value_at_risk_interpolates_the_lower_quantile():
+    # Linear interpolation at rank 0.05 * 99 = 4.95 between 5 and 6
+    assert value_at_risk(OUTCOMES, 0.95) == pytest.approx(5.95)
+    assert value_at_risk(OUTCOMES, 0.99) == pytest.approx(1.99)
+
+
+def test_conditional_value_at_risk_averages_the_tail():
+    assert conditional_value_at_risk(OUTCOMES, 0.95) == pytest.approx(3.0)  # mean of 1..5
+    assert conditional_value_at_risk(OUTCOMES, 0.99) == pytest.approx(1.0)
+
+
+def test_var_and_cvar_per_grid_cell():
+    values = np.stack([OUTCOMES, 10 * OUTCOMES], axis=1)
+
+    np.testing.assert_allclose(value_at_risk(values, 0.95), [5.95, 59.5])
+    np.testing.assert_allclose(conditional_value_at_risk(values, 0.95), [3.0, 30.0])
+
+
+def test_max_drawdown_from_the_running_peak():
+    series = np.array([
+        [100.0, 120.0, 90.0, 130.0, 65.0],  # 130 -> 65
+        [10.0, 20.0, 30.0, 40.0, 50.0],     # never declines
+        [-5.0, -10.0, -20.0, -1.0, -8.0],   # no positive peak
+    ])
+
+    np.testing.assert_allclose(max_drawdowns(series), [0.5, 0.0, 0.0])
+
+
+def test_breach_probability_counts_paths_below_the_floor():
+    ebitda = np.array([
+        [5.0, 3.0, 4.0],
+        [5.0, -1.0, 4.0],
+        [0.0, 1.0, 2.0],
+    ])
+
+    assert breach_probability(ebitda, 0.0) == pytest.approx(1 / 3)
+    assert breach_probability(ebitda, 3.5) == pytest.approx(1.0)
+    assert breach_probability(ebitda, -2.0) == 0.0
+
+
+def test_sharpe_ratio_of_monthly_changes():
+    series = np.array([
+        [100.0, 110.0, 99.0],   # +10%, -10%: mean 0, std 10%
+        [100.0, 110.0, 121.0],  # constant growth: no dispersion
+    ])
+
+    expected = (0 - 0.04) / (0.1 * np.sqrt(12))
+    np.testing.assert_allclose(sharpe_ratios(series, 0.04), [expected, 0.0])
+
+
+def test_tail_risk_analytics_on_horizon_totals():
+    ebitda = np.array([[1.0, 2.0], [3.0, -4.0], [5.0, 6.0], [7.0, 8.0]])  # totals 3, -1, 11, 15
+    paths = {"ebitda": ebitda, "cashFlow": 2 * ebitda}
+
+    report = tail_risk_analytics(paths, 0.04, covenant_ebitda_floor=0.0, levels=(0.5,))
+
+    assert report["horizon_totals"] == {"ebitda_median": 7.0, "cash_flow_median": 14.0}
+    assert report["ebitda_var_50"] == pytest.approx(7.0)
+    assert report["ebitda_cvar_50"] == pytest.approx(1.0)  # mean of -1 and 3
+    assert report["cash_flow_cvar_50"] == pytest.approx(2.0)
+    assert report["covenant_breach_probability"] == pytest.approx(0.25)
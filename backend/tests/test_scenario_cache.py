@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.market_data import SCENARIO_PARAMETER_CACHE_KEYS, market_data_service
+from app.services.monte_carlo import simulation_options
+from app.services.scenario_cache import scenario_cache, scenario_cache_key, scenario_cache_ttl
+
+
+@pytest.fixture
+def scenario_config(scenario_params):
+    return {"type": "base", "name": "Base Case", "params": scenario_params}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    scenario_cache.clear()
+    market_data_service.cache.clear()
+
+
+def key(scenario_config, market_context, base_revenue=2.5e6, **overrides):
+    return scenario_cache_key(scenario_config, base_revenue, market_context, simulation_options(**overrides))
+
+
+def test_identical_inputs_share_a_key(scenario_config, market_context):
+    assert key(scenario_config, market_context) == key(dict(scenario_config), dict(market_context))
+    assert key(scenario_config, market_context, seed=5) == key(scenario_config, market_context, seed=5)
+
+
+@pytest.mark.parametrize("overrides", [
+    {"seed": 1},
+    {"n_paths": 5000},
+    {"horizon_months": 24},
+    {"sampler": "sobol"},
+    {"volatility_model": "garch"},
+    {"covenant_ebitda_floor": 1e5},
+])
+def test_key_changes_with_seed_and_options(scenario_config, market_context, overrides):
+    assert key(scenario_config, market_context, **overrides) != key(scenario_config, market_context)
+
+
+def test_key_changes_with_the_market_snapshot(scenario_config, market_context):
+    baseline = key(scenario_config, market_context)
+
+    assert key(scenario_config, {**market_context, "market_volatility": 0.35}) != baseline
+    assert key(scenario_config, {**market_context, "regime": "BEAR"}) != baseline
+    assert key(scenario_config, {**market_context, "market_factors": {"exposure": [0.1, 0.05]}}) != baseline
+
+
+def test_key_changes_with_scenario_inputs(scenario_config, market_context):
+    baseline = key(scenario_config, market_context)
+    bull = {**scenario_config, "params": {**scenario_config["params"], "revenue_growth": 0.3}}
+
+    assert key(bull, market_context) != baseline
+    assert key({**scenario_config, "type": "optimistic"}, market_context) != baseline
+    assert key(scenario_config, market_context, base_revenue=1e6) != baseline
+
+
+async def test_entries_expire_after_their_ttl(scenario_config, market_context):
+    cache_key = key(scenario_config, market_context)
+    scenario_cache.set(cache_key, {"id": "scenario-base"}, ttl=0.05)
+    assert scenario_cache.get(cache_key) == {"id": "scenario-base"}
+
+    await asyncio.sleep(0.1)
+
+    assert scenario_cache.get(cache_key) is None
+    assert cache_key not in scenario_cache
+
+
+def test_ttl_follows_the_market_data_refresh():
+    assert scenario_cache_ttl() == settings.SCENARIO_CACHE_MIN_TTL_SECONDS
+
+    ttl = settings.SCENARIO_CACHE_MIN_TTL_SECONDS + 600
+    for cache_key in SCENARIO_PARAMETER_CACHE_KEYS:
+        market_data_service.cache.set(cache_key, 0.2, ttl=ttl)
+
+    assert scenario_cache_ttl() == pytest.approx(ttl, abs=1)
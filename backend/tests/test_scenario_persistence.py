@@ -0,0 +1,103 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401  (registers every table)
+from app.core.database import Base
+from app.models.financial import ModelProjection, ModelProjectionSeries, ModelScenario
+from app.models.organization import Organization
+from app.services.monte_carlo import PROJECTION_METRICS
+from app.services.scenario_persistence import load_projection_arrays, persist_scenarios
+
+START = date(2026, 1, 15)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Organization(id="org", name="Test Org"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def make_scenario(months, revenue=100.0, scenario_type="base"):
+    return {
+        "name": "Base Case",
+        "type": scenario_type,
+        "description": "test",
+        "revenueGrowth": 0.12,
+        "marginImprovement": 0.02,
+        "workingCapitalDays": 45,
+        "capexAsPercentRevenue": 0.035,
+        "projections": [
+            {metric: revenue + month for metric in PROJECTION_METRICS} for month in range(months)
+        ],
+        "bands": {"revenue": {"p5": [revenue - 10] * months, "p95": [revenue + 10] * months}},
+    }
+
+
+def projections(db, scenario_id):
+    return db.query(ModelProjection).filter(ModelProjection.scenario_id == scenario_id)\
+        .order_by(ModelProjection.date).all()
+
+
+def test_rows_are_dated_on_month_starts_after_start(db):
+    result = persist_scenarios(db, [make_scenario(3)], start=START)
+
+    scenario_id = result["scenario_ids"][0]
+    rows = projections(db, scenario_id)
+    assert scenario_id == "enhanced-org-base"
+    assert result["projections"] == 3
+    assert [row.date.date() for row in rows] == [date(2026, 2, 1), date(2026, 3, 1), date(2026, 4, 1)]
+    assert float(rows[0].revenue) == 100.0
+
+
+def test_repersisting_upserts_in_place(db):
+    persist_scenarios(db, [make_scenario(3)], start=START)
+    result = persist_scenarios(db, [make_scenario(3, revenue=200.0)], start=START)
+
+    rows = projections(db, result["scenario_ids"][0])
+    assert db.query(ModelScenario).count() == 1
+    assert len(rows) == 3
+    assert [float(row.revenue) for row in rows] == [200.0, 201.0, 202.0]
+
+
+def test_shorter_horizon_deletes_rows_beyond_it(db):
+    persist_scenarios(db, [make_scenario(6)], start=START)
+    result = persist_scenarios(db, [make_scenario(2)], start=START)
+
+    rows = projections(db, result["scenario_ids"][0])
+    assert [row.date.date() for row in rows] == [date(2026, 2, 1), date(2026, 3, 1)]
+
+
+def test_packed_storage_replaces_rows_with_one_series(db):
+    persist_scenarios(db, [make_scenario(3)], start=START)
+    result = persist_scenarios(db, [make_scenario(3)], start=START, storage="packed")
+
+    scenario_id = result["scenario_ids"][0]
+    arrays = load_projection_arrays(db, scenario_id)
+    assert projections(db, scenario_id) == []
+    assert db.query(ModelProjectionSeries).count() == 1
+    np.testing.assert_array_equal(arrays["revenue"], [100.0, 101.0, 102.0])
+    np.testing.assert_array_equal(arrays["bands"]["revenue"]["p95"], [110.0] * 3)
+    assert str(arrays["dates"][0]) == "2026-02"
+
+
+def test_switching_back_to_rows_removes_the_packed_series(db):
+    persist_scenarios(db, [make_scenario(3)], start=START, storage="packed")
+    result = persist_scenarios(db, [make_scenario(3)], start=START)
+
+    assert db.query(ModelProjectionSeries).count() == 0
+    assert len(projections(db, result["scenario_ids"][0])) == 3
+
+
+def test_unknown_storage_layout_is_rejected(db):
+    with pytest.raises(ValueError):
+        persist_scenarios(db, [make_scenario(1)], start=START, storage="columns")
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from app.services.monte_carlo import simulation_options
+from app.services.scenario_sessions import STAGE_ORDER, ScenarioSession
+
+
+@pytest.fixture
+def session(scenario_params, market_context):
+    options = simulation_options(n_paths=500, horizon_months=12)
+    config = {"type": "base", "name": "Base Case", "params": scenario_params}
+    return ScenarioSession(config, 2.5e6, market_context, options, np.random.SeedSequence(1))
+
+
+def test_margin_change_recomputes_only_the_financials(session):
+    revenue_state = session.revenue_state
+    volatility_shock = session.volatility_shock
+    ebitda = session.paths["ebitda"]
+
+    stages = session.update({"margin_improvement": 0.1})
+
+    assert stages == ["financials"]
+    assert list(session.last_timings) == ["financials"]
+    assert session.revenue_state is revenue_state
+    assert session.volatility_shock is volatility_shock
+    assert np.all(session.paths["ebitda"] >= ebitda)
+    assert not np.array_equal(session.paths["ebitda"], ebitda)
+
+
+def test_incremental_update_matches_a_full_recompute(session):
+    session.update({"margin_improvement": 0.1})
+    incremental = {metric: values.copy() for metric, values in session.paths.items()}
+
+    assert session.recompute(STAGE_ORDER[0]) == list(STAGE_ORDER)
+
+    for metric, values in incremental.items():
+        np.testing.assert_array_equal(values, session.paths[metric])
+
+
+@pytest.mark.parametrize("changes, stages", [
+    ({"revenue_growth": 0.3}, ["revenue", "financials"]),
+    ({"volatility_factor": 0.4}, list(STAGE_ORDER)),
+    ({"revenue_growth": 0.15}, []),
+])
+def test_updates_rerun_the_stages_downstream_of_the_change(session, changes, stages):
+    assert session.update(changes) == stages
+
+
+def test_unsupported_parameters_are_rejected(session):
+    with pytest.raises(ValueError, match="base_revenue"):
+        session.update({"base_revenue": 1.0})
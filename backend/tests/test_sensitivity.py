@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from app.services.monte_carlo import simulate_paths, simulation_options
+from app.services.sensitivity import MAX_GRID_CELLS, evaluate_sensitivity_grid, validate_grid
+
+METRICS = ("terminal_revenue", "average_ebitda_margin", "sharpe_ratio", "max_drawdown")
+
+
+@pytest.fixture
+def options():
+    return simulation_options(n_paths=400, horizon_months=24)
+
+
+def test_metric_matrices_have_the_shape_of_the_axes(scenario_params, market_context, options):
+    grid = {"revenue_growth": [0.05, 0.1, 0.2], "margin_improvement": [0.0, 0.05]}
+
+    result = evaluate_sensitivity_grid(
+        scenario_params, grid, market_context, 2.5e6, options, np.random.SeedSequence(1)
+    )
+
+    assert [axis["parameter"] for axis in result["axes"]] == list(grid)
+    assert result["simulation"]["cells"] == 6
+    for metric in METRICS:
+        assert np.asarray(result["metrics"][metric]).shape == (3, 2)
+
+
+def test_metric_matrices_stay_whole_across_passes(scenario_params, market_context):
+    # 20,000 paths leave room for two cells per pass, so five cells need three passes
+    options = simulation_options(n_paths=20000, horizon_months=12)
+    grid = {"volatility_factor": [0.1, 0.2, 0.3, 0.4, 0.5]}
+
+    result = evaluate_sensitivity_grid(
+        scenario_params, grid, market_context, 2.5e6, options, np.random.SeedSequence(2)
+    )
+
+    assert np.all(np.isfinite(result["metrics"]["terminal_revenue"]))
+
+
+def test_single_cell_matches_simulate_paths_on_the_same_draws(scenario_params, market_context, options):
+    seed_sequence = np.random.SeedSequence(3)
+
+    result = evaluate_sensitivity_grid(
+        scenario_params, {"revenue_growth": [0.25]}, market_context, 2.5e6, options, seed_sequence
+    )
+    paths = simulate_paths(
+        {**scenario_params, "revenue_growth": 0.25}, market_context, 2.5e6, options,
+        np.random.default_rng(seed_sequence)
+    )
+
+    assert result["metrics"]["terminal_revenue"][0] == pytest.approx(np.median(paths["revenue"][:, -1]))
+    assert result["metrics"]["average_ebitda_margin"][0] == pytest.approx(paths["ebitdaMargin"].mean())
+
+
+@pytest.mark.parametrize("grid", [
+    {},
+    {"base_revenue": [1.0]},
+    {"revenue_growth": []},
+    {"revenue_growth": list(range(MAX_GRID_CELLS)), "volatility_factor": [0.1, 0.2]},
+])
+def test_invalid_grids_are_rejected(grid):
+    with pytest.raises(ValueError):
+        validate_grid(grid)
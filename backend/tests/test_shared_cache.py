@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import market_data
+from app.services.market_data import SHARED_VALUE_VERSION, MarketDataService
+from app.services.shared_cache import SQLiteSharedCache, decode_value, encode_value
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two processes' views of one shared SQLite tier"""
+    path = tmp_path / "market_cache.db"
+    return SQLiteSharedCache(str(path)), SQLiteSharedCache(str(path))
+
+
+@pytest.fixture
+def shared(workers, monkeypatch):
+    """This worker's tier, as MarketDataService sees it"""
+    monkeypatch.setattr(market_data, "get_shared_cache", lambda: workers[0])
+    return workers[0]
+
+
+def shared_key(key):
+    return f"{key}@v{SHARED_VALUE_VERSION}"
+
+
+def counting_loader(value, ttl):
+    calls = []
+
+    async def loader():
+        calls.append(value)
+        return value, ttl
+
+    return loader, calls
+
+
+def test_frames_and_reports_round_trip():
+    frame = pd.DataFrame(
+        np.arange(6.0).reshape(3, 2), index=pd.date_range("2026-01-01", periods=3), columns=["SPY", "QQQ"]
+    )
+    matrix = pd.DataFrame(np.eye(2), index=["SPY", "QQQ"], columns=["SPY", "QQQ"])
+    report = {"value": matrix, "fallbacks": {"IWM": "insufficient_data"}}
+
+    decoded_frame = decode_value(encode_value(frame))
+    # Decoded indexes are nanosecond resolution whatever the source unit
+    assert decoded_frame.index.equals(frame.index)
+    pd.testing.assert_frame_equal(decoded_frame, frame, check_freq=False, check_index_type=False)
+    decoded = decode_value(encode_value(report))
+    pd.testing.assert_frame_equal(decoded["value"], matrix)
+    assert decoded["fallbacks"] == report["fallbacks"]
+    assert decode_value(encode_value({"SPY": 0.2})) == {"SPY": 0.2}
+
+
+def test_lease_is_exclusive_until_released_or_expired(workers):
+    first, second = workers
+
+    assert first.acquire_lease("key", 30)
+    assert not second.acquire_lease("key", 30)
+    assert second.lease_held("key")
+    first.release_lease("key")
+    assert not first.lease_held("key")
+    assert second.acquire_lease("key", 0.01)
+    time.sleep(0.02)
+    assert first.acquire_lease("key", 30)
+
+
+def test_expired_values_are_misses(workers):
+    first, _ = workers
+    first.set_bytes("key", b"J1", 0.01)
+    time.sleep(0.02)
+
+    assert first.get_bytes("key") is None
+
+
+async def test_wait_for_returns_a_value_published_by_the_lease_holder(workers):
+    waiter, holder = workers
+    holder.acquire_lease("key", 30)
+
+    async def publish():
+        await asyncio.sleep(0.2)
+        await holder.set("key", {"SPY": 0.2}, 60)
+        await holder.release("key")
+
+    asyncio.create_task(publish())
+    value, ttl = await waiter.wait_for("key", min_fresh=0)
+
+    assert value == {"SPY": 0.2}
+    assert ttl > 0
+
+
+async def test_wait_for_stops_once_the_lease_is_released_without_a_value(workers):
+    waiter, holder = workers
+    holder.acquire_lease("key", 30)
+
+    async def give_up():
+        await asyncio.sleep(0.2)
+        await holder.release("key")
+
+    asyncio.create_task(give_up())
+    start = time.monotonic()
+
+    assert await waiter.wait_for("key", min_fresh=0) is None
+    assert time.monotonic() - start < 2
+
+
+async def test_loaded_value_is_published_for_other_workers(shared, workers):
+    loader, calls = counting_loader({"SPY": 0.2}, 60)
+
+    assert await MarketDataService()._shared("key", loader)() == ({"SPY": 0.2}, 60)
+    value, ttl = await workers[1].get(shared_key("key"))
+    assert value == {"SPY": 0.2}
+    assert 0 < ttl <= 60
+    assert not workers[1].lease_held(shared_key("key"))
+
+
+async def test_fresh_shared_value_is_adopted_without_loading(shared, workers):
+    await workers[1].set(shared_key("key"), {"SPY": 0.3}, 60)
+    loader, calls = counting_loader({"SPY": 0.2}, 60)
+
+    value, ttl = await MarketDataService()._shared("key", loader)()
+
+    assert value == {"SPY": 0.3}
+    assert calls == []
+
+
+async def test_fallback_is_shared_briefly_but_not_as_a_value(shared, workers):
+    leader_loader, _ = counting_loader({"SPY": 0.2}, 0)
+    await MarketDataService()._shared("key", leader_loader)()
+
+    assert await workers[1].get(shared_key("key")) is None
+    follower_loader, calls = counting_loader({"SPY": 0.25}, 0)
+    assert await MarketDataService()._shared("key", follower_loader)() == ({"SPY": 0.2}, 0)
+    assert calls == []
+
+
+async def test_follower_adopts_fallback_published_while_it_waits(shared, workers):
+    holder = workers[1]
+    holder.acquire_lease(shared_key("key"), 30)
+
+    async def fail_upstream():
+        await asyncio.sleep(0.2)
+        await holder.set(f"{shared_key('key')}:fallback", {"SPY": 0.2}, 15)
+        await holder.release(shared_key("key"))
+
+    asyncio.create_task(fail_upstream())
+    loader, calls = counting_loader({"SPY": 0.25}, 0)
+    start = time.monotonic()
+
+    assert await MarketDataService()._shared("key", loader)() == ({"SPY": 0.2}, 0)
+    assert calls == []
+    assert time.monotonic() - start < 2
+
+
+async def test_follower_loads_itself_when_lease_is_released_empty(shared, workers):
+    holder = workers[1]
+    holder.acquire_lease(shared_key("key"), 30)
+
+    async def crash():
+        await asyncio.sleep(0.2)
+        await holder.release(shared_key("key"))
+
+    asyncio.create_task(crash())
+    loader, calls = counting_loader({"SPY": 0.2}, 60)
+    start = time.monotonic()
+
+    assert await MarketDataService()._shared("key", loader)() == ({"SPY": 0.2}, 60)
+    assert len(calls) == 1
+    assert time.monotonic() - start < 2
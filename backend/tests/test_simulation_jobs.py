@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from app.services.simulation_jobs import (
+    CANCELLED,
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    JobQueueFullError,
+    SimulationJobQueue,
+)
+
+
+@pytest.fixture
+def queue():
+    return SimulationJobQueue(max_running=1, max_pending=3, retention_seconds=60)
+
+
+def blocking_body(release: asyncio.Event, result="done"):
+    """Job body that reports halfway progress and finishes once released"""
+    async def body(job):
+        job.report_progress(0.5, "Halfway")
+        await release.wait()
+        return result
+
+    return body
+
+
+async def settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_job_runs_to_success_with_its_result(queue):
+    release = asyncio.Event()
+    job = queue.submit("scenarios", {"paths": 100}, blocking_body(release, {"scenarios": 3}))
+    assert job.status == QUEUED
+
+    await settle()
+    assert job.status == RUNNING
+    assert (job.progress, job.message) == (50.0, "Halfway")
+
+    release.set()
+    await job.task
+
+    assert job.status == SUCCEEDED
+    assert job.result == {"scenarios": 3}
+    assert job.progress == 100.0
+    assert job.summary()["expires_in_seconds"] == pytest.approx(60, abs=1)
+
+
+async def test_jobs_beyond_max_running_wait_for_a_slot(queue):
+    release = asyncio.Event()
+    first = queue.submit("scenarios", {}, blocking_body(release))
+    second = queue.submit("scenarios", {}, blocking_body(release))
+
+    await settle()
+    assert (first.status, second.status) == (RUNNING, QUEUED)
+
+    release.set()
+    await asyncio.gather(first.task, second.task)
+    assert (first.status, second.status) == (SUCCEEDED, SUCCEEDED)
+
+
+async def test_full_queue_rejects_new_jobs(queue):
+    release = asyncio.Event()
+    for _ in range(3):
+        queue.submit("scenarios", {}, blocking_body(release))
+
+    with pytest.raises(JobQueueFullError):
+        queue.submit("scenarios", {}, blocking_body(release))
+
+    release.set()
+    await queue.shutdown()
+
+
+async def test_cancelling_a_running_job(queue):
+    job = queue.submit("scenarios", {}, blocking_body(asyncio.Event()))
+    await settle()
+
+    cancelled = await queue.cancel(job.id)
+
+    assert cancelled is job
+    assert job.status == CANCELLED
+    assert job.result is None
+    assert queue.get(job.id) is job
+
+
+async def test_cancelling_before_the_task_starts_still_finishes_the_job(queue):
+    job = queue.submit("scenarios", {}, blocking_body(asyncio.Event()))
+
+    await queue.cancel(job.id)
+
+    assert job.status == CANCELLED
+    assert job.summary()["expires_in_seconds"] is not None
+
+
+async def test_failing_body_marks_the_job_failed(queue):
+    async def body(job):
+        raise ValueError("bad grid")
+
+    job = queue.submit("sensitivity_grid", {}, body)
+    await job.task
+
+    assert job.status == FAILED
+    assert job.error == "bad grid"
+
+
+async def test_finished_jobs_expire_after_retention():
+    queue = SimulationJobQueue(max_running=1, max_pending=1, retention_seconds=0.05)
+    job = queue.submit("scenarios", {}, blocking_body(asyncio.Event()))
+    await settle()
+    await queue.cancel(job.id)
+    assert queue.get(job.id) is job
+
+    await asyncio.sleep(0.1)
+
+    assert queue.get(job.id) is None
+    assert queue.list() == []
+    # Expired jobs no longer count against max_pending
+    queue.submit("scenarios", {}, blocking_body(asyncio.Event()))
+    await queue.shutdown()